@@ -7,9 +7,25 @@
 # screen-share) than one opaque single-file blob.
 
 import os
+import sys
 
 block_cipher = None
 REPO_ROOT = os.path.abspath(os.path.join(SPECPATH, ".."))
+STATIC_CSV = os.path.join(REPO_ROOT, "project", "data", "cleaned_data.csv")
+
+# The bundle may be read-only, so ship the static pool's binary snapshot
+# pre-built rather than leaving load_static_fallback to build it on first
+# launch. Built into PyInstaller's work dir from the CSV being bundled, so a
+# fresh clone needs no extra step and the source tree isn't touched.
+sys.path.insert(0, REPO_ROOT)
+from project.data.snapshot import file_fingerprint, write_snapshot  # noqa: E402
+
+import pandas as pd  # noqa: E402
+
+STATIC_SNAPSHOT = os.path.join(workpath, "cleaned_data.ffpool")
+os.makedirs(workpath, exist_ok=True)
+with open(STATIC_SNAPSHOT, "wb") as f:
+    write_snapshot(pd.read_csv(STATIC_CSV), f, meta=file_fingerprint(STATIC_CSV))
 
 a = Analysis(
     [os.path.join(REPO_ROOT, "packaging", "launcher.py")],
@@ -17,7 +33,8 @@ a = Analysis(
     binaries=[],
     datas=[
         (os.path.join(REPO_ROOT, "project", "webapp", "static"), os.path.join("project", "webapp", "static")),
-        (os.path.join(REPO_ROOT, "project", "data", "cleaned_data.csv"), os.path.join("project", "data")),
+        (STATIC_CSV, os.path.join("project", "data")),
+        (STATIC_SNAPSHOT, os.path.join("project", "data")),
     ],
     hiddenimports=[
         # uvicorn lazy-imports its backends; PyInstaller's static analysis
@@ -27,6 +44,8 @@ a = Analysis(
         "uvicorn.protocols.http.auto",
         "uvicorn.protocols.websockets.auto",
         "uvicorn.lifespan.on",
+        # Imported lazily by project.webapp.boot's warm-up stage.
+        "project.webapp.server",
     ],
     hookspath=[],
     runtime_hooks=[],
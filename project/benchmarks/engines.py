@@ -0,0 +1,315 @@
+"""Micro/macro benchmarks for the draft engines, with JSON baselines.
+
+conftest's sample pool is 33 players and the real one about 400, so none of
+the engine hot paths had ever been timed at deep-league (2,000) or
+dynasty/IDP (10,000) pool sizes, or for leagues beyond 12 teams. This suite
+times, on deterministic synthetic pools:
+
+    greedy_top_candidates   GreedyDraftAssistant.get_top_candidates
+    roster_value            compute_roster_value on a full roster
+    make_move               GameState.make_move from an opening board
+    mcts_search             MCTS with a fixed playout budget (max_iterations),
+                            reported as playouts/sec as well as time
+    parallel_merge          merge_visit_counts across worker trees
+    playoff_odds            playoff_odds_calculator.monte_carlo_odds
+
+over pool sizes 400 / 2,000 / 10,000 and league sizes 8-32 (a league whose
+draft would exhaust the pool is skipped). Each case runs `repeat` rounds of
+an auto-sized number of calls and keeps the per-call median and minimum.
+
+Results are JSON: {"meta": {...machine/library versions...}, "results":
+{case_id: {...}}}. `--save` writes one; `--baseline` compares a run against
+one and exits non-zero if any case's median got more than `--tolerance`
+slower, so an optimization is measured rather than guessed. Baselines are
+only comparable on the same machine (`meta` records which one), so none is
+checked in: save one locally before the change you want to measure, under
+baselines/ (git-ignored). A case that couldn't run (playoff_odds without
+tqdm) is recorded as skipped and reported as such by the comparison, rather
+than silently never being checked.
+
+    python -m project.benchmarks.engines --quick --save project/benchmarks/baselines/quick.json
+    python -m project.benchmarks.engines --quick --baseline project/benchmarks/baselines/quick.json
+    python -m project.benchmarks.engines --only greedy --only mcts
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from project.data.live_rankings import with_player_ids
+from project.draft.config import LeagueConfig
+from project.draft.greedy import GreedyDraftAssistant
+from project.draft.mcts import MCTS, GameState
+from project.draft.mcts_parallel import merge_visit_counts
+from project.draft.scoring import compute_roster_value
+
+POOL_SIZES = (400, 2_000, 10_000)
+LEAGUE_SIZES = (8, 12, 16, 32)
+QUICK_POOL_SIZES = (400, 2_000)
+QUICK_LEAGUE_SIZES = (8, 12)
+DEFAULT_TOLERANCE = 0.15
+
+# Rough share of a ranking export by position, and each position's top
+# projection and per-rank decay.
+POSITION_MIX = {"QB": 0.12, "RB": 0.26, "WR": 0.32, "TE": 0.14, "K": 0.08, "DST": 0.08}
+POSITION_CURVE = {"QB": (380, 0.93), "RB": (340, 0.96), "WR": (320, 0.97), "TE": (260, 0.94), "K": (150, 0.97), "DST": (140, 0.96)}
+TEAMS = (
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+    "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WSH",
+)
+
+
+def synthetic_pool(size, seed=0):
+    """A deterministic `size`-row pool in the player-pool data contract,
+    ranked by Total_FPTS, with the usual positional mix and point curves."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for pos, share in POSITION_MIX.items():
+        count = max(1, round(size * share))
+        top, decay = POSITION_CURVE[pos]
+        points = top * decay ** (np.arange(count) / max(1, count / 60)) * rng.uniform(0.95, 1.05, count)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Total_FPTS": points.round(1),
+                    "Player": [f"{pos} Player{i + 1}" for i in range(count)],
+                    "Team": rng.choice(TEAMS, count),
+                    "Position": pos,
+                }
+            )
+        )
+    df = pd.concat(frames).sort_values("Total_FPTS", ascending=False).head(size).reset_index(drop=True)
+    df.insert(0, "Rank", np.arange(1, len(df) + 1))
+    df.insert(2, "Average_FPTS", (df["Total_FPTS"] / 17).round(1))
+    return with_player_ids(df)
+
+
+def _fits(pool_size, num_teams):
+    return num_teams * LeagueConfig(num_teams=num_teams).num_rounds <= pool_size
+
+
+def _roster(pool, config):
+    """A plausible full roster: the top few players at every position."""
+    drafted = pool.groupby("Position").head(3).head(config.total_roster_size())
+    return [row for _, row in drafted.iterrows()]
+
+
+def _opening_state(pool, config):
+    return GameState(pool, config, initial_pick=1)
+
+
+def case_greedy(pool, config):
+    assistant = GreedyDraftAssistant(pool, config)
+    return lambda: assistant.get_top_candidates(pool, 1, n=5, explain=True)
+
+
+def case_roster_value(pool, config):
+    roster = _roster(pool, config)
+    return lambda: compute_roster_value(roster, config)
+
+
+def case_make_move(pool, config):
+    state = _opening_state(pool, config)
+    action = int(pool["player_id"].iloc[0])
+    return lambda: state.make_move(action)
+
+
+# A playout simulates the whole remaining draft, so even a handful is
+# seconds of work at realistic league sizes.
+MCTS_ITERATIONS = 4
+
+
+def case_mcts(pool, config):
+    state = _opening_state(pool, config)
+
+    def search():
+        random.seed(0)
+        MCTS().search_and_return_root(state, time_limit=float("inf"), max_iterations=MCTS_ITERATIONS)
+
+    return search
+
+
+def case_parallel_merge(num_workers, num_actions):
+    rng = random.Random(0)
+    trees = [{action: rng.randint(1, 500) for action in range(num_actions)} for _ in range(num_workers)]
+    return lambda: merge_visit_counts(trees)
+
+
+def case_playoff_odds(num_teams, n_sim):
+    # tqdm (the calculator's progress bar) isn't a dependency of the draft
+    # app, so this case is skipped when it isn't installed.
+    from project.playoff_odds_calculator.playoff_odds_calculator import monte_carlo_odds
+
+    teams = [f"T{i}" for i in range(num_teams)]
+    wins = {team: i % 7 for i, team in enumerate(teams)}
+    tie_break = {team: -i for i, team in enumerate(teams)}
+    games = [(teams[i], teams[(i + week + 1) % num_teams]) for week in range(4) for i in range(0, num_teams, 2)]
+
+    def run():
+        random.seed(0)
+        monte_carlo_odds(teams, wins, games, tie_break, n_sim=n_sim)
+
+    return run
+
+
+def iter_cases(pool_sizes, league_sizes):
+    """Yield (case_id, group, build) for every benchmark case; build()
+    returns the zero-argument callable to time."""
+    pools = {}
+
+    def pool_for(size):
+        if size not in pools:
+            pools[size] = synthetic_pool(size)
+        return pools[size]
+
+    for size in pool_sizes:
+        for teams in league_sizes:
+            if not _fits(size, teams):
+                continue
+            config = LeagueConfig(num_teams=teams)
+            suffix = f"pool={size},teams={teams}"
+            yield f"greedy_top_candidates[{suffix}]", "greedy", lambda s=size, c=config: case_greedy(pool_for(s), c)
+            yield f"make_move[{suffix}]", "make_move", lambda s=size, c=config: case_make_move(pool_for(s), c)
+            yield f"mcts_search[{suffix}]", "mcts", lambda s=size, c=config: case_mcts(pool_for(s), c)
+
+    smallest = min(pool_sizes)
+    yield "roster_value", "roster_value", lambda: case_roster_value(pool_for(smallest), LeagueConfig())
+    for workers in (4, 16):
+        yield f"parallel_merge[workers={workers}]", "parallel_merge", lambda w=workers: case_parallel_merge(w, 30)
+    for teams in (10, 12):
+        yield f"playoff_odds[teams={teams}]", "playoff_odds", lambda t=teams: case_playoff_odds(t, 2_000)
+
+
+def time_callable(func, repeat=5, min_round_seconds=0.2):
+    """Per-call (median, min) seconds over `repeat` rounds, each running
+    enough calls to last about `min_round_seconds`. Calls that alone take
+    longer than a round get at most three single-call rounds."""
+    started = time.perf_counter()
+    func()
+    single = time.perf_counter() - started
+    number = max(1, int(min_round_seconds / single)) if single > 0 else 1000
+    if single >= min_round_seconds:
+        repeat = min(repeat, 3)
+    per_call = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        per_call.append((time.perf_counter() - started) / number)
+    return statistics.median(per_call), min(per_call), number
+
+
+def _log(line):
+    print(line, flush=True)
+
+
+def run_benchmarks(pool_sizes=POOL_SIZES, league_sizes=LEAGUE_SIZES, only=None, repeat=5, min_round_seconds=0.2, log=_log):
+    results = {}
+    for case_id, group, build in iter_cases(pool_sizes, league_sizes):
+        if only and group not in only:
+            continue
+        try:
+            func = build()
+        except ImportError as exc:
+            log(f"skip  {case_id}: {exc}")
+            results[case_id] = {"skipped": str(exc)}
+            continue
+        median, best, number = time_callable(func, repeat, min_round_seconds)
+        result = {"median_s": median, "min_s": best, "calls_per_round": number, "ops_per_s": 1 / median}
+        if group == "mcts":
+            result["playouts_per_s"] = MCTS_ITERATIONS / median
+        results[case_id] = result
+        log(f"{case_id:<48}{median * 1000:>12.3f} ms")
+    return results
+
+
+def machine_meta():
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Per-case comparison against a baseline's results. Returns a list of
+    (case_id, baseline_s, current_s, ratio, status) with status one of
+    "regressed", "improved", "ok", or "skipped" (with None timings) when
+    either side couldn't run the case; cases missing from either side are
+    left out."""
+    rows = []
+    for case_id, current in results.items():
+        previous = baseline.get(case_id)
+        if previous is None:
+            continue
+        if "skipped" in current or "skipped" in previous:
+            rows.append((case_id, previous.get("median_s"), current.get("median_s"), None, "skipped"))
+            continue
+        ratio = current["median_s"] / previous["median_s"]
+        if ratio > 1 + tolerance:
+            status = "regressed"
+        elif ratio < 1 / (1 + tolerance):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append((case_id, previous["median_s"], current["median_s"], ratio, status))
+    return rows
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the draft engines on synthetic pools.")
+    parser.add_argument("--quick", action="store_true", help="Pools 400/2,000 and 8/12-team leagues only")
+    parser.add_argument("--only", action="append", help="Run one group (greedy, make_move, mcts, roster_value, ...)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-round-seconds", type=float, default=0.2)
+    parser.add_argument("--save", help="Write results as a JSON baseline to this path")
+    parser.add_argument("--baseline", help="Compare against this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown (0.15 = 15%%)")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    pool_sizes, league_sizes = (QUICK_POOL_SIZES, QUICK_LEAGUE_SIZES) if args.quick else (POOL_SIZES, LEAGUE_SIZES)
+    results = run_benchmarks(pool_sizes, league_sizes, args.only, args.repeat, args.min_round_seconds)
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": machine_meta(), "results": results}, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline["results"], args.tolerance)
+    print(f"\nvs {args.baseline} ({baseline['meta'].get('platform')}, {baseline['meta'].get('created')})")
+    for case_id, before, after, ratio, status in rows:
+        if status == "skipped":
+            print(f"{case_id:<48}{'':>27}  skipped (not compared)")
+            continue
+        print(f"{case_id:<48}{before * 1000:>10.3f} -> {after * 1000:>10.3f} ms  x{ratio:.2f}  {status}")
+    skipped = [row for row in rows if row[4] == "skipped"]
+    if skipped:
+        print(f"{len(skipped)} case(s) skipped on one side and not compared")
+    regressions = [row for row in rows if row[4] == "regressed"]
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Concurrent-draft load test for the webapp API.
+
+test_webapp_api.py checks one user's correctness; this shows how the server
+behaves when many drafts run at once. N simulated drafters each drive a
+full draft through the real HTTP API:
+
+- create a session (its own cookie jar, so drafts stay isolated);
+- for every pick: read /api/state/delta, ask /api/recommend/greedy, and
+  draft one of the top three candidates via /api/pick?since=...;
+- on every `mcts_every`-th of their own picks, also ask
+  /api/recommend/mcts (with a short per-session search budget);
+- sleep an exponentially distributed "think time" (mean `pace` seconds)
+  between picks, so requests interleave the way real drafts do rather
+  than in lockstep.
+
+By default the app runs in-process behind httpx's ASGI transport -- no
+sockets, and sync routes still dispatch to Starlette's threadpool exactly
+as under uvicorn. `--url` points the same drafters at a running server
+instead (e.g. `uvicorn project.webapp.server:app`).
+
+The report has p50/p95/p99/max latency, request count and errors per route
+template, overall throughput, and peak RSS of this process plus its
+children (the MCTS worker processes); with --url the server's RSS isn't
+visible from here, only the client's. `--json` writes the same report for
+tooling, and `--max-p95-ms` / `--max-error-rate` turn the run into a gate
+that exits non-zero when a threshold is crossed.
+
+    python -m project.benchmarks.load_test --drafters 50 --picks 40 --pace 0.05
+    python -m project.benchmarks.load_test --url http://127.0.0.1:8000 --json load.json --max-p95-ms 250
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import sys
+import time
+from dataclasses import dataclass
+
+import httpx
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+# MCTS requests block for their whole search budget by design, so they're
+# reported but excluded from the --max-p95-ms gate.
+UNGATED_ROUTES = ("POST /api/recommend/mcts",)
+
+
+@dataclass
+class LoadTestConfig:
+    drafters: int = 20
+    picks: int = 30  # picks per draft (capped at the draft's length)
+    pace: float = 0.05  # mean think time between picks, seconds
+    mcts_every: int = 4  # 0 disables MCTS requests
+    mcts_time_limit: float = 0.5
+    num_teams: int = 10
+    source: str = "static"
+    url: str = None
+    seed: int = 0
+
+
+class RequestLog:
+    def __init__(self):
+        self.latencies = {}  # "METHOD route" -> [seconds]
+        self.errors = {}  # "METHOD route" -> count
+
+    async def call(self, client, method, route, path=None, **kwargs):
+        started = time.perf_counter()
+        try:
+            resp = await client.request(method, path or route, **kwargs)
+        except httpx.HTTPError:
+            resp = None
+        key = f"{method} {route}"
+        self.latencies.setdefault(key, []).append(time.perf_counter() - started)
+        if resp is None or resp.status_code >= 400:
+            self.errors[key] = self.errors.get(key, 0) + 1
+            return None
+        return resp.json()
+
+
+async def run_drafter(client, config, log, rng):
+    body = {
+        "num_teams": config.num_teams,
+        "initial_pick": rng.randint(1, config.num_teams),
+        "source": config.source,
+        "mcts_time_limit": config.mcts_time_limit,
+    }
+    state = await log.call(client, "POST", "/api/session", json=body)
+    if state is None:
+        return
+    version = state["state_version"]
+    own_picks = 0
+
+    for _ in range(config.picks):
+        await asyncio.sleep(rng.expovariate(1 / config.pace) if config.pace > 0 else 0)
+        delta = await log.call(client, "GET", "/api/state/delta", f"/api/state/delta?since={version}")
+        if delta is None:
+            return
+        summary = delta.get("summary") or delta["full"]
+        if summary["draft_complete"]:
+            return
+
+        if summary["is_our_pick"]:
+            own_picks += 1
+            if config.mcts_every and own_picks % config.mcts_every == 0:
+                await log.call(client, "POST", "/api/recommend/mcts")
+
+        greedy = await log.call(client, "GET", "/api/recommend/greedy", "/api/recommend/greedy?n=5")
+        if not greedy or not greedy["candidates"]:
+            return
+        choice = rng.choice(greedy["candidates"][:3])
+        result = await log.call(
+            client, "POST", "/api/pick", f"/api/pick?since={delta['version']}", json={"player_id": choice["player_id"]}
+        )
+        if result is None:
+            return
+        version = result["next"]["version"]
+
+    await log.call(client, "DELETE", "/api/session")
+
+
+def _peak_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return round(own / 2**20, 1), round(children / 2**20, 1)
+
+
+def summarize(log, elapsed):
+    routes = {}
+    total = 0
+    for route, latencies in sorted(log.latencies.items()):
+        ms = np.asarray(latencies) * 1000
+        stats = {f"p{p}_ms": round(float(np.percentile(ms, p)), 2) for p in PERCENTILES}
+        stats["max_ms"] = round(float(ms.max()), 2)
+        stats["requests"] = len(latencies)
+        stats["errors"] = log.errors.get(route, 0)
+        routes[route] = stats
+        total += len(latencies)
+    errors = sum(log.errors.values())
+    rss_self, rss_children = _peak_rss_mb()
+    return {
+        "routes": routes,
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "peak_rss_mb": rss_self,
+        "peak_child_rss_mb": rss_children,
+    }
+
+
+async def run_load_test(config):
+    """Run every drafter to completion; returns the summary dict."""
+    if config.url:
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=config.drafters))
+        base_url = config.url
+    else:
+        from project.webapp.server import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://loadtest"
+
+    master = random.Random(config.seed)
+    log = RequestLog()
+    clients = [httpx.AsyncClient(transport=transport, base_url=base_url, timeout=120) for _ in range(config.drafters)]
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(run_drafter(client, config, log, random.Random(master.random())) for client in clients)
+        )
+    finally:
+        elapsed = time.perf_counter() - started
+        for client in clients:
+            await client.aclose()
+    return summarize(log, elapsed)
+
+
+def check_thresholds(report, max_p95_ms=None, max_error_rate=None):
+    """Human-readable threshold violations (empty when the run passes)."""
+    failures = []
+    if max_p95_ms is not None:
+        for route, stats in report["routes"].items():
+            if route not in UNGATED_ROUTES and stats["p95_ms"] > max_p95_ms:
+                failures.append(f"{route}: p95 {stats['p95_ms']}ms > {max_p95_ms}ms")
+    if max_error_rate is not None and report["error_rate"] > max_error_rate:
+        failures.append(f"error rate {report['error_rate']} > {max_error_rate}")
+    return failures
+
+
+def format_report(report):
+    lines = [f"{'route':<34}{'reqs':>7}{'errs':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)"]
+    for route, stats in report["routes"].items():
+        lines.append(
+            f"{route:<34}{stats['requests']:>7}{stats['errors']:>6}"
+            f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}{stats['max_ms']:>9.1f}"
+        )
+    lines.append(
+        f"{report['requests']} requests in {report['elapsed_s']}s ({report['throughput_rps']} req/s), "
+        f"{report['errors']} errors; peak RSS {report['peak_rss_mb']} MB (+{report['peak_child_rss_mb']} MB children)"
+    )
+    return "\n".join(lines)
+
+
+def _parse_args():
+    defaults = LoadTestConfig()
+    parser = argparse.ArgumentParser(description="Drive many concurrent simulated drafts through the webapp API.")
+    parser.add_argument("--drafters", type=int, default=defaults.drafters)
+    parser.add_argument("--picks", type=int, default=defaults.picks, help="Picks per draft")
+    parser.add_argument("--pace", type=float, default=defaults.pace, help="Mean seconds between picks")
+    parser.add_argument("--mcts-every", type=int, default=defaults.mcts_every, help="MCTS on every Nth own pick; 0 = never")
+    parser.add_argument("--mcts-time-limit", type=float, default=defaults.mcts_time_limit)
+    parser.add_argument("--num-teams", type=int, default=defaults.num_teams)
+    parser.add_argument("--source", default=defaults.source, choices=["auto", "sleeper", "static"])
+    parser.add_argument("--url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", type=str, help="Also write the report as JSON to this path")
+    parser.add_argument("--max-p95-ms", type=float, help="Fail if any non-MCTS route's p95 exceeds this")
+    parser.add_argument("--max-error-rate", type=float, help="Fail if the error rate exceeds this (0-1)")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    config = LoadTestConfig(
+        drafters=args.drafters,
+        picks=args.picks,
+        pace=args.pace,
+        mcts_every=args.mcts_every,
+        mcts_time_limit=args.mcts_time_limit,
+        num_teams=args.num_teams,
+        source=args.source,
+        url=args.url,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_load_test(config))
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    failures = check_thresholds(report, args.max_p95_ms, args.max_error_rate)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
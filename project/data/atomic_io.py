@@ -0,0 +1,31 @@
+"""Crash-safe file replacement shared by the on-disk caches."""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(path, write, binary=False):
+    """Call `write(fileobj)` against a temp file next to `path`, fsync it,
+    then atomically move it over `path` -- readers see either the old file
+    or the complete new one, never a torn write.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        if binary:
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        with f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
@@ -1,46 +1,156 @@
+"""Clean scraped ranking exports into the player-pool data contract.
+
+The scrape merges name, team and position into one `Players` cell
+("Ja'Marr ChaseCinWR"). This splits it back out with a single compiled,
+anchored regex applied through `Series.str.extract` -- one vectorized pass
+per chunk instead of a Python-level scan of every position suffix and then
+every team suffix per row -- and produces the historical
+`Rank, Total_FPTS, Average_FPTS, Player, Team, Position` columns.
+
+Inputs are streamed in chunks (CSV via pandas' chunked reader, .xlsx via
+openpyxl's read-only row iterator), so large multi-season dumps never have
+to fit in memory at once. Rows whose merged cell can't be parsed are kept
+with empty Player/Team/Position, exactly like the old script, and are also
+collected into a failure report.
+
+    python -m project.data.clean_player_data                # the repo's own scrape
+    python -m project.data.clean_player_data dump1.csv dump2.xlsx -o out.csv --report failed.csv
+"""
+
+import argparse
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
 import pandas as pd
 
-# Load Excel
-df = pd.read_csv('./project/data/scraped_data.csv')
-
-# List of known NFL team codes
-team_codes = [
-    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
-    'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR', 'LV', 'MIA',
-    'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
-]
-
-# List of position codes
-position_codes = ['QB', 'RB', 'WR', 'TE', 'K', 'DST', 'DEF']
-team_codes = [
-    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
-    'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR', 'LV', 'MIA',
-    'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WSH', 'FA'
-]
-position_codes = ['QB', 'RB', 'WR', 'TE', 'K', 'DST', 'DEF']
-
-# Lowercase versions for matching
-team_codes_lower = [team.lower() for team in team_codes]
-position_codes_lower = [pos.lower() for pos in position_codes]
-
-def split_merged_field(s):
-    if not isinstance(s, str):
-        return pd.Series([None, None, None])
-    
-    s_lower = s.lower()
-    
-    for pos_lc, pos_orig in zip(position_codes_lower, position_codes):
-        if s_lower.endswith(pos_lc):
-            s_wo_pos = s[:-len(pos_lc)]
-            s_wo_pos_lower = s_lower[:-len(pos_lc)]
-
-            for team_lc, team_orig in zip(team_codes_lower, team_codes):
-                if s_wo_pos_lower.endswith(team_lc):
-                    player = s_wo_pos[:-len(team_lc)]
-                    return pd.Series([player.strip(), team_orig, pos_orig])
-    
-    return pd.Series([None, None, None]) 
-
-df[['Player', 'Team', 'Position']] = df['Players'].apply(split_merged_field)
-df = df.drop(columns=["Players"])
-df.to_csv('./project/data/cleaned_data.csv', index=False)
\ No newline at end of file
+from project.data.live_rankings import REPO_ROOT
+
+DEFAULT_INPUT = REPO_ROOT / "project" / "data" / "scraped_data.csv"
+DEFAULT_OUTPUT = REPO_ROOT / "project" / "data" / "cleaned_data.csv"
+DEFAULT_CHUNKSIZE = 50_000
+
+MERGED_COLUMN = "Players"
+OUTPUT_COLUMNS = ["Rank", "Total_FPTS", "Average_FPTS", "Player", "Team", "Position"]
+
+TEAM_CODES = (
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN",
+    "DET", "GB", "HOU", "IND", "JAX", "KC", "LAC", "LAR", "LV", "MIA",
+    "MIN", "NE", "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WSH", "FA",
+)
+POSITION_CODES = ("QB", "RB", "WR", "TE", "K", "DST", "DEF")
+
+# No team code is a suffix of another, and likewise for positions, so an
+# end-anchored match is unique -- the same answer the old per-row
+# first-suffix-wins loops gave. The scrape title-cases teams ("Cin"), hence
+# IGNORECASE plus an upper() on the captured codes.
+MERGED_PATTERN = re.compile(
+    rf"^(?P<Player>.*?)(?P<Team>{'|'.join(TEAM_CODES)})(?P<Position>{'|'.join(POSITION_CODES)})$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@dataclass
+class CleanReport:
+    rows: int = 0
+    failed: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=["Rank", MERGED_COLUMN]))
+
+    @property
+    def parsed(self):
+        return self.rows - len(self.failed)
+
+
+def split_merged_column(merged):
+    """Vectorized split of the merged column into Player, Team, Position
+    (all NaN for cells that don't parse)."""
+    parts = merged.astype("string").str.extract(MERGED_PATTERN)
+    parts["Player"] = parts["Player"].str.strip()
+    parts["Team"] = parts["Team"].str.upper()
+    parts["Position"] = parts["Position"].str.upper()
+    return parts.astype(object).where(parts.notna(), None)
+
+
+def clean_chunk(chunk):
+    """Clean one chunk of a scraped export. Returns (cleaned, failed)."""
+    parts = split_merged_column(chunk[MERGED_COLUMN])
+    failed = chunk.loc[parts["Player"].isna(), ["Rank", MERGED_COLUMN]]
+    cleaned = pd.concat([chunk.drop(columns=MERGED_COLUMN), parts], axis=1)
+    return cleaned[OUTPUT_COLUMNS], failed
+
+
+def _iter_xlsx_chunks(path, chunksize):
+    try:
+        from openpyxl import load_workbook
+    except ImportError as exc:
+        raise ImportError("Reading .xlsx exports requires openpyxl (pip install openpyxl)") from exc
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = list(next(rows))
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunksize:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        workbook.close()
+
+
+def iter_export_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """Stream a scraped export (.csv or .xlsx) as DataFrame chunks."""
+    path = Path(path)
+    if path.suffix.lower() in {".xlsx", ".xlsm"}:
+        yield from _iter_xlsx_chunks(path, chunksize)
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def clean_exports(paths, output_path, chunksize=DEFAULT_CHUNKSIZE, report_path=None):
+    """Clean every export in `paths` (in order) into one CSV at
+    `output_path`, chunk by chunk. Returns a CleanReport; if `report_path` is
+    given, the failed rows are also written there.
+    """
+    report = CleanReport()
+    failures = []
+    header = True
+    with open(output_path, "w", encoding="utf-8", newline="") as out:
+        for path in paths:
+            for chunk in iter_export_chunks(path, chunksize):
+                cleaned, failed = clean_chunk(chunk)
+                cleaned.to_csv(out, index=False, header=header)
+                header = False
+                report.rows += len(chunk)
+                if not failed.empty:
+                    failures.append(failed.assign(source=str(path)))
+
+    if failures:
+        report.failed = pd.concat(failures, ignore_index=True)
+    if report_path is not None:
+        report.failed.to_csv(report_path, index=False)
+    return report
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Clean scraped ranking exports into the player-pool CSV contract.")
+    parser.add_argument("inputs", nargs="*", type=Path, default=[DEFAULT_INPUT], help="Scraped .csv/.xlsx exports")
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--report", type=Path, help="Write rows that failed to parse to this CSV")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    report = clean_exports(args.inputs, args.output, args.chunksize, args.report)
+    print(f"Parsed {report.parsed}/{report.rows} rows into {args.output}")
+    if len(report.failed):
+        print(f"{len(report.failed)} rows failed to parse:")
+        print(report.failed.head(20).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
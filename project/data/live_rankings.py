@@ -2,7 +2,9 @@
 
 Produces a DataFrame in the same shape as the historical `cleaned_data.csv`
 (`Rank, Total_FPTS, Average_FPTS, Player, Team, Position`) so `greedy.py`/
-`mcts.py` don't need to change their data contract.
+`mcts.py` don't need to change their data contract, plus a stable integer
+`player_id` (see SYNTHETIC_ID_BASE) that the draft engines and webapp use
+to identify players instead of display names.
 
 Source order: Sleeper's projections endpoint (free, no auth) is the primary
 source -- confirmed to expose real preseason consensus (rotowire) projections
@@ -12,15 +14,38 @@ import_seasonal_data, import_draft_picks, import_ids, etc.) has no
 projections/ADP endpoint, only historical actuals -- so it isn't a candidate
 here. If Sleeper is unreachable or returns bad data, this falls back to the
 static `cleaned_data.csv` snapshot as a last resort.
+
+The six per-position requests are issued concurrently over one pooled
+keep-alive session, each retried with jittered exponential backoff, and the
+whole fetch is bounded by a single deadline -- so a cold session waits on
+roughly one round trip instead of six in series, and an unreachable upstream
+falls through to the fallback in ~`DEFAULT_DEADLINE` seconds rather than
+minutes.
 """
 
 import argparse
 import logging
+import os
+import random
 import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+from project.data.atomic_io import atomic_write
+from project.data.snapshot import (
+    SNAPSHOT_SUFFIX,
+    file_fingerprint,
+    read_snapshot,
+    read_snapshot_header,
+    snapshot_path_for,
+    write_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +59,22 @@ if getattr(sys, "frozen", False):
 else:
     REPO_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_STATIC_CSV = REPO_ROOT / "project" / "data" / "cleaned_data.csv"
-DEFAULT_CACHE_CSV = REPO_ROOT / "project" / "data" / "live_rankings_cache.csv"
+
+# A frozen bundle's extraction dir isn't a durable (or necessarily writable)
+# place to keep data between launches, so the packaged app caches under the
+# user's home directory instead.
+CACHE_DIR_ENV = "FANTASY_DRAFT_CACHE_DIR"
+if getattr(sys, "frozen", False):
+    DEFAULT_CACHE_DIR = Path.home() / ".fantasy_draft_assistant" / "cache"
+else:
+    DEFAULT_CACHE_DIR = REPO_ROOT / "project" / "data" / "cache"
 
 SLEEPER_BASE = "https://api.sleeper.app"
 SLEEPER_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
 POSITION_REMAP = {"DEF": "DST"}  # Sleeper's team-defense code -> our contract
 SCORING_FIELD = {"ppr": "pts_ppr", "half_ppr": "pts_half_ppr", "standard": "pts_std"}
-OUTPUT_COLUMNS = ["Rank", "Total_FPTS", "Average_FPTS", "Player", "Team", "Position"]
+ID_COLUMN = "player_id"
+OUTPUT_COLUMNS = ["Rank", "Total_FPTS", "Average_FPTS", "Player", "Team", "Position", ID_COLUMN]
 VALID_POSITIONS = {"QB", "RB", "WR", "TE", "K", "DST"}
 
 # NFL regular season length. Used as a fixed averaging divisor rather than
@@ -49,39 +83,205 @@ VALID_POSITIONS = {"QB", "RB", "WR", "TE", "K", "DST"}
 # projection), which would otherwise produce a wildly inflated Average_FPTS.
 GAMES_PER_SEASON = 17
 
+# Stable integer player ids. Sleeper's own player_id is a numeric string for
+# real players (small integers, well under 2**32) and the team abbreviation
+# for team defenses; the static CSV has no ids at all. Anything without a
+# numeric Sleeper id gets a synthetic id derived from (Position, Team, Player)
+# -- deterministic across reloads and offset above every real Sleeper id so
+# the two can never collide. Both stay below 2**53, so they survive a round
+# trip through JavaScript numbers in the webapp.
+SYNTHETIC_ID_BASE = 1 << 40
+
+# Per-request timeout, total wall-clock budget for the whole multi-position
+# fetch, and retry policy. Backoff uses "full jitter" (uniform in
+# [0, min(cap, base * 2**attempt)]) so concurrent position fetches that fail
+# together don't retry in lockstep.
+DEFAULT_TIMEOUT = 10
+DEFAULT_DEADLINE = 20
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 0.25
+BACKOFF_CAP = 4.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def synthetic_player_id(name, team, position):
+    return SYNTHETIC_ID_BASE + zlib.crc32(f"{position}|{team}|{name}".encode("utf-8"))
+
+
+def id_space(df):
+    """Which id scheme a pool's player_ids come from: "sleeper" when any row
+    carries a real Sleeper id, "synthetic" when every id was derived by
+    synthetic_player_id (the static CSV). The same player has different ids
+    in the two, so state keyed by id can't move between them.
+    """
+    return "sleeper" if (df[ID_COLUMN] < SYNTHETIC_ID_BASE).any() else "synthetic"
 
-def fetch_sleeper_projections(season, positions=SLEEPER_POSITIONS, scoring="ppr", session=None):
-    """Fetch season-aggregate projections from Sleeper for the given positions.
 
-    Returns a DataFrame with columns Player, Team, Position, Total_FPTS,
-    Average_FPTS (not yet Rank-assigned or column-ordered).
+def _sleeper_player_id(record):
+    raw = str(record.get("player_id") or "")
+    return int(raw) if raw.isdigit() else None
+
+
+def with_player_ids(df):
+    """Return `df` with an integer `player_id` column, filling any missing
+    ids synthetically. A no-op (same object) when every row already has one.
     """
-    if scoring not in SCORING_FIELD:
-        raise ValueError(f"Unknown scoring format: {scoring!r}. Expected one of {list(SCORING_FIELD)}")
-    stats_field = SCORING_FIELD[scoring]
+    if ID_COLUMN in df.columns and df[ID_COLUMN].notna().all():
+        return df
 
-    http = session or requests
-    rows = []
-    for pos in positions:
-        url = f"{SLEEPER_BASE}/projections/nfl/{season}"
-        params = {"season_type": "regular", "position[]": pos}
-        data = None
-        last_error = None
-        for attempt in range(2):
-            try:
-                resp = http.get(url, params=params, timeout=10)
-                resp.raise_for_status()
-                data = resp.json()
-                break
-            except (requests.RequestException, ValueError) as exc:
-                last_error = exc
-        if data is None:
-            raise RuntimeError(f"Failed to fetch Sleeper projections for position {pos}") from last_error
+    existing = df[ID_COLUMN] if ID_COLUMN in df.columns else pd.Series([None] * len(df), index=df.index)
+    used = {int(v) for v in existing.dropna()}
+    ids = []
+    for current, name, team, position in zip(existing, df["Player"], df["Team"], df["Position"]):
+        if pd.notna(current):
+            ids.append(int(current))
+            continue
+        pid = synthetic_player_id(name, team, position)
+        # crc32 collisions are vanishingly rare at pool sizes, but resolve
+        # them deterministically (in row order) rather than silently merging
+        # two players.
+        while pid in used:
+            pid += 1 << 32
+        used.add(pid)
+        ids.append(pid)
+
+    df = df.copy()
+    df[ID_COLUMN] = pd.Series(ids, index=df.index, dtype="int64")
+    return df
+
+
+def make_http_session(pool_size=len(SLEEPER_POSITIONS)):
+    """A keep-alive session whose connection pool is large enough for every
+    position fetch to hold its own connection at once. urllib3-level retries
+    are disabled -- retrying is handled (with backoff and the deadline) by
+    `_fetch_position`.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _backoff_delay(attempt):
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def _is_retryable(exc):
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code in RETRYABLE_STATUS
+    # Connection errors, timeouts, and truncated/garbled JSON bodies.
+    return True
 
+
+def _fetch_position(http, url, pos, deadline, timeout=DEFAULT_TIMEOUT, max_attempts=MAX_ATTEMPTS, validators=None):
+    """GET one position's projections, retrying transient failures until
+    `max_attempts` or the shared `deadline` (a time.monotonic() value) runs
+    out. Every attempt is timed and logged.
+
+    `validators` ({"etag", "last_modified"} from a previous response) turn
+    this into a conditional request. Returns {"records", "etag",
+    "last_modified"}, with records=None when the upstream answered 304 Not
+    Modified.
+    """
+    params = {"season_type": "regular", "position[]": pos}
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    last_error = None
+    for attempt in range(max_attempts):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        started = time.perf_counter()
+        try:
+            resp = http.get(url, params=params, headers=headers, timeout=min(timeout, remaining))
+            resp.raise_for_status()
+            data = None if resp.status_code == 304 else resp.json()
+        except (requests.RequestException, ValueError) as exc:
+            last_error = exc
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.warning("Sleeper %s attempt %d failed after %.0f ms: %s", pos, attempt + 1, elapsed_ms, exc)
+            if not _is_retryable(exc):
+                break
+        else:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if data is None:
+                logger.info("Sleeper %s not modified (%.0f ms, attempt %d)", pos, elapsed_ms, attempt + 1)
+            else:
+                logger.info("Sleeper %s fetched %d records in %.0f ms (attempt %d)", pos, len(data), elapsed_ms, attempt + 1)
+            return {
+                "records": data,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+
+        delay = _backoff_delay(attempt)
+        if time.monotonic() + delay >= deadline:
+            break
+        time.sleep(delay)
+
+    raise RuntimeError(f"Failed to fetch Sleeper projections for position {pos}") from last_error
+
+
+def fetch_sleeper_payloads(season, positions=SLEEPER_POSITIONS, session=None, base_url=SLEEPER_BASE,
+                           deadline=DEFAULT_DEADLINE, timeout=DEFAULT_TIMEOUT, validators=None):
+    """Fetch the raw Sleeper projection payload for each position.
+
+    Positions are fetched concurrently over `session` (a pooled keep-alive
+    session is created -- and closed -- here if none is passed in). `deadline`
+    is the total budget in seconds across all positions and retries;
+    `base_url` lets tests point this at a local stand-in server;
+    `validators` maps position -> validators for conditional requests.
+
+    Returns {position: {"records", "etag", "last_modified"}} in `positions`
+    order; see `_fetch_position`.
+    """
+    validators = validators or {}
+    http = session or make_http_session(pool_size=len(positions))
+    url = f"{base_url}/projections/nfl/{season}"
+    deadline_at = time.monotonic() + deadline
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(positions))) as executor:
+            futures = [
+                executor.submit(_fetch_position, http, url, pos, deadline_at, timeout, MAX_ATTEMPTS, validators.get(pos))
+                for pos in positions
+            ]
+            # Collected in `positions` order (not completion order) so the
+            # resulting row order -- and any Total_FPTS ties in Rank -- is
+            # deterministic.
+            payloads = {pos: future.result() for pos, future in zip(positions, futures)}
+    finally:
+        if session is None:
+            http.close()
+    logger.info("Sleeper fetch for %d positions finished in %.0f ms", len(positions), (time.perf_counter() - started) * 1000)
+    return payloads
+
+
+def format_column(column, scoring):
+    """Per-format column name in a multi-format pool, e.g. Total_FPTS_ppr."""
+    return f"{column}_{scoring}"
+
+
+def parse_sleeper_records_all_formats(records_by_position):
+    """Turn {position: [Sleeper record, ...]} into one DataFrame carrying
+    every scoring format: Player, Team, Position, player_id plus
+    Total_FPTS_<fmt> / Average_FPTS_<fmt> for each format in SCORING_FIELD
+    (NaN where a record lacks that format). Sleeper records already carry all
+    three point fields, so one fetch feeds every format.
+    """
+    rows = []
+    for pos, data in records_by_position.items():
         for record in data:
             stats = record.get("stats") or {}
-            total_fpts = stats.get(stats_field)
-            if total_fpts is None:
+            totals = {scoring: stats.get(field) for scoring, field in SCORING_FIELD.items()}
+            if all(total is None for total in totals.values()):
                 continue
 
             player = record.get("player") or {}
@@ -95,17 +295,62 @@ def fetch_sleeper_projections(season, positions=SLEEPER_POSITIONS, scoring="ppr"
             if not name or not team or position not in VALID_POSITIONS:
                 continue
 
-            rows.append(
-                {
-                    "Player": name,
-                    "Team": team,
-                    "Position": position,
-                    "Total_FPTS": float(total_fpts),
-                    "Average_FPTS": round(float(total_fpts) / GAMES_PER_SEASON, 1),
-                }
-            )
+            row = {"Player": name, "Team": team, "Position": position, ID_COLUMN: _sleeper_player_id(record)}
+            for scoring, total in totals.items():
+                row[format_column("Total_FPTS", scoring)] = float("nan") if total is None else float(total)
+                row[format_column("Average_FPTS", scoring)] = (
+                    float("nan") if total is None else round(float(total) / GAMES_PER_SEASON, 1)
+                )
+            rows.append(row)
+
+    if not rows:
+        columns = ["Player", "Team", "Position", ID_COLUMN]
+        for scoring in SCORING_FIELD:
+            columns += [format_column("Total_FPTS", scoring), format_column("Average_FPTS", scoring)]
+        return pd.DataFrame(columns=columns)
+    return with_player_ids(pd.DataFrame(rows))
+
+
+def _single_format(multi_pool, scoring):
+    total = multi_pool[format_column("Total_FPTS", scoring)]
+    keep = total.notna().to_numpy()
+    view = multi_pool.loc[keep]
+    return pd.DataFrame(
+        {
+            "Player": view["Player"].to_numpy(),
+            "Team": view["Team"].to_numpy(),
+            "Position": view["Position"].to_numpy(),
+            "Total_FPTS": total.to_numpy()[keep],
+            "Average_FPTS": view[format_column("Average_FPTS", scoring)].to_numpy(),
+            ID_COLUMN: view[ID_COLUMN].to_numpy(),
+        }
+    )
+
+
+def parse_sleeper_records(records_by_position, scoring="ppr"):
+    """Single-format parse: a DataFrame with columns Player, Team, Position,
+    Total_FPTS, Average_FPTS, player_id (not yet Rank-assigned or
+    column-ordered).
+    """
+    if scoring not in SCORING_FIELD:
+        raise ValueError(f"Unknown scoring format: {scoring!r}. Expected one of {list(SCORING_FIELD)}")
+    return _single_format(parse_sleeper_records_all_formats(records_by_position), scoring)
+
 
-    return pd.DataFrame(rows)
+def fetch_sleeper_projections(season, positions=SLEEPER_POSITIONS, scoring="ppr", session=None,
+                              base_url=SLEEPER_BASE, deadline=DEFAULT_DEADLINE, timeout=DEFAULT_TIMEOUT):
+    """Fetch season-aggregate projections from Sleeper for the given positions.
+
+    See `fetch_sleeper_payloads` for the transport knobs. Returns a
+    DataFrame with columns Player, Team, Position, Total_FPTS, Average_FPTS,
+    player_id (not yet Rank-assigned or column-ordered).
+    """
+    if scoring not in SCORING_FIELD:
+        raise ValueError(f"Unknown scoring format: {scoring!r}. Expected one of {list(SCORING_FIELD)}")
+    payloads = fetch_sleeper_payloads(
+        season, positions, session=session, base_url=base_url, deadline=deadline, timeout=timeout
+    )
+    return parse_sleeper_records({pos: payload["records"] for pos, payload in payloads.items()}, scoring)
 
 
 def _assign_overall_rank(df):
@@ -114,9 +359,99 @@ def _assign_overall_rank(df):
     return df[OUTPUT_COLUMNS]
 
 
-def load_static_fallback(path=DEFAULT_STATIC_CSV):
-    """Escape hatch: the original manually-scraped, one-time snapshot."""
-    return pd.read_csv(path)
+def build_multi_format_pool(records_by_position):
+    """Parse raw Sleeper records once into a validated multi-format pool:
+    the parse_sleeper_records_all_formats columns plus a Rank_<fmt> per
+    format (NaN for players without that format). Each format is ranked and
+    validated exactly as a single-format build would be; a format that
+    fails validation is dropped (all-NaN Rank_<fmt>, so select_scoring
+    refuses it) without taking the other formats down with it. Raises
+    AssertionError only if every format fails.
+    """
+    multi_pool = parse_sleeper_records_all_formats(records_by_position)
+    failures = {}
+    for scoring in SCORING_FIELD:
+        ranked = _assign_overall_rank(_single_format(multi_pool, scoring))
+        try:
+            validate_rankings(ranked)
+        except AssertionError as e:
+            logger.warning("Dropping %s rankings that failed validation: %s", scoring, e)
+            failures[scoring] = str(e)
+            multi_pool[format_column("Rank", scoring)] = float("nan")
+            continue
+        multi_pool[format_column("Rank", scoring)] = multi_pool[ID_COLUMN].map(
+            pd.Series(ranked["Rank"].to_numpy(dtype=float), index=ranked[ID_COLUMN])
+        )
+    if len(failures) == len(SCORING_FIELD):
+        raise AssertionError(f"No scoring format passed validation: {failures}")
+    return multi_pool
+
+
+def select_scoring(multi_pool, scoring="ppr"):
+    """The OUTPUT_COLUMNS pool for one format out of a multi-format pool --
+    column selection plus that format's rank order, no re-parse or re-fetch.
+    """
+    if scoring not in SCORING_FIELD:
+        raise ValueError(f"Unknown scoring format: {scoring!r}. Expected one of {list(SCORING_FIELD)}")
+    rank = multi_pool[format_column("Rank", scoring)]
+    if not rank.notna().any():
+        raise ValueError(f"No valid {scoring} rankings in this pool (dropped by build_multi_format_pool)")
+    view = multi_pool.loc[rank.notna()].sort_values(format_column("Rank", scoring))
+    return pd.DataFrame(
+        {
+            "Rank": view[format_column("Rank", scoring)].to_numpy(dtype="int64"),
+            "Total_FPTS": view[format_column("Total_FPTS", scoring)].to_numpy(),
+            "Average_FPTS": view[format_column("Average_FPTS", scoring)].to_numpy(),
+            "Player": view["Player"].to_numpy(),
+            "Team": view["Team"].to_numpy(),
+            "Position": view["Position"].to_numpy(),
+            ID_COLUMN: view[ID_COLUMN].to_numpy(dtype="int64"),
+        }
+    )
+
+
+def rankings_from_records(records_by_position, scoring="ppr"):
+    """Parse, rank and validate raw Sleeper records into one format's pool."""
+    return select_scoring(build_multi_format_pool(records_by_position), scoring)
+
+
+def build_multi_format_rankings(season=2026, **fetch_kwargs):
+    """One Sleeper fetch -> a validated multi-format pool (see
+    build_multi_format_pool); `fetch_kwargs` go to fetch_sleeper_payloads.
+    """
+    payloads = fetch_sleeper_payloads(season, **fetch_kwargs)
+    return build_multi_format_pool({pos: payload["records"] for pos, payload in payloads.items()})
+
+
+def load_static_fallback(path=DEFAULT_STATIC_CSV, cache_dir=None):
+    """Escape hatch: the original manually-scraped, one-time snapshot.
+
+    Prefers a binary snapshot (see snapshot.py) built from exactly this
+    CSV's bytes: one shipped next to the CSV (packaging/app.spec pre-builds
+    it into the bundle) or one in the cache dir. Otherwise parses the CSV
+    and, best effort, writes the snapshot to the cache dir for next time --
+    never next to the CSV, which is the source tree or a read-only bundle.
+    """
+    fingerprint = file_fingerprint(path)
+    cached = Path(cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR) / (
+        f"static_{Path(path).stem}{SNAPSHOT_SUFFIX}"
+    )
+    for snapshot in (snapshot_path_for(path), cached):
+        try:
+            header, _ = read_snapshot_header(snapshot)
+            if all(header["meta"].get(k) == v for k, v in fingerprint.items()):
+                return with_player_ids(read_snapshot(snapshot)[0])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError):
+            logger.warning("Ignoring unreadable static snapshot %s", snapshot, exc_info=True)
+
+    df = with_player_ids(pd.read_csv(path))
+    try:
+        atomic_write(cached, lambda f: write_snapshot(df, f, meta=fingerprint), binary=True)
+    except OSError:
+        logger.info("Could not write static snapshot %s", cached, exc_info=True)
+    return df
 
 
 def validate_rankings(df):
@@ -127,6 +462,7 @@ def validate_rankings(df):
     assert df["Position"].isin(VALID_POSITIONS).all(), f"Unexpected position values: {set(df['Position']) - VALID_POSITIONS}"
     assert df["Player"].notna().all(), "Null Player values present"
     assert df["Team"].notna().all(), "Null Team values present"
+    assert df[ID_COLUMN].is_unique, "player_id column has duplicates"
     assert 300 <= len(df) <= 700, f"Row count {len(df)} outside the sane band (300-700)"
 
 
@@ -144,10 +480,7 @@ def build_live_rankings(season=2026, scoring="ppr", source="auto"):
         return load_static_fallback()
 
     try:
-        raw = fetch_sleeper_projections(season, scoring=scoring)
-        df = _assign_overall_rank(raw)
-        validate_rankings(df)
-        return df
+        return select_scoring(build_multi_format_rankings(season), scoring)
     except Exception:
         if source == "sleeper":
             raise
@@ -160,13 +493,22 @@ def _parse_args():
     parser.add_argument("--season", type=int, default=2026)
     parser.add_argument("--scoring", choices=list(SCORING_FIELD), default="ppr")
     parser.add_argument("--source", choices=["auto", "sleeper", "static"], default="auto")
-    parser.add_argument("--refresh-cache", action="store_true", help="Write the result to live_rankings_cache.csv")
+    parser.add_argument(
+        "--refresh-cache", action="store_true", help="Force a Sleeper fetch and write it to the on-disk projection cache"
+    )
     return parser.parse_args()
 
 
 def main():
     args = _parse_args()
-    df = build_live_rankings(season=args.season, scoring=args.scoring, source=args.source)
+    if args.refresh_cache:
+        # Imported here: projection_cache itself imports this module.
+        from project.data.projection_cache import get_default_cache
+
+        cache = get_default_cache()
+        df = cache.refresh(season=args.season, scoring=args.scoring)
+    else:
+        df = build_live_rankings(season=args.season, scoring=args.scoring, source=args.source)
     print(df.head(20).to_string(index=False))
     print(f"\n{len(df)} total players.")
     for pos in sorted(VALID_POSITIONS):
@@ -174,8 +516,7 @@ def main():
         print(df[df["Position"] == pos].head(5).to_string(index=False))
 
     if args.refresh_cache:
-        df.to_csv(DEFAULT_CACHE_CSV, index=False)
-        print(f"\nWrote cache to {DEFAULT_CACHE_CSV}")
+        print(f"\nWrote cache to {cache.cache_dir}")
 
 
 if __name__ == "__main__":
@@ -3,10 +3,13 @@
 Replaces the CWD-relative `pd.read_csv("./project/data/cleaned_data.csv")`
 calls duplicated in greedy.py's and mcts.py's main() -- those only worked if
 the process happened to be launched from the repo root.
+
+Goes through the process-wide ProjectionCache, so repeated sessions for the
+same (season, scoring) don't re-fetch from Sleeper.
 """
 
-from project.data.live_rankings import build_live_rankings
+from project.data.projection_cache import get_default_cache
 
 
 def load_player_pool(source="auto", season=2026, scoring="ppr"):
-    return build_live_rankings(season=season, scoring=scoring, source=source)
+    return get_default_cache().get(season=season, scoring=scoring, source=source)
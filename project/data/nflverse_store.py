@@ -0,0 +1,298 @@
+"""Local SQLite store for the nflverse schedules and weekly stats that the
+weekly dashboard (project/management/data_generation.py) reads.
+
+Every generate_data call used to download a full season of schedules and
+weekly stats through nfl_data_py. Streamlit's cache only lasts as long as
+the process, and nfl_data_py can't even be installed on current Python (see
+requirements.txt). This store keeps the columns the dashboard uses in one
+SQLite file:
+
+- `schedules`: one row per game, keyed by game_id and indexed on
+  (season, week) and on (season, team) for both home and away.
+- `weekly`: one row per player-week, keyed by (season, week, player_id) and
+  indexed on (season, week), (season, player_display_name) and
+  (season, recent_team).
+
+`ingest` pulls from the upstream source -- nfl_data_py by default, or any
+object with the same import_schedules / import_weekly_data functions -- and
+is incremental. Weekly stats are rewritten from the latest stored week on,
+so a week ingested part-way through (after Thursday's game) is completed
+and stat corrections to it are picked up; older weeks are left alone.
+Schedules are upserted by game_id, because betting lines move until
+kickoff. Each ingest is recorded in `ingested` (season, time), which is
+what decides whether a season still has to be fetched -- a preseason with
+schedules but no weekly stats yet counts as ingested.
+
+NflverseStore.import_schedules(years) / import_weekly_data(years, columns)
+accept nfl_data_py's arguments and return the same columns with the
+upstream team codes (LA, WAS), so the store is a drop-in local stand-in for
+the upstream module; `weeks=` is an extra, store-only filter. A season that
+has never been ingested is fetched on first read when the upstream is
+available, and raises otherwise.
+
+    python -m project.data.nflverse_store ingest 2025
+    python -m project.data.nflverse_store status
+
+The file defaults to DEFAULT_DB_PATH and can be moved with the
+FANTASY_DRAFT_NFLVERSE_DB environment variable.
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+
+from project.data.live_rankings import REPO_ROOT
+
+logger = logging.getLogger(__name__)
+
+DB_PATH_ENV = "FANTASY_DRAFT_NFLVERSE_DB"
+
+if getattr(sys, "frozen", False):
+    DEFAULT_DB_PATH = Path.home() / ".fantasy_draft_assistant" / "cache" / "nflverse.sqlite"
+else:
+    DEFAULT_DB_PATH = REPO_ROOT / "project" / "data" / "cache" / "nflverse.sqlite"
+
+# (column, SQLite type); the first column(s) listed in each *_KEY form the
+# primary key.
+SCHEDULE_COLUMNS = (
+    ("game_id", "TEXT"),
+    ("season", "INTEGER"),
+    ("game_type", "TEXT"),
+    ("week", "INTEGER"),
+    ("gameday", "TEXT"),
+    ("home_team", "TEXT"),
+    ("away_team", "TEXT"),
+    ("home_score", "REAL"),
+    ("away_score", "REAL"),
+    ("total_line", "REAL"),
+    ("spread_line", "REAL"),
+)
+SCHEDULE_KEY = ("game_id",)
+WEEKLY_COLUMNS = (
+    ("season", "INTEGER"),
+    ("week", "INTEGER"),
+    ("player_id", "TEXT"),
+    ("season_type", "TEXT"),
+    ("player_display_name", "TEXT"),
+    ("position", "TEXT"),
+    ("recent_team", "TEXT"),
+    ("opponent_team", "TEXT"),
+    ("fantasy_points", "REAL"),
+    ("fantasy_points_ppr", "REAL"),
+)
+WEEKLY_KEY = ("season", "week", "player_id")
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS schedules ({}, PRIMARY KEY ({}))".format(
+        ", ".join(f"{name} {kind}" for name, kind in SCHEDULE_COLUMNS), ", ".join(SCHEDULE_KEY)
+    ),
+    "CREATE INDEX IF NOT EXISTS schedules_season_week ON schedules (season, week)",
+    "CREATE INDEX IF NOT EXISTS schedules_season_home ON schedules (season, home_team)",
+    "CREATE INDEX IF NOT EXISTS schedules_season_away ON schedules (season, away_team)",
+    "CREATE TABLE IF NOT EXISTS weekly ({}, PRIMARY KEY ({}))".format(
+        ", ".join(f"{name} {kind}" for name, kind in WEEKLY_COLUMNS), ", ".join(WEEKLY_KEY)
+    ),
+    "CREATE INDEX IF NOT EXISTS weekly_season_week ON weekly (season, week)",
+    "CREATE INDEX IF NOT EXISTS weekly_season_player ON weekly (season, player_display_name)",
+    "CREATE INDEX IF NOT EXISTS weekly_season_team ON weekly (season, recent_team)",
+    "CREATE TABLE IF NOT EXISTS ingested (season INTEGER PRIMARY KEY, ingested_at REAL)",
+]
+
+
+def _upstream():
+    import nfl_data_py
+
+    return nfl_data_py
+
+
+def _rows(df, columns):
+    """`df` restricted to `columns` (missing ones as NULL), as tuples of
+    plain Python values for executemany."""
+    names = [name for name, _ in columns]
+    frame = df.reindex(columns=names).astype(object)
+    frame = frame.where(frame.notna(), None)
+    return names, list(frame.itertuples(index=False, name=None))
+
+
+class NflverseStore:
+    def __init__(self, path=None, upstream=None):
+        self.path = Path(path or os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH)
+        # Module-like source with import_schedules / import_weekly_data;
+        # nfl_data_py (imported on first use) when None.
+        self.upstream = upstream
+        self._initialized = False
+
+    def _connect(self):
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            with conn:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+            self._initialized = True
+        return conn
+
+    def _source(self):
+        return self.upstream if self.upstream is not None else _upstream()
+
+    # ---- ingestion ----
+
+    def ingest(self, season):
+        """Pull `season` from upstream: new weekly stats, every schedule row.
+        Returns {"schedules": rows upserted, "weekly": rows written}."""
+        source = self._source()
+        schedules = source.import_schedules([season])
+        weekly = source.import_weekly_data([season])
+        counts = {
+            "schedules": self.write_schedules(schedules.loc[schedules["season"] == season]),
+            "weekly": self.append_weekly(season, weekly.loc[weekly["season"] == season]),
+        }
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO ingested (season, ingested_at) VALUES (?, ?)", (season, time.time()))
+        return counts
+
+    def write_schedules(self, schedules):
+        names, rows = _rows(schedules, SCHEDULE_COLUMNS)
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO schedules ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})", rows
+            )
+        return len(rows)
+
+    def append_weekly(self, season, weekly):
+        """Write the weeks of `weekly` from the latest stored for `season`
+        on, replacing what's stored for those weeks: that week may have been
+        stored part-way through, or had stats corrected since."""
+        latest = self.latest_week(season)
+        if latest is not None:
+            weekly = weekly.loc[weekly["week"] >= latest]
+        names, rows = _rows(weekly, WEEKLY_COLUMNS)
+        with closing(self._connect()) as conn, conn:
+            if latest is not None and rows:
+                conn.execute("DELETE FROM weekly WHERE season = ? AND week >= ?", (season, latest))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO weekly ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})", rows
+            )
+        return len(rows)
+
+    def ingested_at(self, season):
+        """When `season` was last ingested (time.time()), or None."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT ingested_at FROM ingested WHERE season = ?", (season,)).fetchone()
+        return row[0] if row else None
+
+    def latest_week(self, season):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT MAX(week) FROM weekly WHERE season = ?", (season,)).fetchone()[0]
+
+    def status(self):
+        """{season: {"games": n, "weekly_rows": n, "latest_week": w}}."""
+        with closing(self._connect()) as conn:
+            games = dict(conn.execute("SELECT season, COUNT(*) FROM schedules GROUP BY season"))
+            weekly = {
+                season: (count, latest)
+                for season, count, latest in conn.execute(
+                    "SELECT season, COUNT(*), MAX(week) FROM weekly GROUP BY season"
+                )
+            }
+        return {
+            season: {
+                "games": games.get(season, 0),
+                "weekly_rows": weekly.get(season, (0, None))[0],
+                "latest_week": weekly.get(season, (0, None))[1],
+            }
+            for season in sorted(set(games) | set(weekly))
+        }
+
+    # ---- reads (nfl_data_py-compatible) ----
+
+    def import_schedules(self, years, *, weeks=None):
+        return self._read("schedules", SCHEDULE_COLUMNS, years, weeks)
+
+    def import_weekly_data(self, years, columns=None, *, weeks=None):
+        return self._read("weekly", WEEKLY_COLUMNS, years, weeks, columns)
+
+    def _read(self, table, columns, years, weeks, select=None):
+        years = [int(year) for year in years]
+        for year in years:
+            self._ensure_season(year)
+        known = [name for name, _ in columns]
+        if select is None:
+            select = known
+        unknown = sorted(set(select) - set(known))
+        if unknown:
+            raise ValueError(f"Unknown {table} columns: {unknown}")
+        query = f"SELECT {', '.join(select)} FROM {table} WHERE season IN ({', '.join('?' * len(years))})"
+        params = list(years)
+        if weeks is not None:
+            weeks = [int(week) for week in weeks]
+            query += f" AND week IN ({', '.join('?' * len(weeks))})"
+            params += weeks
+        order = ", ".join(name for name in ("season", "week", "game_id", "player_id") if name in dict(columns))
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(f"{query} ORDER BY {order}", conn, params=params)
+
+    def _ensure_season(self, season):
+        with closing(self._connect()) as conn, conn:
+            stored = conn.execute("SELECT 1 FROM ingested WHERE season = ?", (season,)).fetchone()
+            if not stored and conn.execute(
+                "SELECT 1 FROM schedules WHERE season = ? UNION ALL SELECT 1 FROM weekly WHERE season = ? LIMIT 1",
+                (season, season),
+            ).fetchone():
+                # Ingested by a store that predates the `ingested` table.
+                conn.execute("INSERT INTO ingested (season, ingested_at) VALUES (?, NULL)", (season,))
+                stored = True
+        if stored:
+            return
+        try:
+            counts = self.ingest(season)
+        except ImportError:
+            raise RuntimeError(
+                f"No nflverse data for {season} in {self.path} and nfl_data_py isn't installed to fetch it; "
+                f"run `python -m project.data.nflverse_store ingest {season}` where it is."
+            ) from None
+        logger.info("Ingested nflverse %s on first read: %s", season, counts)
+
+
+_default_store = None
+
+
+def get_default_store():
+    global _default_store
+    if _default_store is None:
+        _default_store = NflverseStore()
+    return _default_store
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Maintain the local nflverse schedules/weekly-stats store.")
+    parser.add_argument("--db", type=Path, help=f"Store path (default: ${DB_PATH_ENV} or {DEFAULT_DB_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="Fetch new weeks for one or more seasons from nfl_data_py")
+    ingest.add_argument("seasons", type=int, nargs="+")
+    commands.add_parser("status", help="Show what's stored per season")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    store = NflverseStore(args.db)
+    if args.command == "ingest":
+        for season in args.seasons:
+            counts = store.ingest(season)
+            print(f"{season}: {counts['schedules']} schedule rows upserted, {counts['weekly']} weekly rows appended")
+    print(f"{store.path}:")
+    for season, info in store.status().items():
+        print(f"  {season}: {info['games']} games, {info['weekly_rows']} player-weeks through week {info['latest_week']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Normalized-name search index over one player pool.
+
+The webapp used to ship the whole available pool to the browser on every
+refresh so app.js could substring-match locally, and `apply_pick` demanded
+an exact display-name match. This index is built once per pool and answers
+type-ahead queries server-side (`/api/players/search`) and resolves
+slightly-off names in picks.
+
+Names are normalized before indexing and querying: accents folded, case
+dropped, apostrophes/periods removed outright ("Ja'Marr" -> "jamarr",
+"D.J." -> "dj"), other punctuation treated as a word break, and trailing
+generational suffixes (Jr., Sr., II-V) stripped. Matching then runs in
+tiers, best first:
+
+1. exact normalized name,
+2. the normalized name starts with the query,
+3. every query word is a prefix of some name word ("chase ja" finds
+   "Ja'Marr Chase"), found via bisect over a sorted word list -- a flat
+   stand-in for a prefix trie,
+4. typo tolerance: Dice similarity over padded character trigrams, using
+   trigram postings so only players sharing a trigram are scored.
+
+Within a tier, results order by trigram similarity and then Rank.
+"""
+
+import bisect
+import heapq
+import re
+import unicodedata
+
+from project.data.live_rankings import ID_COLUMN
+
+GENERATIONAL_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+_DROPPED = re.compile(r"[.'’`]")
+_WORD_BREAK = re.compile(r"[^a-z0-9]+")
+
+EXACT, PREFIX, WORD_PREFIX, FUZZY = 3, 2, 1, 0
+# Fuzzy matches below this are noise; at or above RESOLVE_SIMILARITY (and
+# clearly ahead of the runner-up) a typo'd pick name is accepted outright.
+MIN_SIMILARITY = 0.3
+RESOLVE_SIMILARITY = 0.7
+RESOLVE_MARGIN = 0.1
+
+
+def normalize_name(name):
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    words = [w for w in _WORD_BREAK.split(_DROPPED.sub("", text)) if w]
+    while len(words) > 1 and words[-1] in GENERATIONAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def _trigrams(normalized):
+    padded = f"${normalized.replace(' ', '$')}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerSearchIndex:
+    def __init__(self, full_player_pool):
+        self.ids = [int(pid) for pid in full_player_pool[ID_COLUMN]]
+        self.ranks = full_player_pool["Rank"].tolist()
+        self.names = [normalize_name(name) for name in full_player_pool["Player"]]
+
+        self._by_name = {}
+        self._words = []  # sorted (word, row) pairs for prefix lookups
+        self._grams = []
+        self._postings = {}
+        for row, name in enumerate(self.names):
+            self._by_name.setdefault(name, []).append(row)
+            self._words.extend((word, row) for word in name.split())
+            grams = _trigrams(name)
+            self._grams.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(row)
+        self._words.sort()
+
+    def _rows_with_word_prefix(self, prefix):
+        rows = set()
+        i = bisect.bisect_left(self._words, (prefix,))
+        while i < len(self._words) and self._words[i][0].startswith(prefix):
+            rows.add(self._words[i][1])
+            i += 1
+        return rows
+
+    def _scored(self, query, allowed_ids=None):
+        """Yield (tier, similarity, row) for every candidate row."""
+        normalized = normalize_name(query)
+        if not normalized:
+            return
+
+        query_grams = _trigrams(normalized)
+        shared = {}
+        for gram in query_grams:
+            for row in self._postings.get(gram, ()):
+                shared[row] = shared.get(row, 0) + 1
+
+        words = normalized.split()
+        word_matches = self._rows_with_word_prefix(words[0])
+        for word in words[1:]:
+            word_matches &= self._rows_with_word_prefix(word)
+
+        for row in word_matches | shared.keys():
+            if allowed_ids is not None and self.ids[row] not in allowed_ids:
+                continue
+            similarity = 2 * shared.get(row, 0) / (len(query_grams) + self._grams[row])
+            name = self.names[row]
+            if name == normalized:
+                tier = EXACT
+            elif name.startswith(normalized):
+                tier = PREFIX
+            elif row in word_matches:
+                tier = WORD_PREFIX
+            elif similarity >= MIN_SIMILARITY:
+                tier = FUZZY
+            else:
+                continue
+            yield tier, similarity, row
+
+    def search(self, query, limit=10, allowed_ids=None):
+        """Top `limit` matches as [(player_id, tier, similarity)], best first.
+        `allowed_ids` restricts results (e.g. to still-available players).
+        """
+        best = heapq.nsmallest(
+            limit, self._scored(query, allowed_ids), key=lambda hit: (-hit[0], -hit[1], self.ranks[hit[2]])
+        )
+        return [(self.ids[row], tier, similarity) for tier, similarity, row in best]
+
+    def resolve(self, name, allowed_ids=None):
+        """The player_id `name` unambiguously refers to, or None: an exact
+        normalized match, or a close fuzzy match well ahead of the runner-up.
+        """
+        top = self.search(name, limit=2, allowed_ids=allowed_ids)
+        if not top:
+            return None
+        player_id, tier, similarity = top[0]
+        if tier == EXACT:
+            return player_id
+        runner_up = top[1][2] if len(top) > 1 else 0.0
+        if similarity >= RESOLVE_SIMILARITY and similarity - runner_up >= RESOLVE_MARGIN:
+            return player_id
+        return None
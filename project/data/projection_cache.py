@@ -0,0 +1,261 @@
+"""On-disk + in-memory cache for the live player pool.
+
+Every `create_session` used to go straight to `build_live_rankings`, i.e. a
+fresh round of Sleeper requests per draft, and fell back to the 2025 static
+snapshot whenever Sleeper was down. This sits in front of that:
+
+- Fresh entries (younger than `ttl` seconds) are served from memory, or from
+  disk on the first call in a process -- no network at all.
+- Stale entries are still served immediately, and a single background thread
+  per key refreshes them (stale-while-revalidate).
+- Refreshes send conditional requests (If-None-Match / If-Modified-Since)
+  using the validators from the last response, and reuse the stored raw
+  payload for any position the upstream reports as 304 Not Modified.
+- A failed refresh keeps the last good pool, so sessions survive upstream
+  outages with recent data; the static CSV is only used when nothing has
+  ever been cached.
+- One Sleeper fetch carries every scoring format, so the cache holds one
+  multi-format pool per season (see build_multi_format_pool) and hands out
+  per-format views via select_scoring. A view is materialized at most once
+  per refresh -- each format has its own row order, so it can't be a pure
+  zero-copy slice -- and later sessions with the same format get that same
+  DataFrame back.
+- Pools are stored as binary columnar snapshots (see snapshot.py), so a
+  cold process reads one without any CSV/JSON parsing.
+- All files are written to a temp file in the same directory and moved into
+  place with os.replace, so a crash mid-write never leaves a torn cache.
+
+Cache location and TTL default to DEFAULT_CACHE_DIR / DEFAULT_TTL_SECONDS and
+can be overridden per instance or via the FANTASY_DRAFT_CACHE_DIR /
+FANTASY_DRAFT_CACHE_TTL environment variables.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from project.data.atomic_io import atomic_write
+from project.data.live_rankings import (
+    CACHE_DIR_ENV,
+    DEFAULT_CACHE_DIR,
+    SCORING_FIELD,
+    build_multi_format_pool,
+    fetch_sleeper_payloads,
+    load_static_fallback,
+    select_scoring,
+)
+from project.data.snapshot import SNAPSHOT_SUFFIX, read_snapshot, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_ENV = "FANTASY_DRAFT_CACHE_TTL"
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+
+SOURCES = ("auto", "sleeper", "static", "cached")
+
+
+class ProjectionCache:
+    def __init__(self, cache_dir=None, ttl=None, fetch_kwargs=None, clock=time.time):
+        self.cache_dir = Path(cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        self.ttl = float(ttl if ttl is not None else os.environ.get(CACHE_TTL_ENV, DEFAULT_TTL_SECONDS))
+        # Extra keyword arguments for fetch_sleeper_payloads (base_url,
+        # deadline, session, ...) -- mainly so tests can point at a stub.
+        self.fetch_kwargs = fetch_kwargs or {}
+        self.clock = clock
+
+        self._memory = {}  # season -> (multi-format DataFrame, fetched_at)
+        self._views = {}  # (season, scoring) -> (fetched_at, DataFrame)
+        self._refreshing = {}  # season -> Thread
+        self._lock = threading.Lock()
+
+        # Upstream fetch timings, read by the webapp's /metrics.
+        self.fetches = 0
+        self.fetch_failures = 0
+        self.fetch_seconds_total = 0.0
+        self.last_fetch_seconds = None
+
+    def _pool_path(self, season):
+        return self.cache_dir / f"pool_{season}{SNAPSHOT_SUFFIX}"
+
+    def _payload_path(self, season):
+        # Raw payloads are scoring-independent (every record carries all
+        # three point fields), so one file per season serves every format.
+        return self.cache_dir / f"sleeper_{season}.json"
+
+    def get(self, season=2026, scoring="ppr", source="auto"):
+        """Return the player pool for (season, scoring).
+
+        source: "auto" serves the cache (refreshing in the background when
+        stale) and only blocks on the network for a cold cache, falling back
+        to the static CSV if that fails. "sleeper" forces a synchronous
+        refresh and raises on failure. "static" bypasses the cache entirely.
+        "cached" serves only what's already cached (however stale) and
+        raises LookupError rather than touching the network.
+        """
+        if source not in SOURCES:
+            raise ValueError(f"Unknown source: {source!r}. Expected one of {list(SOURCES)}")
+        if scoring not in SCORING_FIELD:
+            raise ValueError(f"Unknown scoring format: {scoring!r}. Expected one of {list(SCORING_FIELD)}")
+
+        if source == "static":
+            return load_static_fallback()
+        if source == "sleeper":
+            return self.refresh(season, scoring)
+
+        entry = self._lookup(season)
+        if source == "cached":
+            if entry is None:
+                raise LookupError(f"No cached Sleeper pool for {season}")
+            return self._view(season, scoring, *entry)
+        if entry is None:
+            try:
+                return self.refresh(season, scoring)
+            except Exception:
+                logger.warning("Live Sleeper rankings unavailable and nothing cached, falling back to static CSV", exc_info=True)
+                return load_static_fallback()
+
+        multi_pool, fetched_at = entry
+        if self.is_stale(fetched_at):
+            self.refresh_in_background(season)
+        try:
+            return self._view(season, scoring, multi_pool, fetched_at)
+        except ValueError:
+            # This format failed validation in the cached pool (the others
+            # are still served from it).
+            logger.warning("No valid cached %s rankings for %s, falling back to static CSV", scoring, season, exc_info=True)
+            return load_static_fallback()
+
+    def is_stale(self, fetched_at):
+        return self.clock() - fetched_at >= self.ttl
+
+    def _lookup(self, season):
+        with self._lock:
+            if season in self._memory:
+                return self._memory[season]
+
+        try:
+            multi_pool, meta = read_snapshot(self._pool_path(season))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError):
+            logger.warning("Ignoring unreadable projection cache entry for %s", season, exc_info=True)
+            return None
+
+        entry = (multi_pool, float(meta["fetched_at"]))
+        with self._lock:
+            # A refresh may have landed while we were reading from disk.
+            return self._memory.setdefault(season, entry)
+
+    def _view(self, season, scoring, multi_pool, fetched_at):
+        key = (season, scoring)
+        with self._lock:
+            cached = self._views.get(key)
+        if cached is not None and cached[0] == fetched_at:
+            return cached[1]
+
+        df = select_scoring(multi_pool, scoring)
+        with self._lock:
+            # Keep whichever view is newest if a refresh raced us.
+            current = self._views.get(key)
+            if current is None or current[0] <= fetched_at:
+                self._views[key] = (fetched_at, df)
+        return df
+
+    def _read_payloads(self, season):
+        try:
+            return json.loads(self._payload_path(season).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable Sleeper payload cache for %s", season, exc_info=True)
+            return {}
+
+    def refresh(self, season=2026, scoring="ppr"):
+        """Synchronously re-fetch (conditionally) and re-cache a season's
+        pool for every scoring format; returns the `scoring` view.
+        """
+        stored = self._read_payloads(season)
+        validators = {
+            pos: {"etag": payload.get("etag"), "last_modified": payload.get("last_modified")}
+            for pos, payload in stored.items()
+        }
+        started = time.perf_counter()
+        failed = False
+        try:
+            fetched = fetch_sleeper_payloads(season, validators=validators, **self.fetch_kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.fetches += 1
+                self.fetch_failures += failed
+                self.fetch_seconds_total += elapsed
+                self.last_fetch_seconds = elapsed
+
+        payloads = {}
+        changed = False
+        for pos, payload in fetched.items():
+            if payload["records"] is None and pos in stored:
+                payloads[pos] = stored[pos]
+            else:
+                payloads[pos] = payload
+                changed = True
+
+        multi_pool = build_multi_format_pool({pos: payload["records"] for pos, payload in payloads.items()})
+        fetched_at = self.clock()
+
+        if changed:
+            atomic_write(self._payload_path(season), lambda f: json.dump(payloads, f))
+        atomic_write(
+            self._pool_path(season),
+            lambda f: write_snapshot(multi_pool, f, meta={"fetched_at": fetched_at}),
+            binary=True,
+        )
+
+        with self._lock:
+            self._memory[season] = (multi_pool, fetched_at)
+        return self._view(season, scoring, multi_pool, fetched_at)
+
+    def refresh_in_background(self, season=2026):
+        """Start (at most one per season) background refresh thread."""
+        with self._lock:
+            if season in self._refreshing:
+                return self._refreshing[season]
+            thread = threading.Thread(
+                target=self._background_refresh, args=(season,), daemon=True, name=f"projection-refresh-{season}"
+            )
+            self._refreshing[season] = thread
+        thread.start()
+        return thread
+
+    def _background_refresh(self, season):
+        try:
+            self.refresh(season)
+        except Exception:
+            logger.warning("Background refresh of %s projections failed; keeping cached pool", season, exc_info=True)
+        finally:
+            with self._lock:
+                self._refreshing.pop(season, None)
+
+    def wait_for_refreshes(self, timeout=None):
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ProjectionCache()
+        return _default_cache
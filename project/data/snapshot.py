@@ -0,0 +1,207 @@
+"""Compact binary columnar snapshot of a normalized player pool.
+
+Parsing CSV/JSON into pandas is the dominant cost of materializing the pool
+at startup. A snapshot stores the same columns pre-parsed, so reading one is
+a handful of numpy.memmap views plus one small string table:
+
+    magic      8 bytes   b"FFPOOL\\x00\\x01"
+    hlen       4 bytes   little-endian uint32, length of the JSON header
+    header     hlen      utf-8 JSON: num_rows, columns, strings, meta
+    (padding to an 8-byte boundary -- the "data section" starts here)
+    columns    one fixed-width little-endian block per column
+    strings    uint32 offsets[count + 1] followed by the utf-8 blob
+
+Numeric columns are stored as-is (int64/float64). Text columns (Player,
+Team, Position) are stored as int32 codes into a single interned string
+table shared by all of them, so the hundreds of repeated team/position
+values cost four bytes a row. Code -1 means missing. Every block offset in
+the header is relative to the data section and 8-byte aligned, so each
+column can be mapped zero-copy (e.g. by worker processes) via
+`read_snapshot_columns`.
+
+`meta` is a free-form JSON dict the writer attaches -- the projection cache
+records `fetched_at` there, the static-CSV path records the source file's
+size and sha1 so a stale snapshot is never preferred over an edited CSV.
+"""
+
+import argparse
+import hashlib
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b"FFPOOL\x00\x01"
+SNAPSHOT_SUFFIX = ".ffpool"
+_HEADER_LEN = struct.Struct("<I")
+_ALIGN = 8
+
+
+def _align(n):
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _numeric_dtype(series):
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return np.dtype("<i8")
+    return np.dtype("<f8")
+
+
+def encode_snapshot(df, meta=None):
+    """Serialize `df` to snapshot bytes."""
+    strings = []
+    string_codes = {}
+
+    def intern(value):
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return -1
+        code = string_codes.get(value)
+        if code is None:
+            code = string_codes[value] = len(strings)
+            strings.append(value)
+        return code
+
+    blocks = []
+    columns = []
+    offset = 0
+    for name in df.columns:
+        series = df[name]
+        if pd.api.types.is_numeric_dtype(series):
+            dtype = _numeric_dtype(series)
+            data = series.to_numpy(dtype=dtype)
+            kind = "numeric"
+        else:
+            dtype = np.dtype("<i4")
+            data = np.fromiter((intern(v) for v in series.astype(object)), dtype=dtype, count=len(series))
+            kind = "string"
+        columns.append({"name": str(name), "kind": kind, "dtype": dtype.str, "offset": offset})
+        raw = data.tobytes()
+        blocks.append(raw + b"\0" * (_align(len(raw)) - len(raw)))
+        offset += _align(len(raw))
+
+    encoded = [s.encode("utf-8") for s in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(b) for b in encoded], out=string_offsets[1:])
+    strings_offset = offset
+    blocks.append(string_offsets.tobytes())
+    blocks.append(b"".join(encoded))
+
+    header = json.dumps(
+        {
+            "num_rows": len(df),
+            "columns": columns,
+            "strings": {"offset": strings_offset, "count": len(strings)},
+            "meta": meta or {},
+        }
+    ).encode("utf-8")
+    preamble = MAGIC + _HEADER_LEN.pack(len(header)) + header
+    preamble += b"\0" * (_align(len(preamble)) - len(preamble))
+    return preamble + b"".join(blocks)
+
+
+def write_snapshot(df, fileobj, meta=None):
+    """Write a snapshot of `df` to a binary file object."""
+    fileobj.write(encode_snapshot(df, meta))
+
+
+def _parse_preamble(buf, path):
+    if bytes(buf[:len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} is not a player-pool snapshot")
+    (header_len,) = _HEADER_LEN.unpack(bytes(buf[len(MAGIC):len(MAGIC) + _HEADER_LEN.size]))
+    header_start = len(MAGIC) + _HEADER_LEN.size
+    header = json.loads(bytes(buf[header_start:header_start + header_len]).decode("utf-8"))
+    return header, _align(header_start + header_len)
+
+
+def read_snapshot_header(path):
+    """Return (header dict, data-section byte offset) without mapping any
+    column data -- cheap enough to call just to check `meta` freshness.
+    """
+    with open(path, "rb") as f:
+        preamble = f.read(len(MAGIC) + _HEADER_LEN.size)
+        if len(preamble) == len(MAGIC) + _HEADER_LEN.size:
+            (header_len,) = _HEADER_LEN.unpack(preamble[len(MAGIC):])
+            preamble += f.read(header_len)
+    return _parse_preamble(preamble, path)
+
+
+def _map_snapshot(path):
+    # One mapping of the whole file; every column is a typed view into it.
+    buf = np.memmap(path, dtype=np.uint8, mode="r")
+    header, data_start = _parse_preamble(buf, path)
+    num_rows = header["num_rows"]
+
+    columns = {}
+    for col in header["columns"]:
+        dtype = np.dtype(col["dtype"])
+        start = data_start + col["offset"]
+        columns[col["name"]] = buf[start:start + num_rows * dtype.itemsize].view(dtype)
+
+    count = header["strings"]["count"]
+    offsets_start = data_start + header["strings"]["offset"]
+    blob_start = offsets_start + (count + 1) * 4
+    offsets = buf[offsets_start:blob_start].view("<u4").tolist()
+    blob = bytes(buf[blob_start:blob_start + offsets[-1]])
+    strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+    return header, columns, strings
+
+
+def read_snapshot_columns(path):
+    """Map a snapshot without copying.
+
+    Returns (columns, strings, meta): `columns` maps name -> read-only
+    numpy.memmap view (string columns are their int32 codes), `strings` is
+    the decoded interned table those codes index into.
+    """
+    header, columns, strings = _map_snapshot(path)
+    return columns, strings, header["meta"]
+
+
+def read_snapshot(path):
+    """Materialize a snapshot as a DataFrame with the original column order.
+    Returns (DataFrame, meta).
+    """
+    header, columns, strings = _map_snapshot(path)
+
+    # One trailing None so code -1 (missing) indexes to it.
+    table = np.array(strings + [None], dtype=object)
+    data = {}
+    for col in header["columns"]:
+        values = columns[col["name"]]
+        data[col["name"]] = table[values] if col["kind"] == "string" else np.array(values)
+    return pd.DataFrame(data), header["meta"]
+
+
+def file_fingerprint(path):
+    """Size + sha1 of a source file; hashing a CSV is far cheaper than
+    parsing it, and unlike mtime survives being copied into an app bundle.
+    """
+    data = Path(path).read_bytes()
+    return {"source_size": len(data), "source_sha1": hashlib.sha1(data).hexdigest()}
+
+
+def snapshot_path_for(source_path):
+    return Path(source_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Build a binary player-pool snapshot from a CSV.")
+    parser.add_argument("source", type=Path, help="Player pool CSV (e.g. project/data/cleaned_data.csv)")
+    parser.add_argument("dest", type=Path, nargs="?", help="Output path (default: source with .ffpool suffix)")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    dest = args.dest or snapshot_path_for(args.source)
+    df = pd.read_csv(args.source)
+    with open(dest, "wb") as f:
+        write_snapshot(df, f, meta=file_fingerprint(args.source))
+    print(f"Wrote {len(df)} rows to {dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -70,3 +70,14 @@ class LeagueConfig:
             pos: max(1, round(self.num_teams * starters[pos] * self.bench_multiplier.get(pos, 1.0)))
             for pos in DIRECT_POSITIONS
         }
+
+
+def setup_defaults():
+    """What the webapp's setup screen pre-fills: a default LeagueConfig."""
+    config = LeagueConfig()
+    return {
+        "roster_slots": config.roster_slots,
+        "bench_slots": config.bench_slots,
+        "num_teams": config.num_teams,
+        "scoring": config.scoring,
+    }
@@ -1,7 +1,9 @@
 import numpy as np
 
+from project.data.live_rankings import ID_COLUMN
 from project.data.loader import load_player_pool
 from project.draft.config import DIRECT_POSITIONS, LeagueConfig
+from project.draft.player_index import PlayerIndex
 
 # Positional value multiplier by draft-round bucket: early rounds favor RB/WR
 # over QB/K/DST, middle rounds start valuing QB more, late rounds flatten out.
@@ -35,14 +37,27 @@ class GreedyDraftAssistant:
         if is_ours and position in self.roster_filled:
             self.roster_filled[position] += 1
 
+    def unrecord_pick(self, position, is_ours):
+        """Inverse of record_pick, for undo."""
+        if is_ours and position in self.roster_filled:
+            self.roster_filled[position] -= 1
+
     def establish_replacement_baselines(self, full_player_pool):
         self.baseline_ranks = {}
         self.baseline_points = {}
         self.baseline_counts = {}
+        self.update_replacement_baselines(full_player_pool, DIRECT_POSITIONS)
 
+    def update_replacement_baselines(self, full_player_pool, positions):
+        """Recompute the baselines for `positions` only -- each position's
+        baseline depends solely on that position's players, so a projection
+        refresh that touched two positions doesn't redo the other four.
+        """
         replacement_levels = self.league_config.replacement_levels()
 
-        for pos in DIRECT_POSITIONS:
+        for pos in positions:
+            if pos not in replacement_levels:
+                continue
             pos_players = full_player_pool.loc[full_player_pool["Position"] == pos]
             pos_players = pos_players.sort_values("Rank")
 
@@ -152,6 +167,9 @@ class DraftEnv:
         self.num_rounds = self.league_config.num_rounds
         self.initial_pick = initial_pick
         self.recommender = GreedyDraftAssistant(full_player_pool, self.league_config)
+        self.players = PlayerIndex(full_player_pool)
+        self.available_players = full_player_pool
+        self.available_ids = set(self.players.ids.tolist())
 
         self.get_pick_positions()
 
@@ -167,19 +185,25 @@ class DraftEnv:
                 else:
                     self.pick_positions += [n * self.num_players + (self.num_players - self.initial_pick) + 1]
 
-    def apply_pick(self, player_name, is_ours):
-        """Non-interactive pick application: looks up the player's position
-        before removing them from the pool, records it against our roster
-        (if it's our pick), and filters them out of available_players.
+    def apply_pick(self, player, is_ours):
+        """Non-interactive pick application. `player` is a player_id or a
+        display name (see PlayerIndex.resolve_available), so two players
+        sharing a name are drafted one at a time. Records the pick's
+        position against our roster (if it's ours) and removes exactly that
+        player from available_players; raises ValueError if they aren't
+        available.
         """
-        row = self.available_players.loc[self.available_players["Player"] == player_name].iloc[0]
+        player_id = self.players.resolve_available(player, self.available_ids)
+        row = self.players.row(player_id)
         self.recommender.record_pick(row["Position"], is_ours)
-        self.available_players = self.available_players[self.available_players["Player"] != player_name]
+        self.available_ids.discard(player_id)
+        self.available_players = self.available_players[self.available_players[ID_COLUMN] != player_id]
         return row
 
     def draft(self):
         self.round_num = 1
         self.available_players = self.all_players
+        self.available_ids = set(self.players.ids.tolist())
         print(f"------\nSTARTING ROUND {self.round_num}\n------")
         max_picks = self.num_players * self.num_rounds
         for p in range(1, max_picks):
@@ -188,25 +212,23 @@ class DraftEnv:
                 while True:
                     print("Greedy Recommendation:", self.recommender.get_best_player(self.available_players, self.round_num))
                     selection = input("\nSelect a player to draft:\n")
-                    if selection in self.available_players["Player"].values:
+                    try:
                         self.apply_pick(selection, is_ours=True)
-                        print(f"{selection} has been drafted.")
-                        break
-                    elif selection in self.all_players["Player"].values:
-                        print("Player already selected. Please select again.")
-                    else:
-                        print("Player not found. Please select again.")
+                    except ValueError as e:
+                        print(f"{e} Please select again.")
+                        continue
+                    print(f"{selection} has been drafted.")
+                    break
             else:
                 while True:
                     opponent_selection = input("What did your opponent draft?:\n")
-                    if opponent_selection in self.available_players["Player"].values:
+                    try:
                         self.apply_pick(opponent_selection, is_ours=False)
-                        print(f"{opponent_selection} has been drafted by your opponent.")
-                        break
-                    elif opponent_selection in self.all_players["Player"].values:
-                        print("Player already selected. Please select again.")
-                    else:
-                        print("Player not found. Please select again.")
+                    except ValueError as e:
+                        print(f"{e} Please select again.")
+                        continue
+                    print(f"{opponent_selection} has been drafted by your opponent.")
+                    break
 
             if p % self.num_players == 0:
                 self.round_num += 1
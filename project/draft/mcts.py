@@ -3,8 +3,10 @@ import random
 import copy
 import time
 
+from project.data.live_rankings import ID_COLUMN
 from project.data.loader import load_player_pool
 from project.draft.config import LeagueConfig
+from project.draft.player_index import PlayerIndex
 from project.draft.scoring import compute_roster_value
 
 
@@ -85,17 +87,20 @@ class GameState:
         available = self.available_players.copy()
         available = available.sort_values('Rank').head(30)
 
-        return available['Player'].to_list()
+        return available[ID_COLUMN].to_list()
 
     def make_move(self, action):
-        if action not in self.available_players['Player'].values:
+        """`action` is a player_id -- one integer comparison over the id
+        column instead of string-matching display names."""
+        is_action = self.available_players[ID_COLUMN].to_numpy() == action
+        if not is_action.any():
             raise ValueError(f"Player {action} not available")
 
         new_rosters = copy.deepcopy(self.rosters)
 
-        new_rosters[self.current_player].append(self.available_players.loc[self.available_players["Player"] == action].iloc[0])
+        new_rosters[self.current_player].append(self.available_players.iloc[is_action.argmax()])
 
-        new_available = self.available_players[self.available_players['Player'] != action].copy()
+        new_available = self.available_players[~is_action].copy()
 
         new_pick = self.current_pick + 1
         new_round = self.current_round
@@ -128,20 +133,28 @@ class MCTS:
     def __init__(self, exploration_constant=1.414):
         self.exploration_constant = exploration_constant
 
-    def search(self, initial_state, time_limit=30):
+    def search(self, initial_state, time_limit=30, max_iterations=None):
         """Main MCTS search function"""
-        root = self.search_and_return_root(initial_state, time_limit)
+        root = self.search_and_return_root(initial_state, time_limit, max_iterations)
         return self._get_best_action(root)
 
-    def search_and_return_root(self, initial_state, time_limit=30):
+    def search_and_return_root(self, initial_state, time_limit=30, max_iterations=None):
         """Runs the search loop and returns the root node (visit counts on
         root.children are what root-parallelization merges across workers).
+
+        max_iterations additionally caps the number of playouts, so a search
+        can be given a fixed amount of work (benchmarks, reproducible tests)
+        rather than a wall-clock budget.
         """
         root = MCTSNode(initial_state)
         root.untried_actions = initial_state.get_legal_actions()
 
         start_time = time.time()
+        iterations = 0
         while time.time() - start_time < time_limit:
+            if max_iterations is not None and iterations >= max_iterations:
+                break
+            iterations += 1
             # 1. Selection + Expansion
             node = self._select_and_expand(root)
 
@@ -229,14 +242,28 @@ class MCTSDraftAssistant:
         self.mcts = MCTS(exploration_constant)
         self.exploration_constant = exploration_constant
 
+    def set_player_pool(self, full_player_pool):
+        """Point the assistant at a refreshed pool. Searches are built from
+        the caller's state on every call, so there is no tree to invalidate."""
+        self.full_player_pool = full_player_pool
+
     def get_best_pick(self, available_players, current_pick, current_round,
                      rosters, current_player):
-        """Use MCTS to find the best pick. Dispatches to the parallel
+        """Use MCTS to find the best pick, returned as a player_id (None if
+        the search produced nothing). Dispatches to the parallel
         root-parallelized search by default, or the single-tree search when
         parallel=False (kept available for debugging/tests)."""
+        visits = self.search_visit_counts(available_players, current_pick, current_round, rosters, current_player)
+        return best_action(visits)
+
+    def search_visit_counts(self, available_players, current_pick, current_round,
+                            rosters, current_player):
+        """Root visit counts ({player_id: playouts through that pick}) from
+        one full search -- what get_best_pick chooses from, kept so callers
+        can report or accumulate playout counts."""
         if self.parallel:
-            from project.draft.mcts_parallel import get_best_pick_parallel
-            return get_best_pick_parallel(
+            from project.draft.mcts_parallel import search_visit_counts_parallel
+            return search_visit_counts_parallel(
                 available_players, self.league_config, self.initial_pick,
                 current_pick, current_round, rosters, current_player,
                 self.exploration_constant, self.time_limit, self.num_workers,
@@ -246,7 +273,15 @@ class MCTSDraftAssistant:
             available_players, self.league_config, self.initial_pick,
             current_pick, current_round, rosters, current_player
         )
-        return self.mcts.search(state, self.time_limit)
+        root = self.mcts.search_and_return_root(state, self.time_limit)
+        return {action: child.visits for action, child in root.children.items()}
+
+
+def best_action(visit_counts):
+    """Most-visited action (the robust-child rule), or None if empty."""
+    if not visit_counts:
+        return None
+    return max(visit_counts, key=visit_counts.get)
 
 
 class MCTSDraftEnv:
@@ -264,7 +299,9 @@ class MCTSDraftEnv:
             exploration_constant, mcts_time_limit, parallel=parallel,
         )
 
+        self.players = PlayerIndex(full_player_pool)
         self.available_players = full_player_pool.copy()
+        self.available_ids = set(self.players.ids.tolist())
         self.rosters = {i: [] for i in range(self.num_players)}
         self.current_pick = 1
         self.current_round = 1
@@ -301,23 +338,25 @@ class MCTSDraftEnv:
         else:
             return pick_in_round
 
-    def make_pick(self, player_name, is_our_pick=False):
-        """Record a pick and update state"""
-        if player_name not in self.available_players['Player'].values:
-            raise ValueError(f"Player {player_name} not available")
-
+    def make_pick(self, player, is_our_pick=False):
+        """Record a pick and update state. `player` is a player_id or a
+        display name (see PlayerIndex.resolve_available); raises ValueError
+        if that player isn't available."""
+        player_id = self.players.resolve_available(player, self.available_ids)
+        self.available_ids.discard(player_id)
         self.available_players = self.available_players[
-            self.available_players['Player'] != player_name
+            self.available_players[ID_COLUMN] != player_id
         ]
 
+        row = self.players.row(player_id)
         current_player = self.get_current_player()
         if current_player >= 0:
-            self.rosters[current_player].append(self.all_players.loc[self.all_players["Player"] == player_name].iloc[0])
+            self.rosters[current_player].append(row)
 
         self.current_pick += 1
         self.current_round = ((self.current_pick - 1) // self.num_players) + 1
 
-        print(f"Pick {self.current_pick - 1}: {player_name} "
+        print(f"Pick {self.current_pick - 1}: {row['Player']} "
               f"({'Our pick' if is_our_pick else 'Opponent pick'})")
 
     def get_mcts_recommendation(self):
@@ -328,8 +367,10 @@ class MCTSDraftEnv:
             self.available_players, self.current_pick, self.current_round,
             self.rosters, current_player
         )
+        if recommendation is None:
+            return None
 
-        return recommendation
+        return self.players.name(recommendation)
 
     def run_draft(self):
         """Run a draft simulation with MCTS recommendations"""
@@ -344,30 +385,26 @@ class MCTSDraftEnv:
                 recommendation = self.get_mcts_recommendation()
                 print(f"\nRound {self.current_round}, Pick {self.current_pick}")
                 print(f"MCTS Recommendation: {recommendation}")
-                selection = input("\nSelect a player to draft:\n")
                 while True:
-                    if selection in self.available_players["Player"].values:
+                    selection = input("\nSelect a player to draft:\n")
+                    try:
                         self.make_pick(selection, is_our_pick=True)
-
-                        print(f"{selection} has been drafted.")
-                        break
-                    elif selection in self.all_players["Player"].values:
-                        print("Player already selected. Please select again.")
-                    else:
-                        print("Player not found. Please select again.")
+                    except ValueError as e:
+                        print(f"{e} Please select again.")
+                        continue
+                    print(f"{selection} has been drafted.")
+                    break
 
             else:
                 while True:
                     opponent_selection = input("What did your opponent draft?:\n")
-                    if opponent_selection in self.available_players["Player"].values:
+                    try:
                         self.make_pick(opponent_selection, is_our_pick=False)
-
-                        print(f"{opponent_selection} has been drafted by your opponent.")
-                        break
-                    elif opponent_selection in self.all_players["Player"].values:
-                        print("Player already selected. Please select again.")
-                    else:
-                        print("Player not found. Please select again.")
+                    except ValueError as e:
+                        print(f"{e} Please select again.")
+                        continue
+                    print(f"{opponent_selection} has been drafted by your opponent.")
+                    break
 
         print("\nDraft Complete!")
         print(f"Our final roster: {self.rosters[self.initial_pick - 1]}")
@@ -7,17 +7,32 @@ faster answers or more total playouts within the same wall-clock budget.
 
 Kept in its own module (separate from mcts.py) to isolate multiprocessing/
 pickling-specific code from the core search logic.
+
+Worker processes are kept alive between searches (one pool per worker
+count). Under macOS's "spawn" start method every new worker re-imports
+pandas/numpy/this package, which costs more than a short search itself;
+`warm_up_workers` starts and primes the pool ahead of the first request.
+
+Concurrent searches (several web sessions asking at once) share that pool.
+Each tree holds its worker for the whole time budget, so a search that
+queued behind another's trees would take a multiple of its time limit.
+Instead a search runs `num_workers // searches_in_flight` trees, and the
+pool has headroom for MAX_CONCURRENT_SEARCHES of them to run side by side --
+they split the CPUs (fewer playouts each) but all answer on time.
 """
 
 import os
 import random
+import threading
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from project.draft.mcts import GameState, MCTS
 
 
 def merge_visit_counts(visit_count_dicts):
-    """Sum per-action visit counts across multiple trees' root children."""
+    """Sum per-action (player_id) visit counts across multiple trees' root
+    children."""
     merged = {}
     for counts in visit_count_dicts:
         for action, visits in counts.items():
@@ -25,6 +40,70 @@ def merge_visit_counts(visit_count_dicts):
     return merged
 
 
+MAX_CONCURRENT_SEARCHES = 4
+
+_executors = {}  # num_workers -> ProcessPoolExecutor
+_in_flight = {}  # num_workers -> searches currently running on that pool
+_executors_lock = threading.Lock()
+
+
+def get_executor(num_workers):
+    """The long-lived process pool for `num_workers` workers per search.
+    It holds MAX_CONCURRENT_SEARCHES times that many processes, the
+    headroom for concurrent searches (started on demand, except under
+    "fork" where the executor starts them all up front)."""
+    with _executors_lock:
+        executor = _executors.get(num_workers)
+        if executor is None:
+            executor = _executors[num_workers] = ProcessPoolExecutor(
+                max_workers=num_workers * MAX_CONCURRENT_SEARCHES
+            )
+        return executor
+
+
+def _claim_trees(num_workers):
+    """Register a search on the `num_workers` pool; returns how many trees
+    it should run so it shares the CPUs with the searches already running."""
+    with _executors_lock:
+        active = _in_flight[num_workers] = _in_flight.get(num_workers, 0) + 1
+    return max(1, num_workers // active)
+
+
+def _release_trees(num_workers):
+    with _executors_lock:
+        _in_flight[num_workers] -= 1
+
+
+def _discard_executor(num_workers, executor):
+    with _executors_lock:
+        if _executors.get(num_workers) is executor:
+            del _executors[num_workers]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _warm_worker(_):
+    # Unpickling this function already imported this module (and with it
+    # mcts.py, pandas and numpy) in the worker; nothing else to do.
+    return os.getpid()
+
+
+def warm_up_workers(num_workers=None):
+    """Spawn every worker of the default pool and wait until each has
+    imported the search code. Returns the number of distinct workers that
+    answered."""
+    num_workers = num_workers or os.cpu_count() or 1
+    executor = get_executor(num_workers)
+    return len(set(executor.map(_warm_worker, range(num_workers))))
+
+
+def shutdown_workers():
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _run_single_search(args):
     """Must be a module-level function (not a closure/bound method) so
     ProcessPoolExecutor can pickle it as the worker target."""
@@ -43,23 +122,41 @@ def _run_single_search(args):
     return {action: child.visits for action, child in root.children.items()}
 
 
-def get_best_pick_parallel(available_players, league_config, initial_pick, current_pick,
-                            current_round, rosters, current_player, exploration_constant,
-                            time_limit, num_workers=None):
+def search_visit_counts_parallel(available_players, league_config, initial_pick, current_pick,
+                                 current_round, rosters, current_player, exploration_constant,
+                                 time_limit, num_workers=None):
+    """Merged root visit counts ({player_id: visits}) across all workers."""
     num_workers = num_workers or os.cpu_count() or 1
+    num_trees = _claim_trees(num_workers)
 
     # Each worker gets the FULL time budget, not a divided share -- that's
     # the point of root parallelization: same wall clock, more total playouts.
     args_list = [
         (available_players, league_config, initial_pick, current_pick, current_round,
          rosters, current_player, exploration_constant, time_limit, seed)
-        for seed in range(num_workers)
+        for seed in range(num_trees)
     ]
 
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+    executor = get_executor(num_workers)
+    try:
         results = list(executor.map(_run_single_search, args_list))
+    except BrokenProcessPool:
+        # A worker died (e.g. killed by the OS); start a fresh pool once.
+        _discard_executor(num_workers, executor)
+        results = list(get_executor(num_workers).map(_run_single_search, args_list))
+    finally:
+        _release_trees(num_workers)
+
+    return merge_visit_counts(results)
 
-    merged = merge_visit_counts(results)
+
+def get_best_pick_parallel(available_players, league_config, initial_pick, current_pick,
+                            current_round, rosters, current_player, exploration_constant,
+                            time_limit, num_workers=None):
+    merged = search_visit_counts_parallel(
+        available_players, league_config, initial_pick, current_pick, current_round,
+        rosters, current_player, exploration_constant, time_limit, num_workers,
+    )
     if not merged:
         return None
     return max(merged, key=merged.get)
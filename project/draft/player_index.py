@@ -0,0 +1,69 @@
+"""Integer-id lookup table over one immutable full player pool.
+
+Players used to be identified by display name everywhere, with every pick,
+undo and MCTS move doing a full-column `df["Player"] == name` string scan --
+and two players sharing a name would silently collide. A PlayerIndex is
+built once per pool and shared by the draft session, the MCTS assistant and
+the API: ids resolve to pool rows in O(1), and names are only consulted at
+the edge, to turn user input into an id.
+"""
+
+import numbers
+
+import numpy as np
+
+from project.data.live_rankings import ID_COLUMN
+
+
+class PlayerIndex:
+    def __init__(self, full_player_pool):
+        self.pool = full_player_pool
+        self.ids = full_player_pool[ID_COLUMN].to_numpy(dtype=np.int64)
+        self._row_of = {int(pid): i for i, pid in enumerate(self.ids)}
+        if len(self._row_of) != len(self.ids):
+            raise ValueError("player_id values must be unique within a player pool")
+
+        # name -> ids, in pool (Rank) order, so an ambiguous name resolves to
+        # the highest-ranked matching player.
+        self._ids_by_name = {}
+        for name, pid in zip(full_player_pool["Player"], self.ids):
+            self._ids_by_name.setdefault(name, []).append(int(pid))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, player_id):
+        return player_id in self._row_of
+
+    def position(self, player_id):
+        """0-based row position of `player_id` in the pool."""
+        try:
+            return self._row_of[player_id]
+        except KeyError:
+            raise KeyError(f"Unknown player_id: {player_id}") from None
+
+    def row(self, player_id):
+        return self.pool.iloc[self.position(player_id)]
+
+    def name(self, player_id):
+        return self.pool["Player"].iat[self.position(player_id)]
+
+    def ids_for_name(self, name):
+        return self._ids_by_name.get(name, [])
+
+    def resolve_available(self, player, available_ids):
+        """Id of the player in `available_ids` that `player` -- an integer
+        player_id or an exact display name -- refers to. A shared name
+        resolves to the highest-ranked one still available. Raises
+        ValueError if there's no such player or they've been drafted.
+        """
+        if isinstance(player, numbers.Integral) and not isinstance(player, bool):
+            candidates = [int(player)] if int(player) in self else []
+        else:
+            candidates = self.ids_for_name(player)
+        if not candidates:
+            raise ValueError("Player not found.")
+        for player_id in candidates:
+            if player_id in available_ids:
+                return player_id
+        raise ValueError("Player already selected.")
@@ -1,8 +1,18 @@
-from data_generation import generate_data
+import sys
+from pathlib import Path
+
+# `streamlit run project/management/dashboard.py` only puts this directory on
+# sys.path; data_generation also needs the repo root for project.data.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from data_generation import load_flag_cube
 from dashboard_utils import render
+from waiver import WaiverRanker, load_projections, parse_roster
 
+import pandas as pd
 import streamlit as st
-import math
 
 week = st.number_input("Select Week:", min_value = 1, max_value = 18, step = 1)
 
@@ -19,42 +29,47 @@ if opponent_roster_file is not None:
 else:
     opponent_roster_input = opponent_roster_text
 
-@st.cache_data
+@st.cache_resource
+def load_cube():
+    # Every week's flags, computed once and shared by every session of this
+    # server (see data_generation.load_flag_cube).
+    return load_flag_cube(2025)
+
+@st.cache_resource
+def load_ranker():
+    cube = load_cube()
+    return WaiverRanker(cube, load_projections(cube.players))
+
 def load_data(week):
-    return generate_data(2025, week)
+    return load_cube().frame(week)
 
+cube = load_cube()
 df = load_data(week)
+your_roster = parse_roster(your_roster_input)
+rostered = your_roster | parse_roster(opponent_roster_input)
 
-if your_roster_input:
-    your_roster_list = [name.strip() for name in your_roster_input.split("\n") if name.strip()]
-
-    team_df = df[df["Player"].isin(your_roster_list)]
+if your_roster:
+    team_df = df.iloc[cube.player_rows(your_roster)]
     team_df = team_df[["Player", "Position", "Team", "favored_flag", "pace_flag", "consistency_flag"]]
 
     st.title(f"Your Team - Week {int(week)}")
 
-    team_df = team_df.rename(columns = {
-        "favored_flag": "favored",
-        "pace_flag": "pace",
-        "consistency_flag": "consistent"
-    })
-    render(team_df)
+    render(team_df, key="team_page")
 else:
     pass
 
 if df is not None:
+    st.title(f"Top Pickups - Week {int(week)}")
+    st.dataframe(load_ranker().rank(week, rostered, k=3), hide_index=True)
+
     st.title(f"Waiver - Week {int(week)}")
-    waiver_df = df
-    if your_roster_input:
-        waiver_df = waiver_df[~waiver_df["Player"].isin(your_roster_list)]
-    if opponent_roster_input:
-        opponent_roster_list = [name.strip() for name in opponent_roster_input.split("\n") if name.strip()]
-        waiver_df = waiver_df[~waiver_df["Player"].isin(opponent_roster_list)]
+    waiver_rows = cube.select(week, exclude=rostered)
+    position_options = pd.unique(cube.players["Position"].to_numpy()[waiver_rows])
 
     positions = st.multiselect(
         "Filter by Position",
-        options=waiver_df["Position"].unique(),
-        default=waiver_df["Position"].unique()
+        options=position_options,
+        default=position_options
     )
 
     avoid_neutral = st.checkbox("Don't show players without tags")
@@ -73,30 +88,23 @@ if df is not None:
         upcoming_favored_only = st.checkbox("Show only players who are favored in their next few games")
         playoff_favored_only = st.checkbox("Show only players who are favored in their playoff games")
 
-    filtered_data = waiver_df[waiver_df["Position"].isin(positions)]
-
-    if favored_only:
-        filtered_data = filtered_data[filtered_data["favored_flag"] == 1]
-    if pace_only:
-        filtered_data = filtered_data[filtered_data["pace_flag"] == 1]
-    if points_trending_up_only:
-        filtered_data = filtered_data[filtered_data["fpts_trend_flag"] == 1]
-    if consistency_only:
-        filtered_data = filtered_data[filtered_data["consistency_flag"] == 1]
-    if upcoming_favored_only:
-        filtered_data = filtered_data[filtered_data["upcoming_favored_flag"] == 1]
-    if playoff_favored_only:
-        filtered_data = filtered_data[filtered_data["playoff_favored_flag"] == 1]
-
-    filtered_data = filtered_data.rename(columns = {
-        "favored_flag": "favored",
-        "pace_flag": "pace",
-        "consistency_flag": "consistent",
-        "upcoming_favored_flag": "strong upcoming schedule",
-        "playoff_favored_flag": "strong playoff schedule"
-    })
-
-    render(filtered_data, avoid_neutral)
+    # Every checked box is one more bit in a single mask AND over the
+    # week's precomputed flag bitmasks (see FlagCube.select).
+    required = [
+        col
+        for col, checked in [
+            ("favored_flag", favored_only),
+            ("pace_flag", pace_only),
+            ("fpts_trend_flag", points_trending_up_only),
+            ("consistency_flag", consistency_only),
+            ("upcoming_favored_flag", upcoming_favored_only),
+            ("playoff_favored_flag", playoff_favored_only),
+        ]
+        if checked
+    ]
+    rows = cube.select(week, require=required, tagged_only=avoid_neutral, positions=positions, exclude=rostered)
+
+    render(df, rows, key="waiver_page")
 
 else:
-    st.warning(f"Waiver - Week {int(week)}")
\ No newline at end of file
+    st.warning(f"Waiver - Week {int(week)}")
@@ -1,13 +1,23 @@
 import math
+
+import numpy as np
 import streamlit as st
 
-def render(df, avoid_neutral=False):
-    tag_columns = df.columns[3:]
-    def has_tag(row):
-        return any(int(row[col]) in [-1, 1] for col in tag_columns)
-    
-    if avoid_neutral:
-        df = df[df.apply(has_tag, axis=1)].reset_index(drop=True)
+# Display names for the flag columns, applied to the visible page only.
+TAG_LABELS = {
+    "favored_flag": "favored",
+    "pace_flag": "pace",
+    "consistency_flag": "consistent",
+    "upcoming_favored_flag": "strong upcoming schedule",
+    "playoff_favored_flag": "strong playoff schedule",
+}
+
+def render(df, rows=None, key="page"):
+    # Shows the players at `rows` (positions in df; all of df by default),
+    # five per page. Filtering happens before this, so only the visible
+    # page is sliced, renamed and turned into HTML.
+    if rows is None:
+        rows = np.arange(len(df))
 
     def render_tag(name, value):
         color = {
@@ -16,24 +26,24 @@ def render(df, avoid_neutral=False):
         }[value]
 
         return f'<span style="background-color: {color}; padding: 4px 8px; border-radius: 12px; margin-right: 6px;">{name}</span>'
-    
+
     players_per_page = 5
-    num_pages = math.ceil(len(df) / players_per_page)
-    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1)
+    num_pages = max(1, math.ceil(len(rows) / players_per_page))
+    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1, key=key)
 
     start = (page - 1) * players_per_page
     end = start + players_per_page
-    
-    for _, row in df.iloc[start:end].iterrows():
-        tags_html = ""
-        for col in df.columns[3:]:
-            if row[col] != 0:
-                tags_html += render_tag(col, row[col])
-        
+    page_df = df.iloc[rows[start:end]].rename(columns=TAG_LABELS)
+    columns = list(page_df.columns)
+
+    for values in page_df.itertuples(index=False, name=None):
+        row = dict(zip(columns, values))
+        tags_html = "".join(render_tag(col, value) for col, value in zip(columns[3:], values[3:]) if value != 0)
+
         player_block = f"""
         <div style="border: 1px solid #ccc; border-radius: 12px; padding: 12px; margin-bottom: 10px;">
             <strong>{row['Player']}, {row['Team']}, {row['Position']}</strong><br>
             {tags_html}
         </div>
         """
-        st.markdown(player_block, unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown(player_block, unsafe_allow_html=True)
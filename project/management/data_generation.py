@@ -1,246 +1,427 @@
-import nfl_data_py as nfl
+import argparse
+import hashlib
+import json
+
 import pandas as pd
 import numpy as np
 
+PLAYERS_CSV = "./project/data/cleaned_data.csv"
+# nflverse schedules use LA/WAS; the player data uses LAR/WSH.
+TEAM_CODE_FIXES = {"LA": "LAR", "WAS": "WSH"}
+# Completed weeks the trend/consistency flags look back over.
+TREND_WINDOW = 6
+SEASON_WEEKS = list(range(1, 19))
+PLAYOFF_WEEKS = [15, 16, 17, 18]
+FLAG_COLUMNS = [
+    "favored_flag",
+    "pace_flag",
+    "fpts_trend_flag",
+    "consistency_flag",
+    "upcoming_favored_flag",
+    "playoff_favored_flag",
+]
+
 def import_player_data():
-    player_list = pd.read_csv("./project/data/cleaned_data.csv")
+    player_list = pd.read_csv(PLAYERS_CSV)
     player_df = player_list[["Player", "Team", "Position"]]
 
     player_df = player_df[player_df["Team"] != "FA"]
 
     return player_df
 
+def nflverse_source():
+    # Schedules and weekly stats are read from the local store (see
+    # project/data/nflverse_store.py), which only goes to nfl_data_py for a
+    # season it hasn't ingested yet. Same functions as nfl_data_py.
+    from project.data.nflverse_store import get_default_store
+
+    return get_default_store()
+
+def load_schedule(year):
+    # Loaded once per generate_data run and shared by every schedule-based
+    # feature below.
+    schedule = nflverse_source().import_schedules([year])
+    return normalize_team_codes(schedule)
+
+def normalize_team_codes(schedule):
+    schedule = schedule.copy()
+    for col in ["home_team", "away_team"]:
+        schedule[col] = schedule[col].replace(TEAM_CODE_FIXES)
+    return schedule
+
+def join_team_flags(df, team_flags, columns):
+    # Left join of per-team flags onto players; players whose team has no
+    # flag (bye week, FA) get 0.
+    joined = df[["Team"]].join(team_flags[columns], on="Team")
+    return joined[columns].fillna(0).astype("int64")
+
 # sit/play features
-def get_vegas_odds(df, year, week):
-    odds = nfl.import_schedules([year])
-    odds = odds.loc[odds["week"] == week]
-    odds = odds[["home_team",
-                "away_team",
-                "total_line", 
-                "spread_line"]]
-    
-    team_features = []
-    for idx, row in odds.iterrows():
-        d_home = {}
-        d_home["team"] = row["home_team"]
-
-        d_away = {}
-        d_away["team"] = row["away_team"]
-
-        t = row["total_line"]
-        s = row["spread_line"]
-
-        if s < -6:
-            d_home["favored"] = 1
-            d_away["favored"] = -1
-        elif s > 6:
-            d_home["favored"] = -1
-            d_away["favored"] = 1
-        else:
-            d_home["favored"] = 0
-            d_away["favored"] = 0
-
-        if t >= 49:
-            d_home["pace"] = 1
-            d_away["pace"] = 1
-        elif t <= 42:
-            d_home["pace"] = -1
-            d_away["pace"] = -1
-        else:
-            d_home["pace"] = 0
-            d_away["pace"] = 0
-
-        team_features.append(d_home)
-        team_features.append(d_away)
-    team_odds = pd.DataFrame(team_features)
-    team_odds.loc[team_odds["team"] == "LA", "team"] = "LAR"
-    team_odds.loc[team_odds["team"] == "WAS", "team"] = "WSH"
-
-    df["favored_flag"] = 0
-    df["pace_flag"] = 0
-    for idx, player in df.iterrows():
-        team_row = team_odds.loc[team_odds["team"] == player["Team"]].iloc[0]
-
-        favored_flag = team_row["favored"]
-
-        if team_row["pace"] == 0:
-            pace_flag = 0
-        elif team_row["pace"] == 1:
-            if player["Position"] == "DST":
-                pace_flag = -1
-            else:
-                pace_flag = 1
-        else:
-            if player["Position"] == "DST":
-                pace_flag = 1
-            else:
-                pace_flag = -1
-
-        df.at[idx, "favored_flag"] = favored_flag
-        df.at[idx, "pace_flag"] = pace_flag
+def get_vegas_odds(df, year, week, schedule=None):
+    if schedule is None:
+        schedule = load_schedule(year)
+    odds = schedule.loc[schedule["week"] == week]
+
+    t = odds["total_line"]
+    s = odds["spread_line"]
+    home_favored = np.select([s < -6, s > 6], [1, -1], 0)
+    pace = np.select([t >= 49, t <= 42], [1, -1], 0)
+
+    home = pd.DataFrame({"team": odds["home_team"], "favored": home_favored, "pace": pace})
+    away = pd.DataFrame({"team": odds["away_team"], "favored": -home_favored, "pace": pace})
+    # Home then away for each game, first game wins for a team listed twice.
+    team_odds = pd.concat([home, away]).sort_index(kind="stable")
+    team_odds = team_odds.drop_duplicates("team").set_index("team")
+
+    flags = join_team_flags(df, team_odds, ["favored", "pace"])
+    df["favored_flag"] = flags["favored"]
+    # Shootouts help offenses and hurt defenses.
+    df["pace_flag"] = flags["pace"] * np.where(df["Position"] == "DST", -1, 1)
 
     return df
 
-def get_trends(df, year, week):
+def trend_stats(weekly_data, weeks):
+    # Trend and consistency for every player in one grouped pass: each
+    # player's fantasy points over `weeks`, in week order, laid out as one
+    # row of a (players x weeks) array. Returns raw statistics and flags
+    # indexed by player_display_name.
+    rows = weekly_data.loc[weekly_data["week"].isin(weeks), ["player_display_name", "week", "fantasy_points"]]
+    # Unnamed rows can't be joined to a player (and would factorize to -1).
+    rows = rows.loc[rows["player_display_name"].notna()].sort_values("week", kind="stable")
+    codes, names = pd.factorize(rows["player_display_name"])
+    slot = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+    games = np.bincount(codes, minlength=len(names))
+    width = games.max() if len(names) else 0
+
+    points = np.zeros((len(names), width))
+    valid = np.zeros((len(names), width), dtype=bool)
+    points[codes, slot] = rows["fantasy_points"].to_numpy(dtype=float)
+    valid[codes, slot] = True
+
+    # Week-over-week direction: strictly rising or falling throughout.
+    step = np.diff(points, axis=1)
+    pairs = valid[:, 1:]
+    rising = ((step > 0) & pairs).sum(axis=1)
+    falling = ((step < 0) & pairs).sum(axis=1)
+
+    # Population std / mean, as np.std(points) / np.mean(points).
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = points.sum(axis=1) / games
+        std = np.sqrt((np.where(valid, points - mean[:, None], 0.0) ** 2).sum(axis=1) / games)
+        cv = std / mean
+
+    enough = games >= 2
+    trend_flag = np.select([rising == games - 1, falling == games - 1], [1, -1], 0)
+    consistency_flag = np.select([cv < 0.25, cv < 0.5], [1, 0], -1)
+
+    return pd.DataFrame(
+        {
+            "games": games,
+            "rising": rising,
+            "falling": falling,
+            "mean_fpts": mean,
+            "std_fpts": std,
+            "fpts_cv": cv,
+            "fpts_trend_flag": np.where(enough, trend_flag, 0),
+            "consistency_flag": np.where(enough, consistency_flag, 0),
+        },
+        index=pd.Index(names, name="player_display_name"),
+    )
+
+def get_trends(df, year, week, window=TREND_WINDOW, weekly_data=None, include_stats=False):
+    # Flags over the last `window` completed weeks (needs at least two).
+    # include_stats also joins trend_stats' raw columns onto the players.
     df['fpts_trend_flag'] = 0
     df['consistency_flag'] = 0
 
-    weeks_back = min(week - 1, 6)
+    weeks_back = min(week - 1, window)
     if weeks_back <= 1:
         return df
-    
-    window = list(range(week-weeks_back, week))
 
-    weekly_data = nfl.import_weekly_data([year])
-    weekly_data = weekly_data.loc[weekly_data["week"].isin(window)]
+    weeks = list(range(week-weeks_back, week))
 
-    for idx, player in df.iterrows():
-        player_weekly = weekly_data.loc[weekly_data["player_display_name"] == player["Player"]]
+    if weekly_data is None:
+        # (years, columns), as nfl_data_py takes them; trend_stats picks
+        # out `weeks`.
+        weekly_data = nflverse_source().import_weekly_data([year], ["player_display_name", "week", "fantasy_points"])
 
-        points = list(player_weekly["fantasy_points"])
-
-        if len(points) < 2:
-            continue
-
-        pos = 0
-        neg = 0
-        for i in range(len(points) - 1):
-            if points[i+1] > points[i]:
-                pos += 1
-            elif points[i+1] < points[i]:
-                neg += 1
-
-        if pos == len(points) - 1:
-            df.at[idx, "fpts_trend_flag"] = 1
-        elif neg == len(points) - 1:
-            df.at[idx, "fpts_trend_flag"] = -1
-        else: 
-            df.at[idx, "fpts_trend_flag"] = 0
-
-        cv = np.std(points) / np.mean(points)
-
-        if cv < 0.25:
-            df.at[idx, "consistency_flag"] = 1
-        elif cv < 0.5:
-            df.at[idx, "consistency_flag"] = 0
-        else:
-            df.at[idx, "consistency_flag"] = -1
+    stats = trend_stats(weekly_data, weeks)
+    flags = ["fpts_trend_flag", "consistency_flag"]
+    joined = df[["Player"]].join(stats, on="Player")
+    df[flags] = joined[flags].fillna(0).astype("int64")
+    if include_stats:
+        for col in stats.columns.drop(flags):
+            df[col] = joined[col]
 
     return df
 
 # add/drop features
-def get_upcoming_difficulty(df, year, week):
-    schedules = nfl.import_schedules([year])
+def favored_share_flags(schedule, weeks, threshold):
+    # 1 for teams favored in more than `threshold` of `weeks`. A spread_line
+    # <= 0 counts as the home team favored, anything else (NaN included) as
+    # the away team.
+    games = schedule.loc[schedule["week"].isin(weeks)]
+    favored = pd.Series(np.where(games["spread_line"] <= 0, games["home_team"], games["away_team"]))
+    teams = pd.unique(pd.concat([games["home_team"], games["away_team"]]))
+    counts = favored.value_counts().reindex(teams, fill_value=0)
+    return pd.DataFrame({"flag": (counts / len(weeks) > threshold).astype("int64")})
+
+def get_upcoming_difficulty(df, year, week, schedule=None):
+    if schedule is None:
+        schedule = load_schedule(year)
 
     upcoming = list(range(week+1, min(week+4, 19)))
-    schedules = schedules.loc[schedules["week"].isin(upcoming)]
-
-    team_favored_count = {}
-    for idx, game in schedules.iterrows():
-        home_team = game["home_team"]
-        if home_team == "LA":
-            home_team = "LAR"
-        if home_team == "WAS":
-            home_team = "WSH"
-
-        away_team = game["away_team"]
-        if away_team == "LA":
-            away_team = "LAR"
-        if away_team == "WAS":
-            away_team = "WSH"
-
-        if home_team not in team_favored_count:
-            team_favored_count[home_team] = 0
-
-        if away_team not in team_favored_count:
-            team_favored_count[away_team] = 0
-
-        if game["spread_line"] <= 0:
-            team_favored_count[home_team] += 1
-
-        else:
-            team_favored_count[away_team] += 1
-
-    team_favored_flags = {}
-    for team in team_favored_count:
-        if team_favored_count[team]/len(upcoming) > 0.6:
-            team_favored_flags[team] = 1
-        else:
-            team_favored_flags[team] = 0
-
-    df["upcoming_favored_flag"] = 0
-    for idx, player in df.iterrows():
-        player_team = player["Team"]
-        if player_team == "FA":
-            continue
-        flag = team_favored_flags[player_team]
-
-        df.at[idx, "upcoming_favored_flag"] = flag
+    team_favored_flags = favored_share_flags(schedule, upcoming, 0.6)
 
-    return df
+    df["upcoming_favored_flag"] = join_team_flags(df, team_favored_flags, ["flag"])["flag"]
 
-def get_playoff_difficulty(df, year):
-    schedules = nfl.import_schedules([year])
-
-    playoff_weeks = [15,16,17,18]
-    schedules = schedules.loc[schedules["week"].isin(playoff_weeks)]
-
-    team_favored_count = {}
-    for idx, game in schedules.iterrows():
-        home_team = game["home_team"]
-        if home_team == "LA":
-            home_team = "LAR"
-        if home_team == "WAS":
-            home_team = "WSH"
-
-        away_team = game["away_team"]
-        if away_team == "LA":
-            away_team = "LAR"
-        if away_team == "WAS":
-            away_team = "WSH"
-
-        if home_team not in team_favored_count:
-            team_favored_count[home_team] = 0
-
-        if away_team not in team_favored_count:
-            team_favored_count[away_team] = 0
-
-        if game["spread_line"] <= 0:
-            team_favored_count[home_team] += 1
-
-        else:
-            team_favored_count[away_team] += 1
+    return df
 
-    team_favored_flags = {}
-    for team in team_favored_count:
-        if team_favored_count[team]/len(playoff_weeks) > 0.5:
-            team_favored_flags[team] = 1
-        else:
-            team_favored_flags[team] = 0
+def get_playoff_difficulty(df, year, schedule=None):
+    if schedule is None:
+        schedule = load_schedule(year)
 
-    df["playoff_favored_flag"] = 0
-    for idx, player in df.iterrows():
-        player_team = player["Team"]
-        if player_team == "FA":
-            continue
-        flag = team_favored_flags[player_team]
+    team_favored_flags = favored_share_flags(schedule, PLAYOFF_WEEKS, 0.5)
 
-        df.at[idx, "playoff_favored_flag"] = flag
+    df["playoff_favored_flag"] = join_team_flags(df, team_favored_flags, ["flag"])["flag"]
 
     return df
 
 def generate_data(year, week):
     df = import_player_data()
-    df = get_vegas_odds(df, year, week)
+    schedule = load_schedule(year)
+    df = get_vegas_odds(df, year, week, schedule)
     try:
         df = get_trends(df, year, week)
     except:
         df['fpts_trend_flag'] = 0
         df['consistency_flag'] = 0
-    df = get_upcoming_difficulty(df, year, week)
-    df = get_playoff_difficulty(df, year)
-    
+    df = get_upcoming_difficulty(df, year, week, schedule)
+    df = get_playoff_difficulty(df, year, schedule)
+
     return df
 
+# full-season flag cube
+def team_week_matrix(frame, value, teams, weeks):
+    # (team x week) int array of `value` from rows with team/week columns.
+    table = frame.set_index(["team", "week"])[value].unstack(fill_value=0)
+    return table.reindex(index=teams, columns=weeks, fill_value=0).to_numpy(dtype="int64")
+
+def season_team_flags(schedule, weeks):
+    # Every schedule-based team flag for every week at once, as
+    # {flag: (team x week) array}, plus the team index. Week by week this
+    # equals get_vegas_odds / get_upcoming_difficulty / get_playoff_difficulty.
+    teams = pd.Index(pd.unique(pd.concat([schedule["home_team"], schedule["away_team"]])))
+    games = schedule.loc[schedule["week"].isin(range(1, max(weeks) + 4))]
+
+    t = games["total_line"]
+    s = games["spread_line"]
+    home_favored = np.select([s < -6, s > 6], [1, -1], 0)
+    pace = np.select([t >= 49, t <= 42], [1, -1], 0)
+    home = pd.DataFrame({"team": games["home_team"], "week": games["week"], "favored": home_favored, "pace": pace})
+    away = pd.DataFrame({"team": games["away_team"], "week": games["week"], "favored": -home_favored, "pace": pace})
+    odds = pd.concat([home, away]).sort_index(kind="stable").drop_duplicates(["week", "team"])
+
+    # Games each team was favored in by week (spread_line <= 0: home), over
+    # the weeks the upcoming window can reach, as running totals.
+    last_week = max(weeks)
+    favored = pd.DataFrame(
+        {"team": np.where(s <= 0, games["home_team"], games["away_team"]), "week": games["week"], "n": 1}
+    )
+    favored = favored.groupby(["team", "week"], as_index=False)["n"].sum()
+    reach = list(range(1, min(last_week + 3, 18) + 1))
+    totals = np.cumsum(team_week_matrix(favored, "n", teams, reach), axis=1)
+    totals = np.concatenate([np.zeros((len(teams), 1), dtype="int64"), totals], axis=1)
+
+    upcoming = np.zeros((len(teams), len(weeks)), dtype="int64")
+    for col, week in enumerate(weeks):
+        end = min(week + 3, 18)
+        if end > week:
+            upcoming[:, col] = (totals[:, end] - totals[:, week]) / (end - week) > 0.6
+
+    playoff = favored_share_flags(schedule, PLAYOFF_WEEKS, 0.5)["flag"].reindex(teams, fill_value=0).to_numpy()
+
+    return teams, {
+        "favored": team_week_matrix(odds, "favored", teams, weeks),
+        "pace": team_week_matrix(odds, "pace", teams, weeks),
+        "upcoming": upcoming,
+        "playoff": np.repeat(playoff[:, None], len(weeks), axis=1),
+    }
+
+def flag_bit(col, value=1):
+    # The bit set in FlagCube.bitmasks() when `col` is `value` (1 or -1).
+    return 1 << (2 * FLAG_COLUMNS.index(col) + (value == -1))
+
+class FlagCube:
+    # Every management flag for every player and week: `flags` is an int8
+    # (player x week x FLAG_COLUMNS) array aligned with `players` (Player,
+    # Team, Position, keeping import_player_data's index) and `weeks`.
+    flag_columns = FLAG_COLUMNS
+
+    def __init__(self, players, flags, weeks=SEASON_WEEKS, stamp=None):
+        self.players = players
+        self.flags = flags
+        self.weeks = list(weeks)
+        self.stamp = stamp
+        self._masks = None
+        self._position_rows = None
+        self._rows_by_name = None
+
+    def bitmasks(self):
+        # (player x week) uint16 with two bits per flag, one for +1 and one
+        # for -1 (see flag_bit), so any filter combination is one AND.
+        if self._masks is None:
+            shifts = 2 * np.arange(len(FLAG_COLUMNS))
+            positive = ((self.flags == 1).astype("int64") << shifts).sum(axis=2)
+            negative = ((self.flags == -1).astype("int64") << (shifts + 1)).sum(axis=2)
+            self._masks = (positive | negative).astype("uint16")
+        return self._masks
+
+    def position_rows(self):
+        # Position -> rows of that position, built once.
+        if self._position_rows is None:
+            positions = self.players["Position"].to_numpy()
+            self._position_rows = {pos: np.flatnonzero(positions == pos) for pos in pd.unique(positions)}
+        return self._position_rows
+
+    def player_rows(self, names):
+        # Sorted rows of every player named in `names`, by hash lookup
+        # (names not in the cube are ignored).
+        if self._rows_by_name is None:
+            self._rows_by_name = {}
+            for row, name in enumerate(self.players["Player"]):
+                self._rows_by_name.setdefault(name, []).append(row)
+        rows = [row for name in set(names) for row in self._rows_by_name.get(name, ())]
+        return np.array(sorted(rows), dtype="int64")
+
+    def select(self, week, require=(), tagged_only=False, positions=None, exclude=None):
+        # Rows (positions in `players` and in frame(week)) of the players
+        # with every flag in `require` at +1, at least one non-zero flag if
+        # `tagged_only`, a position in `positions` and a name not in `exclude`.
+        masks = self.bitmasks()[:, self.weeks.index(week)]
+        required = 0
+        for col in require:
+            required |= flag_bit(col)
+        keep = (masks & required) == required
+        if tagged_only:
+            keep &= masks != 0
+        if positions is not None:
+            allowed = np.zeros(len(masks), dtype=bool)
+            for pos in positions:
+                allowed[self.position_rows().get(pos, [])] = True
+            keep &= allowed
+        if exclude:
+            keep[self.player_rows(exclude)] = False
+        return np.flatnonzero(keep)
+
+    def frame(self, week):
+        # The generate_data(year, week) frame, sliced out of the cube.
+        values = self.flags[:, self.weeks.index(week), :].astype("int64")
+        return pd.concat([self.players, pd.DataFrame(values, index=self.players.index, columns=FLAG_COLUMNS)], axis=1)
+
+    def save(self, path):
+        from project.data.atomic_io import atomic_write
+
+        arrays = {
+            "flags": self.flags,
+            "weeks": np.asarray(self.weeks),
+            "index": self.players.index.to_numpy(),
+            "stamp": np.asarray(json.dumps(self.stamp)),
+        }
+        for col in ["Player", "Team", "Position"]:
+            arrays[col] = self.players[col].to_numpy(dtype=str)
+        atomic_write(path, lambda f: np.savez_compressed(f, **arrays), binary=True)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            players = pd.DataFrame(
+                {col: data[col] for col in ["Player", "Team", "Position"]}, index=data["index"]
+            )
+            return cls(players, data["flags"], data["weeks"].tolist(), json.loads(str(data["stamp"])))
+
+def source_stamp(year, schedule=None):
+    # What the cube was built from, so a saved cube goes stale when any of
+    # it changes: the store's per-season counts and last ingest time (a new
+    # week, or stat corrections to the latest one), a hash of the schedule
+    # lines (moved betting lines keep the counts the same) and the player
+    # CSV's sha1 (a regenerated player list).
+    source = nflverse_source()
+    if schedule is None:
+        schedule = load_schedule(year)
+    lines = schedule[["week", "home_team", "away_team", "total_line", "spread_line"]].sort_values(
+        ["week", "home_team"], kind="stable"
+    )
+    with open(PLAYERS_CSV, "rb") as f:
+        players_sha1 = hashlib.sha1(f.read()).hexdigest()
+    return {
+        "year": year,
+        "source": source.status().get(year) if hasattr(source, "status") else None,
+        "ingested_at": source.ingested_at(year) if hasattr(source, "ingested_at") else None,
+        "schedule_sha1": hashlib.sha1(lines.to_csv(index=False).encode("utf-8")).hexdigest(),
+        "players_sha1": players_sha1,
+    }
+
+def build_flag_cube(year, weeks=SEASON_WEEKS):
+    players = import_player_data()
+    schedule = load_schedule(year)
+    teams, team_flags = season_team_flags(schedule, weeks)
+
+    flags = np.zeros((len(players), len(weeks), len(FLAG_COLUMNS)), dtype="int8")
+    rows = teams.get_indexer(players["Team"])
+    known = rows >= 0
+    team_rows = rows[known]
+    dst = (players["Position"].to_numpy() == "DST")[known, None]
+    flags[known, :, 0] = team_flags["favored"][team_rows]
+    flags[known, :, 1] = np.where(dst, -1, 1) * team_flags["pace"][team_rows]
+    flags[known, :, 4] = team_flags["upcoming"][team_rows]
+    flags[known, :, 5] = team_flags["playoff"][team_rows]
+
+    try:
+        weekly = nflverse_source().import_weekly_data([year])
+        for i, week in enumerate(weeks):
+            weeks_back = min(week - 1, TREND_WINDOW)
+            if weeks_back <= 1:
+                continue
+            stats = trend_stats(weekly, list(range(week - weeks_back, week)))
+            found = stats.index.get_indexer(players["Player"])
+            matched = found >= 0
+            flags[matched, i, 2] = stats["fpts_trend_flag"].to_numpy()[found[matched]]
+            flags[matched, i, 3] = stats["consistency_flag"].to_numpy()[found[matched]]
+    except Exception:
+        # As in generate_data: no weekly stats means neutral trend flags.
+        flags[:, :, 2:4] = 0
+
+    return FlagCube(players.copy(), flags, weeks, source_stamp(year, schedule))
+
+def flag_cube_path(year):
+    from project.data.nflverse_store import DEFAULT_DB_PATH
+
+    return DEFAULT_DB_PATH.parent / f"flag_cube_{year}.npz"
+
+def load_flag_cube(year, path=None, rebuild=False):
+    # The saved cube for `year`, rebuilt (and saved) when missing or built
+    # from older source data.
+    path = path or flag_cube_path(year)
+    if not rebuild:
+        try:
+            cube = FlagCube.load(path)
+        except (OSError, ValueError, KeyError):
+            cube = None
+        if cube is not None and cube.stamp == source_stamp(year):
+            return cube
+    cube = build_flag_cube(year)
+    cube.save(path)
+    return cube
+
 if __name__ == "__main__":
-    print(generate_data(2025, 1))
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Weekly management flags.")
+    parser.add_argument("year", type=int, nargs="?", default=2025)
+    parser.add_argument("--week", type=int, default=1)
+    parser.add_argument("--cube", action="store_true", help="Rebuild and save the full-season flag cube")
+    args = parser.parse_args()
+    if args.cube:
+        cube = load_flag_cube(args.year, rebuild=True)
+        print(f"{cube.flags.shape} flags -> {flag_cube_path(args.year)}")
+        print(cube.frame(args.week))
+    else:
+        print(generate_data(args.year, args.week))
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+# Ranked waiver recommendations from the flag cube (see
+# data_generation.FlagCube) plus projections, instead of tags to interpret.
+#
+# A player's composite score for a week is the weighted sum of their six
+# flags plus PROJECTION_WEIGHT times their projection as a z-score within
+# their position, so a kicker and a running back are each measured against
+# their own position. The whole season's (player x week) score matrix is one
+# matrix product, computed once; ranking a league's free agents is then a
+# row-exclusion mask plus a partial sort (argpartition) per position.
+
+PROJECTIONS_CSV = "./project/data/cleaned_data.csv"
+PROJECTION_COLUMN = "Average_FPTS"
+PROJECTION_WEIGHT = 1.5
+DEFAULT_WEIGHTS = {
+    "favored_flag": 1.0,
+    "pace_flag": 0.5,
+    "fpts_trend_flag": 1.0,
+    "consistency_flag": 0.75,
+    "upcoming_favored_flag": 0.75,
+    "playoff_favored_flag": 0.5,
+}
+REASONS = {
+    ("favored_flag", 1): "favored this week",
+    ("favored_flag", -1): "big underdog this week",
+    ("pace_flag", 1): "high-scoring game expected",
+    ("pace_flag", -1): "low-scoring game expected",
+    ("fpts_trend_flag", 1): "points trending up",
+    ("fpts_trend_flag", -1): "points trending down",
+    ("consistency_flag", 1): "consistent scorer",
+    ("consistency_flag", -1): "boom-or-bust",
+    ("upcoming_favored_flag", 1): "favored over the next few weeks",
+    ("playoff_favored_flag", 1): "favored in the fantasy playoffs",
+}
+
+def parse_roster(text):
+    # One player per line -> set of names.
+    return {name.strip() for name in (text or "").split("\n") if name.strip()}
+
+def load_projections(players, path=PROJECTIONS_CSV, column=PROJECTION_COLUMN):
+    # Projections aligned with `players`, joined on (Player, Team, Position)
+    # rather than row position: the cube may have been built from an older
+    # CSV whose ranks were in a different order. Players without one get 0.
+    keys = ["Player", "Team", "Position"]
+    projections = pd.read_csv(path).drop_duplicates(keys).set_index(keys)[column]
+    return projections.reindex(pd.MultiIndex.from_frame(players[keys])).fillna(0).to_numpy(dtype=float)
+
+def standardize_by_group(values, codes, groups):
+    # z-score of each value within its group (code), via bincount.
+    counts = np.maximum(np.bincount(codes, minlength=groups), 1)
+    mean = np.bincount(codes, weights=values, minlength=groups) / counts
+    centered = values - mean[codes]
+    std = np.sqrt(np.bincount(codes, weights=centered ** 2, minlength=groups) / counts)
+    return centered / np.where(std > 0, std, 1.0)[codes]
+
+class WaiverRanker:
+    def __init__(self, cube, projections, weights=None, projection_weight=PROJECTION_WEIGHT):
+        self.cube = cube
+        self.players = cube.players
+        self.weeks = list(cube.weeks)
+        self.columns = list(cube.flag_columns)
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.projections = np.asarray(projections, dtype=float)
+
+        codes, positions = pd.factorize(self.players["Position"])
+        self.projection_scores = standardize_by_group(self.projections, codes, len(positions))
+        weight_vector = np.array([self.weights.get(col, 0.0) for col in self.columns])
+        # (player x week) for the whole season at once.
+        self.scores = cube.flags @ weight_vector + projection_weight * self.projection_scores[:, None]
+
+    def available(self, rostered=()):
+        # Boolean mask of players not in `rostered`.
+        mask = np.ones(len(self.players), dtype=bool)
+        mask[self.cube.player_rows(rostered)] = False
+        return mask
+
+    def top_rows(self, week, rostered=(), k=3, positions=None):
+        # {position: rows of its k best available players, best first}.
+        scores = self.scores[:, self.weeks.index(week)]
+        available = self.available(rostered)
+        top = {}
+        for pos, rows in self.cube.position_rows().items():
+            if positions is not None and pos not in positions:
+                continue
+            rows = rows[available[rows]]
+            if len(rows) > k:
+                rows = rows[np.argpartition(-scores[rows], k - 1)[:k]]
+            top[pos] = rows[np.argsort(-scores[rows], kind="stable")]
+        return top
+
+    def reasons(self, row, week):
+        # The flags behind a player's score, biggest contribution first.
+        flags = self.cube.flags[row, self.weeks.index(week)]
+        found = [
+            (abs(self.weights.get(col, 0.0) * value), REASONS[(col, value)])
+            for col, value in zip(self.columns, flags.tolist())
+            if (col, value) in REASONS
+        ]
+        return ", ".join(reason for _, reason in sorted(found, key=lambda item: -item[0]))
+
+    def rank(self, week, rostered=(), k=3, positions=None):
+        # The top `k` available players per position for `week`, with score,
+        # projection and a reasoning string.
+        top = self.top_rows(week, rostered, k, positions)
+        rows = np.concatenate(list(top.values())) if top else np.array([], dtype="int64")
+        col = self.weeks.index(week)
+        ranked = self.players.iloc[rows].reset_index(drop=True)
+        ranked.insert(0, "rank", np.concatenate([np.arange(1, len(r) + 1) for r in top.values()]) if top else [])
+        ranked["score"] = self.scores[rows, col].round(2)
+        ranked["projection"] = self.projections[rows]
+        ranked["reasons"] = [self.reasons(row, week) for row in rows]
+        return ranked
+
+    def rank_leagues(self, week, leagues, k=3):
+        # {league: rank(...)} for several leagues' rostered sets; the score
+        # matrix is shared, so each league costs a mask and a partial sort.
+        return {league: self.rank(week, rostered, k) for league, rostered in leagues.items()}
@@ -1,5 +1,11 @@
+import hashlib
+import json
 import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
 import pandas as pd
 import pytest
@@ -8,6 +14,8 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from project.data.live_rankings import with_player_ids  # noqa: E402  (needs REPO_ROOT on sys.path)
+
 
 @pytest.fixture
 def sample_player_pool():
@@ -39,4 +47,88 @@ def sample_player_pool():
 
     df = pd.DataFrame(rows).sort_values("Total_FPTS", ascending=False).reset_index(drop=True)
     df.insert(0, "Rank", range(1, len(df) + 1))
-    return df
+    return with_player_ids(df)
+
+
+def make_sleeper_records(pos, count, top_pts=300.0, step=5.0):
+    """Minimal Sleeper-shaped projection records for one position."""
+    records = []
+    for i in range(count):
+        pts = top_pts - i * step
+        records.append(
+            {
+                "player_id": f"{pos}{i + 1}",
+                "stats": {"pts_ppr": pts, "pts_half_ppr": pts - 10, "pts_std": pts - 20},
+                "player": {"first_name": pos, "last_name": f"Player{i + 1}", "team": "AAA", "position": pos},
+            }
+        )
+    return records
+
+
+class SleeperStub:
+    """State for a local stand-in for api.sleeper.app's projections endpoint.
+
+    `payloads` maps position -> JSON body, `failures` maps position -> how
+    many leading requests for it should get a 503, and `delay` is a
+    per-request sleep used to make concurrency observable. Responses carry a
+    content-hash ETag and honor If-None-Match, like a CDN-fronted upstream.
+    """
+
+    def __init__(self):
+        self.payloads = {}
+        self.failures = {}
+        self.delay = 0.0
+        self.requests = []
+        self.not_modified = []
+        self.base_url = None
+
+    def serve(self, positions, count=3):
+        for pos in positions:
+            self.payloads[pos] = make_sleeper_records(pos, count)
+
+
+class _SleeperStubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        stub = self.server.stub
+        pos = parse_qs(urlparse(self.path).query).get("position[]", [""])[0]
+        stub.requests.append(pos)
+        if stub.delay:
+            time.sleep(stub.delay)
+
+        if stub.failures.get(pos, 0) > 0:
+            stub.failures[pos] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        body = json.dumps(stub.payloads.get(pos, [])).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            stub.not_modified.append(pos)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def sleeper_stub():
+    stub = SleeperStub()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SleeperStubHandler)
+    server.stub = stub
+    stub.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from project.benchmarks.engines import compare, run_benchmarks, synthetic_pool
+
+
+def test_synthetic_pool_is_deterministic_and_ranked():
+    pool = synthetic_pool(2_000)
+    assert len(pool) == 2_000
+    assert list(pool.columns[:6]) == ["Rank", "Total_FPTS", "Average_FPTS", "Player", "Team", "Position"]
+    assert pool["Rank"].tolist() == list(range(1, 2_001))
+    assert pool["Total_FPTS"].is_monotonic_decreasing
+    assert pool["player_id"].is_unique
+    assert set(pool["Position"]) == {"QB", "RB", "WR", "TE", "K", "DST"}
+    pd.testing.assert_frame_equal(pool, synthetic_pool(2_000))
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"a": {"median_s": 1.0}, "b": {"median_s": 1.0}, "c": {"median_s": 1.0}, "d": {"skipped": "no tqdm"}}
+    current = {
+        "a": {"median_s": 1.1},
+        "b": {"median_s": 1.3},
+        "c": {"median_s": 0.5},
+        "d": {"median_s": 1.0},
+        "new": {"median_s": 1.0},
+    }
+    statuses = {case: status for case, _, _, _, status in compare(current, baseline, tolerance=0.15)}
+    assert statuses == {"a": "ok", "b": "regressed", "c": "improved", "d": "skipped"}
+
+
+def test_run_benchmarks_times_selected_groups():
+    results = run_benchmarks((400,), (8,), only={"parallel_merge", "make_move"}, repeat=1, min_round_seconds=0.01, log=lambda line: None)
+    assert set(results) == {"make_move[pool=400,teams=8]", "parallel_merge[workers=4]", "parallel_merge[workers=16]"}
+    assert all(result["median_s"] > 0 for result in results.values())
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import sys
+import threading
+
+from project.draft.mcts_parallel import shutdown_workers, warm_up_workers
+from project.webapp.boot import BootApp, ImportProfiler
+
+
+async def _request(app, path, method="GET"):
+    scope = {"type": "http", "method": method, "path": path, "headers": [], "query_string": b""}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"], b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def _fake_app(events):
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                events.append(message["type"])
+                await send({"type": message["type"] + ".complete"})
+                if message["type"] == "lifespan.shutdown":
+                    return
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": f"real {scope['path']}".encode()})
+
+    return app
+
+
+def test_boot_app_answers_early_and_hands_off_after_warm_up(tmp_path):
+    (tmp_path / "index.html").write_text("<html>setup</html>", encoding="utf-8")
+    release = threading.Event()
+    events = []
+
+    def slow_load():
+        release.wait(5)
+        return _fake_app(events)
+
+    boot = BootApp(load_app=slow_load, warm_up_workers=None, static_dir=tmp_path, profile=False)
+
+    async def scenario():
+        lifespan_in = asyncio.Queue()
+        lifespan_out = []
+
+        async def send(message):
+            lifespan_out.append(message["type"])
+
+        lifespan = asyncio.ensure_future(boot({"type": "lifespan", "state": {}}, lifespan_in.get, send))
+        await lifespan_in.put({"type": "lifespan.startup"})
+        await asyncio.sleep(0.05)
+        assert lifespan_out == ["lifespan.startup.complete"]
+
+        # Warm-up is still blocked: health, defaults and static files answer anyway.
+        assert await _request(boot, "/health") == (200, b'{"status":"ok"}')
+        status, body = await _request(boot, "/api/config/defaults")
+        assert status == 200 and json.loads(body)["num_teams"] == 10
+        assert await _request(boot, "/") == (200, b"<html>setup</html>")
+        assert boot._static_file("/../test_boot.py") is None
+
+        pending = asyncio.ensure_future(_request(boot, "/api/state"))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+        release.set()
+        assert await pending == (200, b"real /api/state")
+        assert events == ["lifespan.startup"]
+
+        await lifespan_in.put({"type": "lifespan.shutdown"})
+        await lifespan
+        assert events == ["lifespan.startup", "lifespan.shutdown"]
+        assert lifespan_out[-1] == "lifespan.shutdown.complete"
+
+    asyncio.run(scenario())
+    assert set(boot.timings) >= {"import_ms", "lifespan_ms", "ready_ms"}
+
+
+def test_import_profiler_records_cumulative_and_self_time(tmp_path, monkeypatch):
+    (tmp_path / "boot_probe_outer.py").write_text("import boot_probe_inner\n", encoding="utf-8")
+    (tmp_path / "boot_probe_inner.py").write_text("import time\ntime.sleep(0.02)\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    with ImportProfiler() as profiler:
+        import boot_probe_outer  # noqa: F401
+
+    records = {name: (cumulative, own) for name, cumulative, own in profiler.records}
+    assert records["boot_probe_inner"][0] >= 0.02
+    assert records["boot_probe_outer"][0] >= records["boot_probe_inner"][0]
+    assert records["boot_probe_outer"][1] < 0.02
+    assert sys.modules["boot_probe_outer"].__loader__.__class__.__name__ != "_TimedLoader"
+    assert "boot_probe_inner" in profiler.report()
+
+
+def test_warm_up_workers_starts_the_shared_pool():
+    try:
+        assert warm_up_workers(2) >= 1
+    finally:
+        shutdown_workers()
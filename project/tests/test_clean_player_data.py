@@ -0,0 +1,47 @@
+import pandas as pd
+
+from project.data.clean_player_data import DEFAULT_INPUT, clean_exports, split_merged_column
+from project.data.live_rankings import DEFAULT_STATIC_CSV
+
+
+def test_reproduces_committed_cleaned_csv_across_chunk_boundaries(tmp_path):
+    out = tmp_path / "cleaned.csv"
+    report = clean_exports([DEFAULT_INPUT], out, chunksize=7)
+
+    assert out.read_bytes() == DEFAULT_STATIC_CSV.read_bytes()
+    assert report.rows == 400
+    assert report.failed.empty
+
+
+def test_split_handles_case_and_suffix_ambiguity():
+    parts = split_merged_column(
+        pd.Series(["Ja'Marr ChaseCinWR", "Cam LittleJaxK", "Eagles DSTPhiDST", "Free AgentFaRB"])
+    )
+    assert parts.values.tolist() == [
+        ["Ja'Marr Chase", "CIN", "WR"],
+        ["Cam Little", "JAX", "K"],
+        ["Eagles DST", "PHI", "DST"],
+        ["Free Agent", "FA", "RB"],
+    ]
+
+
+def test_unparseable_rows_are_kept_and_reported(tmp_path):
+    src = tmp_path / "scrape.csv"
+    pd.DataFrame(
+        {
+            "Rank": [1, 2, 3],
+            "Players": ["Bijan RobinsonAtlRB", "No Team Or Position", None],
+            "Total_FPTS": [334.8, 1.0, 2.0],
+            "Average_FPTS": [19.7, 0.1, 0.1],
+        }
+    ).to_csv(src, index=False)
+    out = tmp_path / "cleaned.csv"
+    report_path = tmp_path / "failed.csv"
+
+    report = clean_exports([src, src], out, chunksize=2, report_path=report_path)
+
+    cleaned = pd.read_csv(out)
+    assert len(cleaned) == 6
+    assert cleaned["Player"].isna().sum() == 4
+    assert report.parsed == 2
+    assert pd.read_csv(report_path)["Rank"].tolist() == [2, 3, 2, 3]
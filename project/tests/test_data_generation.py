@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+
+from project.management import data_generation as dg
+
+
+def _schedule(games):
+    return dg.normalize_team_codes(
+        pd.DataFrame(games, columns=["week", "home_team", "away_team", "total_line", "spread_line"])
+    )
+
+
+def _players(rows):
+    # Non-contiguous index, as after import_player_data drops free agents.
+    return pd.DataFrame(rows, columns=["Player", "Team", "Position"], index=[3, 7, 8, 12][: len(rows)])
+
+
+def test_vegas_flags_join_by_normalized_team_with_dst_pace_inverted():
+    schedule = _schedule([(5, "LA", "WAS", 50.0, -7.0), (5, "KC", "BUF", 41.0, np.nan)])
+    players = _players(
+        [("Ram WR", "LAR", "WR"), ("Commanders DST", "WSH", "DST"), ("Chief QB", "KC", "QB"), ("Bye RB", "SF", "RB")]
+    )
+
+    out = dg.get_vegas_odds(players, 2025, 5, schedule)
+
+    assert out.index.tolist() == [3, 7, 8, 12]
+    assert out["favored_flag"].tolist() == [1, -1, 0, 0]
+    assert out["pace_flag"].tolist() == [1, -1, -1, 0]
+    assert out["favored_flag"].dtype == np.int64
+
+
+def test_favored_share_counts_home_on_non_positive_spread():
+    schedule = _schedule(
+        [
+            (15, "DAL", "NYG", 45.0, 0.0),
+            (16, "NYG", "DAL", 45.0, 3.0),
+            (17, "DAL", "PHI", 45.0, np.nan),
+            (18, "PHI", "DAL", 45.0, -1.0),
+        ]
+    )
+    players = _players([("Cowboy", "DAL", "WR"), ("Giant", "NYG", "WR"), ("Eagle", "PHI", "WR")])
+
+    out = dg.get_playoff_difficulty(players, 2025, schedule)
+
+    # DAL favored weeks 15 and 16 only (2/4 is not > 0.5); PHI weeks 17-18.
+    assert out["playoff_favored_flag"].tolist() == [0, 0, 0]
+    flags = dg.favored_share_flags(schedule, [15, 16, 17], 0.6)["flag"]
+    assert flags.to_dict() == {"DAL": 1, "NYG": 0, "PHI": 0}
+
+
+def _weekly(points_by_player):
+    rows = [
+        {"player_display_name": name, "week": week, "fantasy_points": pts}
+        for name, points in points_by_player.items()
+        for week, pts in points.items()
+    ]
+    # Out of week order, as a concatenated export might be.
+    return pd.DataFrame(rows).sample(frac=1, random_state=0)
+
+
+def test_trend_stats_flags_direction_and_consistency_in_week_order():
+    weekly = _weekly(
+        {
+            "Up": {1: 10.0, 2: 11.0, 3: 12.0, 4: 13.0},
+            "Down": {2: 30.0, 3: 10.0, 4: 2.0},
+            "Flat": {2: 10.0, 3: 10.0, 4: 12.0},
+            "Once": {4: 20.0},
+            "Old": {1: 5.0, 2: 50.0},
+        }
+    )
+
+    stats = dg.trend_stats(weekly, [2, 3, 4])
+
+    assert stats.loc["Up", ["games", "rising", "falling"]].tolist() == [3, 2, 0]
+    assert stats["fpts_trend_flag"].to_dict() == {"Up": 1, "Down": -1, "Flat": 0, "Once": 0, "Old": 0}
+    assert stats["consistency_flag"].to_dict() == {"Up": 1, "Down": -1, "Flat": 1, "Once": 0, "Old": 0}
+    down = [30.0, 10.0, 2.0]
+    assert stats.loc["Down", "fpts_cv"] == np.std(down) / np.mean(down)
+
+
+def test_trend_stats_skips_rows_without_a_player_name():
+    weekly = _weekly({"Up": {1: 10.0, 2: 11.0, 3: 12.0}})
+    weekly = pd.concat([weekly, pd.DataFrame([{"player_display_name": None, "week": 2, "fantasy_points": 4.0}])])
+
+    stats = dg.trend_stats(weekly, [1, 2, 3])
+
+    assert stats.index.tolist() == ["Up"]
+    assert stats.loc["Up", "fpts_trend_flag"] == 1
+
+
+def test_get_trends_joins_flags_by_name_with_configurable_window():
+    weekly = _weekly({"Up": {1: 30.0, 2: 1.0, 3: 2.0, 4: 3.0}})
+    players = _players([("Up", "KC", "WR"), ("Unknown", "KC", "RB")])
+
+    six = dg.get_trends(players.copy(), 2025, 5, weekly_data=weekly)
+    three = dg.get_trends(players.copy(), 2025, 5, window=3, weekly_data=weekly, include_stats=True)
+
+    assert six["fpts_trend_flag"].tolist() == [0, 0]
+    assert three["fpts_trend_flag"].tolist() == [1, 0]
+    assert three.loc[3, "games"] == 3 and np.isnan(three.loc[7, "games"])
+    assert "games" not in six.columns
+
+
+def test_flag_cube_slices_match_generate_data(tmp_path, monkeypatch):
+    games = []
+    for week in range(1, 19):
+        # KC/DAL on bye in week 5.
+        games += [(week, "LA", "WAS", 50.0 - week, 7.0 - week)]
+        if week != 5:
+            games += [(week, "KC", "DAL", 40.0 + week, -1.0 if week % 3 else np.nan)]
+    schedule = pd.DataFrame(games, columns=["week", "home_team", "away_team", "total_line", "spread_line"])
+    weekly = _weekly({"Ram WR": {w: float(w) for w in range(1, 18)}, "Chief RB": {w: 10.0 + w % 2 for w in range(1, 18)}})
+
+    class Source:
+        def import_schedules(self, years):
+            return schedule
+
+        def import_weekly_data(self, years, columns=None):
+            # nfl_data_py's signature, so nothing passes the store-only weeks=.
+            return weekly if columns is None else weekly[columns]
+
+    players = _players(
+        [("Ram WR", "LAR", "WR"), ("Commanders DST", "WSH", "DST"), ("Chief RB", "KC", "RB"), ("Cowboy TE", "DAL", "TE")]
+    )
+    monkeypatch.setattr(dg, "nflverse_source", lambda: Source())
+    monkeypatch.setattr(dg, "import_player_data", lambda: players.copy())
+
+    cube = dg.build_flag_cube(2025)
+    path = tmp_path / "cube.npz"
+    cube.save(path)
+    loaded = dg.FlagCube.load(path)
+
+    assert cube.flags.shape == (4, 18, len(dg.FLAG_COLUMNS))
+    for week in dg.SEASON_WEEKS:
+        expected = dg.generate_data(2025, week)
+        pd.testing.assert_frame_equal(cube.frame(week), expected)
+        pd.testing.assert_frame_equal(loaded.frame(week), expected, check_dtype=False)
+
+
+def test_saved_flag_cube_goes_stale_when_lines_or_players_change(tmp_path, monkeypatch):
+    schedule = pd.DataFrame(
+        [(week, "LA", "WAS", 45.0, -3.0) for week in range(1, 19)],
+        columns=["week", "home_team", "away_team", "total_line", "spread_line"],
+    )
+
+    class Source:
+        def import_schedules(self, years):
+            return schedule.copy()
+
+        def import_weekly_data(self, years, columns=None):
+            raise RuntimeError("no weekly stats yet")
+
+    players_csv = tmp_path / "players.csv"
+    players_csv.write_text("Player,Team,Position\nRam WR,LAR,WR\n")
+    monkeypatch.setattr(dg, "PLAYERS_CSV", str(players_csv))
+    monkeypatch.setattr(dg, "nflverse_source", lambda: Source())
+    builds = []
+    build = dg.build_flag_cube
+    monkeypatch.setattr(dg, "build_flag_cube", lambda year: builds.append(year) or build(year))
+    path = tmp_path / "cube.npz"
+
+    before = dg.load_flag_cube(2025, path).frame(3)["favored_flag"].tolist()
+    dg.load_flag_cube(2025, path)
+    assert len(builds) == 1
+
+    # Same game count, moved line.
+    schedule.loc[schedule["week"] == 3, "spread_line"] = 10.0
+    assert dg.load_flag_cube(2025, path).frame(3)["favored_flag"].tolist() != before
+    assert len(builds) == 2
+
+    players_csv.write_text("Player,Team,Position\nRam WR,LAR,WR\nCommanders DST,WSH,DST\n")
+    assert len(dg.load_flag_cube(2025, path).players) == 2
+    assert len(builds) == 3
+
+
+def test_flag_cube_select_matches_dataframe_filters():
+    rng = np.random.default_rng(0)
+    players = pd.DataFrame(
+        {"Player": [f"P{i}" for i in range(60)], "Team": "KC", "Position": rng.choice(["QB", "RB", "WR", "DST"], 60)},
+        index=np.arange(60) * 2,
+    )
+    cube = dg.FlagCube(players, rng.choice([-1, 0, 1], (60, 18, len(dg.FLAG_COLUMNS))).astype("int8"))
+
+    assert cube.bitmasks().dtype == np.uint16
+    for week, require, tagged_only, positions in [
+        (1, [], False, None),
+        (4, ["favored_flag"], False, ["RB", "WR"]),
+        (9, ["pace_flag", "playoff_favored_flag"], True, ["QB", "RB", "WR", "DST"]),
+        (18, ["fpts_trend_flag", "consistency_flag", "upcoming_favored_flag"], True, []),
+    ]:
+        frame = cube.frame(week)
+        expected = frame["Position"].isin(positions) if positions is not None else pd.Series(True, frame.index)
+        expected &= ~frame["Player"].isin(["P3", "P10"])
+        for col in require:
+            expected &= frame[col] == 1
+        if tagged_only:
+            expected &= (frame[dg.FLAG_COLUMNS] != 0).any(axis=1)
+
+        rows = cube.select(week, require, tagged_only, positions, exclude=["P3", "P10"])
+        assert rows.tolist() == np.flatnonzero(expected.to_numpy()).tolist()
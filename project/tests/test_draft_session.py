@@ -57,7 +57,8 @@ def test_undo_restores_state_byte_for_byte(sample_player_pool):
     session.apply_pick(names[2])
     session.undo()
 
-    assert session.state() == snapshot
+    # Identical apart from the undone pick now waiting on the redo stack.
+    assert session.state() == {**snapshot, "redo_available": 1}
     assert session.available_players["Player"].tolist() == snapshot_available["Player"].tolist()
     assert session.greedy.roster_filled == snapshot_roster_filled
 
@@ -94,3 +95,174 @@ def test_our_roster_value_matches_direct_compute_roster_value(sample_player_pool
 
     expected = compute_roster_value(session.rosters[session.our_team_idx], cfg)
     assert session.our_roster_value() == expected
+
+
+def _refreshed_pool(pool):
+    """RB_1 gets hurt (projection collapses), RB_8 drops out entirely, and
+    everything is re-ranked -- the shape of a mid-draft news refresh."""
+    refreshed = pool.copy()
+    refreshed.loc[refreshed["Player"] == "RB_1", "Total_FPTS"] = 40.0
+    refreshed = refreshed[refreshed["Player"] != "RB_8"]
+    refreshed = refreshed.sort_values("Total_FPTS", ascending=False).reset_index(drop=True)
+    refreshed["Rank"] = range(1, len(refreshed) + 1)
+    return refreshed
+
+
+def test_swap_player_pool_matches_replaying_history_on_new_pool(sample_player_pool):
+    cfg = LeagueConfig(num_teams=10)
+    session = DraftSession(sample_player_pool, cfg, initial_pick=1)
+    for name in _top_names(sample_player_pool, 12):
+        session.apply_pick(name)
+
+    refreshed = _refreshed_pool(sample_player_pool)
+    summary = session.swap_player_pool(refreshed)
+
+    expected = DraftSession(refreshed, cfg, initial_pick=1)
+    for entry in session.pick_history:
+        expected.apply_pick(entry["player"]["player_id"])
+
+    assert summary["pool_version"] == session.pool_version == 1
+    assert summary["removed"] == 1
+    assert "RB" in summary["baselines_updated"]
+    assert session.available_players["player_id"].tolist() == expected.available_players["player_id"].tolist()
+    assert session.greedy.baseline_points == expected.greedy.baseline_points
+    assert session.greedy.baseline_ranks == expected.greedy.baseline_ranks
+    assert session.greedy.roster_filled == expected.greedy.roster_filled
+    state, expected_state = session.state(), expected.state()
+    state.pop("pool_version"), expected_state.pop("pool_version")
+    assert state == expected_state
+
+
+def test_swap_player_pool_keeps_drafted_player_missing_from_new_pool(sample_player_pool):
+    session = DraftSession(sample_player_pool, LeagueConfig(num_teams=10), initial_pick=1)
+    session.apply_pick("RB_8")
+    rb8_id = session.pick_history[0]["player"]["player_id"]
+
+    summary = session.swap_player_pool(_refreshed_pool(sample_player_pool))
+
+    assert summary["kept_drafted"] == 1
+    assert session.rosters[0][0]["Player"] == "RB_8"
+    assert rb8_id not in session.available_ids
+    session.undo()
+    assert rb8_id in session.available_ids
+
+
+def test_undo_redo_and_jump_match_replaying_from_scratch(sample_player_pool):
+    cfg = LeagueConfig(num_teams=10)
+    session = DraftSession(sample_player_pool, cfg, initial_pick=1)
+    ids = sample_player_pool["player_id"].tolist()[:15]
+    for player_id in ids:
+        session.apply_pick(player_id)
+
+    def replayed(n):
+        fresh = DraftSession(sample_player_pool, cfg, initial_pick=1)
+        for player_id in ids[:n]:
+            fresh.apply_pick(player_id)
+        return fresh
+
+    def assert_same(actual, expected):
+        actual_state, expected_state = actual.state(), expected.state()
+        actual_state.pop("redo_available"), expected_state.pop("redo_available")
+        assert actual_state == expected_state
+        assert actual.available_players["player_id"].tolist() == expected.available_players["player_id"].tolist()
+        assert actual.available_ids == expected.available_ids
+        assert actual.greedy.roster_filled == expected.greedy.roster_filled
+
+    session.undo(3)
+    assert session.state()["redo_available"] == 3
+    assert_same(session, replayed(12))
+
+    session.redo(2)
+    assert_same(session, replayed(14))
+
+    session.jump_to_pick(5)
+    assert_same(session, replayed(4))
+    session.jump_to_pick(16)
+    assert_same(session, replayed(15))
+
+    with pytest.raises(ValueError):
+        session.jump_to_pick(17)
+
+
+def test_new_pick_after_undo_clears_redo(sample_player_pool):
+    session = DraftSession(sample_player_pool, LeagueConfig(num_teams=10), initial_pick=1)
+    ids = sample_player_pool["player_id"].tolist()
+    session.apply_pick(ids[0])
+    session.apply_pick(ids[1])
+    session.undo()
+
+    session.apply_pick(ids[2])
+    assert session.redo_stack == []
+    session.redo()
+    assert session.drafted_ids() == [ids[0], ids[2]]
+
+
+def test_delta_since_replays_picks_and_undos(sample_player_pool):
+    session = DraftSession(sample_player_pool, LeagueConfig(num_teams=10), initial_pick=1)
+    ids = sample_player_pool["player_id"].tolist()
+    session.apply_pick(ids[0])
+    base = session.state_version
+    known = [entry["pick_number"] for entry in session.pick_history]
+
+    session.apply_pick(ids[1])
+    session.apply_pick(ids[2])
+    session.undo()
+
+    delta = session.delta_since(base)
+    assert delta["version"] == session.state_version == base + 3
+    assert [change["op"] for change in delta["changes"]] == ["pick", "pick", "undo"]
+    for change in delta["changes"]:
+        if change["op"] == "pick":
+            known.append(change["entry"]["pick_number"])
+        else:
+            known.remove(change["pick_number"])
+    assert known == [entry["pick_number"] for entry in session.pick_history]
+    assert delta["summary"]["positional_scarcity"] == session.positional_scarcity()
+    assert session.delta_since(session.state_version)["changes"] == []
+
+
+def test_delta_since_falls_back_to_full_state(sample_player_pool):
+    session = DraftSession(sample_player_pool, LeagueConfig(num_teams=10), initial_pick=1)
+    session.apply_pick(sample_player_pool["player_id"].iloc[0])
+
+    assert "full" in session.delta_since(-1)
+    assert "full" in session.delta_since(session.state_version + 5)
+
+    version = session.state_version
+    session.swap_player_pool(sample_player_pool.copy())
+    assert session.delta_since(version)["full"] == session.state()
+
+
+def test_apply_picks_matches_one_at_a_time(sample_player_pool):
+    cfg = LeagueConfig(num_teams=10)
+    names = _top_names(sample_player_pool, 12)
+    batched = DraftSession(sample_player_pool, cfg, initial_pick=1)
+    batched.apply_picks(names[:1] + [{"player": name} for name in names[1:]], start_pick=1)
+
+    single = DraftSession(sample_player_pool, cfg, initial_pick=1)
+    for name in names:
+        single.apply_pick(name)
+
+    assert batched.state() == single.state()
+    assert batched.available_players["player_id"].tolist() == single.available_players["player_id"].tolist()
+    assert batched.greedy.roster_filled == single.greedy.roster_filled
+
+
+@pytest.mark.parametrize(
+    "picks, start_pick",
+    [
+        (["QB_1", "RB_1", "QB_1"], None),  # duplicate within the batch
+        (["QB_1", "Not A Real Player"], None),
+        (["QB_1"], 5),  # client out of sync with the draft
+        ([{"player": "QB_1", "team_idx": 3}], None),  # wrong team on the clock
+    ],
+)
+def test_apply_picks_is_all_or_nothing(sample_player_pool, picks, start_pick):
+    session = DraftSession(sample_player_pool, LeagueConfig(num_teams=10), initial_pick=1)
+    session.apply_pick("WR_1")
+    before = session.state()
+
+    with pytest.raises(ValueError):
+        session.apply_picks(picks, start_pick=start_pick)
+    assert session.state() == before
+    assert len(session.available_players) == len(sample_player_pool) - 1
@@ -0,0 +1,203 @@
+import threading
+
+import pytest
+
+from project.draft.config import LeagueConfig
+from project.webapp import journal as journal_module
+from project.webapp import session as session_module
+from project.webapp.journal import JOURNAL_SUFFIX, JournalStore
+from project.webapp.session import DraftSession
+
+CONFIG = {"num_teams": 10, "initial_pick": 1}
+
+
+def _builder(pool):
+    def build(config):
+        return DraftSession(pool, LeagueConfig(num_teams=config["num_teams"]), initial_pick=config["initial_pick"])
+
+    return build
+
+
+def _journaled(tmp_path, pool, compact_every=64, fsync_interval=0.01):
+    store = JournalStore(tmp_path, fsync_interval=fsync_interval, compact_every=compact_every)
+    session = _builder(pool)(CONFIG)
+    store.attach("abc", session, CONFIG)
+    return store, session
+
+
+def _assert_same(recovered, original):
+    assert recovered.state() == original.state()
+    assert recovered.state_version == original.state_version
+    assert recovered.available_ids == original.available_ids
+
+
+def test_recovers_picks_undo_and_redo_without_clean_shutdown(tmp_path, sample_player_pool):
+    store, session = _journaled(tmp_path, sample_player_pool)
+    ids = sample_player_pool["player_id"].tolist()
+    for player_id in ids[:6]:
+        session.apply_pick(player_id)
+    session.undo(3)
+    session.redo()
+    # No close(): a fresh store over the same directory is a restarted process.
+
+    [(session_id, recovered, config)] = JournalStore(tmp_path).recover(_builder(sample_player_pool))
+    assert session_id == "abc" and config == CONFIG
+    _assert_same(recovered, session)
+    assert recovered.redo_stack == session.redo_stack
+
+
+def test_compaction_truncates_journal_and_keeps_state(tmp_path, sample_player_pool):
+    # A long interval keeps the background flusher out of the way, so the
+    # explicit flush() below is the only compaction.
+    store, session = _journaled(tmp_path, sample_player_pool, compact_every=4, fsync_interval=60)
+    for player_id in sample_player_pool["player_id"].tolist()[:10]:
+        session.apply_pick(player_id)
+    store.flush()
+    session.undo()
+
+    assert len((tmp_path / f"abc{JOURNAL_SUFFIX}").read_bytes().splitlines()) == 1
+    [(_, recovered, _)] = JournalStore(tmp_path).recover(_builder(sample_player_pool))
+    _assert_same(recovered, session)
+    store.close()
+
+
+def test_torn_final_record_is_ignored(tmp_path, sample_player_pool):
+    store, session = _journaled(tmp_path, sample_player_pool)
+    for player_id in sample_player_pool["player_id"].tolist()[:3]:
+        session.apply_pick(player_id)
+    store.close()
+    with open(tmp_path / f"abc{JOURNAL_SUFFIX}", "ab") as f:
+        f.write(b'{"v":4,"op":"pi')
+
+    [(_, recovered, _)] = JournalStore(tmp_path).recover(_builder(sample_player_pool))
+    _assert_same(recovered, session)
+
+
+def test_session_with_pick_missing_from_pool_is_left_on_disk(tmp_path, sample_player_pool):
+    store, session = _journaled(tmp_path, sample_player_pool)
+    ids = sample_player_pool["player_id"].tolist()
+    for player_id in ids[:4]:
+        session.apply_pick(player_id)
+    session.undo()
+    store.close()
+
+    # The second pick's player dropped out of the pool: restoring the rest
+    # would credit picks 3-4 to the wrong teams, so nothing is restored.
+    pool = sample_player_pool[sample_player_pool["player_id"] != ids[1]]
+    assert JournalStore(tmp_path).recover(_builder(pool)) == []
+    assert (tmp_path / f"abc{JOURNAL_SUFFIX}").exists()
+
+    with pytest.raises(ValueError, match=str(ids[1])):
+        _builder(pool)(CONFIG).restore(ids[:3], [ids[3]])
+    # Redo picks that would overrun the draft are refused, not half-applied.
+    with pytest.raises(ValueError, match="don't fit"):
+        _builder(sample_player_pool)({"num_teams": 2, "initial_pick": 1}).restore(ids[:30], ids[30:33])
+
+
+def test_discard_removes_files(tmp_path, sample_player_pool):
+    store, _ = _journaled(tmp_path, sample_player_pool)
+    store.discard("abc")
+    assert list(tmp_path.iterdir()) == []
+    assert store.recover(_builder(sample_player_pool)) == []
+
+
+def test_recover_sessions_readopts_original_ids(tmp_path, sample_player_pool, monkeypatch):
+    def loader(source, season, scoring):
+        return sample_player_pool
+
+    def restart():
+        store = JournalStore(tmp_path)
+        monkeypatch.setattr(journal_module, "_default_store", store)
+        monkeypatch.setattr(session_module, "_registry", None)
+        return store
+
+    first = restart()
+    session_id, session = session_module.create_session(_player_pool_loader=loader)
+    for player_id in sample_player_pool["player_id"].tolist()[:5]:
+        session.apply_pick(player_id)
+
+    second = restart()
+    assert session_module.recover_sessions(_player_pool_loader=loader) == [session_id]
+    assert session_module.get_session(session_id).state() == session.state()
+    first.close()
+    second.close()
+
+
+def test_compaction_writes_snapshot_without_blocking_picks(tmp_path, sample_player_pool, monkeypatch):
+    store, session = _journaled(tmp_path, sample_player_pool, compact_every=2, fsync_interval=60)
+    ids = sample_player_pool["player_id"].tolist()
+    session.apply_pick(ids[0])
+    session.apply_pick(ids[1])
+    write_snapshot = journal_module.atomic_write
+
+    def slow_write(path, write):
+        # Another request picks while the snapshot is being written.
+        picker = threading.Thread(target=session.apply_pick, args=(ids[2],))
+        picker.start()
+        picker.join(timeout=5)
+        assert not picker.is_alive(), "pick blocked behind the snapshot write"
+        write_snapshot(path, write)
+
+    monkeypatch.setattr(journal_module, "atomic_write", slow_write)
+    store.flush()
+
+    journal_lines = (tmp_path / f"abc{JOURNAL_SUFFIX}").read_bytes().splitlines()
+    assert len(journal_lines) == 1
+    [(_, recovered, _)] = JournalStore(tmp_path).recover(_builder(sample_player_pool))
+    _assert_same(recovered, session)
+    store.close()
+
+
+def test_failed_fsync_is_retried(tmp_path, sample_player_pool, monkeypatch):
+    store, session = _journaled(tmp_path, sample_player_pool, fsync_interval=60)
+    session.apply_pick(sample_player_pool["player_id"].iloc[0])
+    journal = store._journals["abc"]
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(journal_module.os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        journal.sync()
+    assert journal.dirty
+    monkeypatch.undo()
+    journal.sync()
+    assert not journal.dirty
+    store.discard("abc")
+    journal.sync()  # a discarded journal is a no-op, not a closed-fd race
+
+
+def test_recover_sessions_skips_sleeper_session_without_cached_pool(tmp_path, sample_player_pool, monkeypatch):
+    sleeper_pool = sample_player_pool.copy()
+    sleeper_pool["player_id"] = range(1000, 1000 + len(sleeper_pool))
+    cached = {}
+
+    def loader(source, season, scoring):
+        if source == "static":
+            return sample_player_pool
+        if source == "cached" and not cached:
+            raise LookupError("nothing cached")
+        return sleeper_pool
+
+    def restart():
+        store = JournalStore(tmp_path)
+        monkeypatch.setattr(journal_module, "_default_store", store)
+        monkeypatch.setattr(session_module, "_registry", None)
+        return store
+
+    first = restart()
+    session_id, session = session_module.create_session(_player_pool_loader=loader)
+    session.apply_pick(1000)
+    first.close()
+
+    # Cold cache: not rebuilt on the static pool's ids, and kept for later.
+    second = restart()
+    assert session_module.recover_sessions(_player_pool_loader=loader) == []
+    assert (tmp_path / f"{session_id}{JOURNAL_SUFFIX}").exists()
+    second.close()
+
+    cached["ppr"] = True
+    third = restart()
+    assert session_module.recover_sessions(_player_pool_loader=loader) == [session_id]
+    assert session_module.get_session(session_id).state() == session.state()
+    third.close()
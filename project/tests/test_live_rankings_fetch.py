@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from project.data import live_rankings
+from project.data.live_rankings import SLEEPER_POSITIONS, fetch_sleeper_projections
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch):
+    monkeypatch.setattr(live_rankings, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(live_rankings, "BACKOFF_CAP", 0.02)
+
+
+def test_fetch_parses_every_position_from_stand_in_server(sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS)
+
+    df = fetch_sleeper_projections(2026, base_url=sleeper_stub.base_url)
+
+    assert len(df) == 3 * len(SLEEPER_POSITIONS)
+    assert set(df["Position"]) == {"QB", "RB", "WR", "TE", "K", "DST"}
+    assert sorted(sleeper_stub.requests) == sorted(SLEEPER_POSITIONS)
+
+
+def test_positions_are_fetched_concurrently(sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS)
+    sleeper_stub.delay = 0.3
+
+    started = time.perf_counter()
+    fetch_sleeper_projections(2026, base_url=sleeper_stub.base_url)
+    elapsed = time.perf_counter() - started
+
+    # Six positions in series would take >= 1.8s.
+    assert elapsed < 1.2
+
+
+def test_transient_failures_are_retried(sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS)
+    sleeper_stub.failures = {"RB": 2}
+
+    df = fetch_sleeper_projections(2026, base_url=sleeper_stub.base_url)
+
+    assert (df["Position"] == "RB").sum() == 3
+    assert sleeper_stub.requests.count("RB") == 3
+
+
+def test_deadline_bounds_total_fetch_time(sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS)
+    sleeper_stub.failures = {"QB": 1000}
+
+    started = time.perf_counter()
+    with pytest.raises(RuntimeError, match="QB"):
+        fetch_sleeper_projections(2026, base_url=sleeper_stub.base_url, deadline=0.5)
+    assert time.perf_counter() - started < 1.5
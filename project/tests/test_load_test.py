@@ -0,0 +1,33 @@
+import asyncio
+
+from project.benchmarks.load_test import LoadTestConfig, check_thresholds, run_load_test
+from project.webapp import session as session_module
+
+
+def test_load_test_drives_concurrent_drafts_without_errors(sample_player_pool, monkeypatch):
+    monkeypatch.setattr(session_module, "load_player_pool", lambda source, season, scoring: sample_player_pool.copy())
+    config = LoadTestConfig(drafters=3, picks=6, pace=0, mcts_every=0)
+
+    report = asyncio.run(run_load_test(config))
+
+    assert report["errors"] == 0
+    assert report["routes"]["POST /api/session"]["requests"] == 3
+    assert report["routes"]["POST /api/pick"]["requests"] == 18
+    assert report["routes"]["DELETE /api/session"]["requests"] == 3
+    assert report["routes"]["POST /api/pick"]["p50_ms"] <= report["routes"]["POST /api/pick"]["p99_ms"]
+    assert session_module.get_registry().stats()["sessions"] == 0
+
+
+def test_thresholds_skip_mcts_and_flag_slow_routes():
+    report = {
+        "routes": {
+            "POST /api/pick": {"p95_ms": 40.0},
+            "POST /api/recommend/mcts": {"p95_ms": 12000.0},
+        },
+        "error_rate": 0.02,
+    }
+    assert check_thresholds(report, max_p95_ms=50, max_error_rate=0.05) == []
+    assert check_thresholds(report, max_p95_ms=30, max_error_rate=0.01) == [
+        "POST /api/pick: p95 40.0ms > 30ms",
+        "error rate 0.02 > 0.01",
+    ]
@@ -1,8 +1,11 @@
+import threading
+import time
+
 import pytest
 
 from project.draft.config import LeagueConfig
 from project.draft.mcts import MCTSDraftAssistant
-from project.draft.mcts_parallel import get_best_pick_parallel, merge_visit_counts
+from project.draft.mcts_parallel import get_best_pick_parallel, merge_visit_counts, warm_up_workers
 
 
 def test_merge_sums_visits_across_fake_trees():
@@ -42,7 +45,7 @@ def test_parallel_search_completes_within_time_budget(sample_player_pool):
         time_limit=1, num_workers=2,
     )
 
-    assert pick in sample_player_pool["Player"].values
+    assert pick in sample_player_pool["player_id"].values
 
 
 def test_single_threaded_path_still_available(sample_player_pool):
@@ -54,4 +57,30 @@ def test_single_threaded_path_still_available(sample_player_pool):
     pick = assistant.get_best_pick(sample_player_pool, current_pick=1,
                                     current_round=1, rosters=rosters, current_player=0)
 
-    assert pick in sample_player_pool["Player"].values
+    assert pick in sample_player_pool["player_id"].values
+
+
+@pytest.mark.slow
+def test_concurrent_searches_run_side_by_side(sample_player_pool):
+    cfg = _tiny_league_config()
+    rosters = {i: [] for i in range(cfg.num_teams)}
+    warm_up_workers(2)
+    elapsed = []
+
+    def search():
+        started = time.perf_counter()
+        get_best_pick_parallel(
+            sample_player_pool, cfg, initial_pick=1, current_pick=1, current_round=1,
+            rosters=rosters, current_player=0, exploration_constant=1.414,
+            time_limit=1, num_workers=2,
+        )
+        elapsed.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=search) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Queued behind each other the second search would take ~2s.
+    assert len(elapsed) == 2 and max(elapsed) < 1.8
@@ -0,0 +1,38 @@
+import pytest
+
+from project.webapp.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe("/api/pick", value=value)
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/api/pick",le="0.1"} 2',
+        'latency_seconds_bucket{route="/api/pick",le="1"} 3',
+        'latency_seconds_bucket{route="/api/pick",le="+Inf"} 4',
+        'latency_seconds_sum{route="/api/pick"} 3.65',
+        'latency_seconds_count{route="/api/pick"} 4',
+    ]
+
+
+def test_counters_gauges_and_collectors():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("status",))
+    in_flight = registry.gauge("in_flight", "In flight.")
+    requests.inc(200)
+    requests.inc(200, amount=2)
+    in_flight.inc()
+    in_flight.dec()
+    registry.add_collector(lambda: [("sessions", "gauge", "Sessions.", [({"kind": 'a"b'}, 3)])])
+
+    text = registry.render()
+    assert 'requests_total{status="200"} 3' in text
+    assert "in_flight 0" in text
+    assert 'sessions{kind="a\\"b"} 3' in text
+    with pytest.raises(ValueError):
+        requests.inc()
@@ -0,0 +1,112 @@
+import pandas as pd
+import pytest
+
+from project.data.nflverse_store import NflverseStore
+from project.management import data_generation as dg
+
+
+class FakeUpstream:
+    """Stands in for nfl_data_py: a season's data published `weeks` deep."""
+
+    def __init__(self, weeks=2, spread=-7.0, partial_week=None):
+        self.weeks = weeks
+        self.spread = spread
+        # A week published part-way through: only its first player so far.
+        self.partial_week = partial_week
+        self.calls = 0
+
+    def import_schedules(self, years):
+        self.calls += 1
+        return pd.DataFrame(
+            {
+                "game_id": [f"{years[0]}_{week:02d}_WAS_LA" for week in range(1, 5)],
+                "season": years[0],
+                "week": range(1, 5),
+                "home_team": "LA",
+                "away_team": "WAS",
+                "total_line": 50.0,
+                "spread_line": self.spread,
+                "stadium": "SoFi",  # upstream extras are dropped
+            }
+        )
+
+    def import_weekly_data(self, years):
+        weeks = range(1, self.weeks + 1)
+        weekly = pd.DataFrame(
+            {
+                "season": years[0],
+                "week": [week for week in weeks for _ in range(2)],
+                "player_id": ["00-1", "00-2"] * len(weeks),
+                "player_display_name": ["Puka Nacua", "Terry McLaurin"] * len(weeks),
+                "recent_team": ["LA", "WAS"] * len(weeks),
+                "fantasy_points": [10.0 * week + i for week in weeks for i in range(2)],
+            }
+        )
+        if self.partial_week is not None:
+            weekly = weekly.loc[(weekly["week"] != self.partial_week) | (weekly["player_id"] == "00-1")]
+        return weekly
+
+
+def test_ingest_rewrites_from_latest_week_and_upserts_schedules(tmp_path):
+    upstream = FakeUpstream(weeks=2, partial_week=2)
+    store = NflverseStore(tmp_path / "nflverse.sqlite", upstream=upstream)
+
+    assert store.ingested_at(2025) is None
+    assert store.ingest(2025) == {"schedules": 4, "weekly": 3}
+    first_ingest = store.ingested_at(2025)
+    # Week 2 finishes (with a stat correction) and week 3 is published.
+    upstream.weeks, upstream.spread, upstream.partial_week = 3, 3.0, None
+    with store._connect() as conn:
+        conn.execute("UPDATE weekly SET fantasy_points = 0 WHERE week = 1")
+    assert store.ingest(2025) == {"schedules": 4, "weekly": 4}
+    assert store.ingested_at(2025) >= first_ingest
+
+    assert store.status() == {2025: {"games": 4, "weekly_rows": 6, "latest_week": 3}}
+    schedules = store.import_schedules([2025])
+    assert schedules["spread_line"].tolist() == [3.0] * 4
+    assert "stadium" not in schedules.columns
+    weekly = store.import_weekly_data([2025], ["week", "fantasy_points"], weeks=[1, 2, 3])
+    assert weekly.columns.tolist() == ["week", "fantasy_points"]
+    assert weekly["week"].tolist() == [1, 1, 2, 2, 3, 3]
+    # Weeks before the latest stored one are left alone.
+    assert weekly["fantasy_points"].tolist() == [0.0, 0.0, 20.0, 21.0, 30.0, 31.0]
+
+
+def test_reads_ingest_a_missing_season_once_then_work_offline(tmp_path):
+    upstream = FakeUpstream()
+    store = NflverseStore(tmp_path / "nflverse.sqlite", upstream=upstream)
+
+    store.import_schedules([2025])
+    store.import_schedules([2025])
+    assert upstream.calls == 1
+
+    offline = NflverseStore(tmp_path / "nflverse.sqlite", upstream=object())
+    assert len(offline.import_weekly_data([2025])) == 4
+
+
+def test_preseason_with_no_weekly_rows_is_not_refetched(tmp_path):
+    upstream = FakeUpstream(weeks=0)
+    store = NflverseStore(tmp_path / "nflverse.sqlite", upstream=upstream)
+
+    assert store.import_weekly_data([2026]).empty
+    assert store.import_weekly_data([2026]).empty
+    assert upstream.calls == 1
+
+
+def test_missing_season_without_upstream_raises(tmp_path, monkeypatch):
+    def no_upstream():
+        raise ImportError("No module named 'nfl_data_py'")
+
+    monkeypatch.setattr("project.data.nflverse_store._upstream", no_upstream)
+    with pytest.raises(RuntimeError, match="ingest 2024"):
+        NflverseStore(tmp_path / "nflverse.sqlite").import_schedules([2024])
+
+
+def test_data_generation_reads_normalized_schedule_from_store(tmp_path, monkeypatch):
+    store = NflverseStore(tmp_path / "nflverse.sqlite", upstream=FakeUpstream())
+    monkeypatch.setattr(dg, "nflverse_source", lambda: store)
+
+    players = pd.DataFrame({"Player": ["Puka Nacua"], "Team": ["LAR"], "Position": ["WR"]})
+    out = dg.get_vegas_odds(players, 2025, 2)
+
+    assert out[["favored_flag", "pace_flag"]].values.tolist() == [[1, 1]]
@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+from project.data.live_rankings import (
+    DEFAULT_STATIC_CSV,
+    SYNTHETIC_ID_BASE,
+    load_static_fallback,
+    parse_sleeper_records,
+    with_player_ids,
+)
+from project.draft.config import LeagueConfig
+from project.draft.greedy import DraftEnv
+from project.draft.mcts import MCTSDraftEnv
+from project.draft.player_index import PlayerIndex
+from project.webapp.session import DraftSession
+
+
+def _pool_with_duplicate_name(sample_player_pool):
+    pool = sample_player_pool.copy()
+    # Two different players (different teams/positions) sharing a name.
+    pool.loc[pool["Player"] == "WR_2", "Team"] = "BBB"
+    pool.loc[pool["Player"].isin(["WR_1", "WR_2"]), "Player"] = "Mike Williams"
+    return with_player_ids(pool.drop(columns="player_id"))
+
+
+def test_sleeper_ids_are_kept_and_defenses_get_synthetic_ids():
+    records = {
+        "RB": [{"player_id": "4034", "stats": {"pts_ppr": 200.0},
+                "player": {"first_name": "A", "last_name": "Back", "team": "KC", "position": "RB"}}],
+        "DEF": [{"player_id": "KC", "stats": {"pts_ppr": 100.0},
+                 "player": {"first_name": "Kansas City", "last_name": "Chiefs", "team": "KC", "position": "DEF"}}],
+    }
+    df = parse_sleeper_records(records)
+
+    ids = dict(zip(df["Position"], df["player_id"]))
+    assert ids["RB"] == 4034
+    assert ids["DST"] >= SYNTHETIC_ID_BASE
+
+
+def test_static_csv_ids_are_stable_and_unique():
+    first = load_static_fallback()
+    second = with_player_ids(pd.read_csv(DEFAULT_STATIC_CSV))
+
+    assert first["player_id"].is_unique
+    assert first["player_id"].tolist() == second["player_id"].tolist()
+
+
+def test_player_index_resolves_ids_to_rows(sample_player_pool):
+    index = PlayerIndex(sample_player_pool)
+    pid = int(sample_player_pool.iloc[7]["player_id"])
+
+    assert pid in index
+    assert index.row(pid)["Player"] == sample_player_pool.iloc[7]["Player"]
+    with pytest.raises(KeyError):
+        index.position(-1)
+
+
+def test_same_name_players_are_drafted_independently_by_id(sample_player_pool):
+    pool = _pool_with_duplicate_name(sample_player_pool)
+    session = DraftSession(pool, LeagueConfig(num_teams=10), initial_pick=1)
+    first_id, second_id = session.players.ids_for_name("Mike Williams")
+
+    session.apply_pick(second_id)
+    assert session.rosters[0][0]["Team"] == "BBB"
+
+    # The name now resolves to the other, still-available Mike Williams.
+    session.apply_pick("Mike Williams")
+    assert session.rosters[1][0]["player_id"] == first_id
+
+    with pytest.raises(ValueError):
+        session.apply_pick("Mike Williams")
+
+    session.undo()
+    assert first_id in session.available_ids
+    assert second_id not in session.available_ids
+
+
+@pytest.mark.parametrize("make_env, pick", [
+    (lambda pool: DraftEnv(pool, LeagueConfig(num_teams=10)), lambda env, p: env.apply_pick(p, is_ours=False)),
+    (lambda pool: MCTSDraftEnv(pool, LeagueConfig(num_teams=10), mcts_time_limit=0), lambda env, p: env.make_pick(p)),
+])
+def test_cli_draft_envs_draft_same_name_players_one_at_a_time(sample_player_pool, make_env, pick):
+    pool = _pool_with_duplicate_name(sample_player_pool)
+    env = make_env(pool)
+
+    pick(env, "Mike Williams")
+    assert env.available_players["Player"].tolist().count("Mike Williams") == 1
+    pick(env, "Mike Williams")
+    assert "Mike Williams" not in env.available_players["Player"].tolist()
+    assert len(env.available_players) == len(pool) - 2
+
+    with pytest.raises(ValueError, match="already selected"):
+        pick(env, "Mike Williams")
+    with pytest.raises(ValueError, match="not found"):
+        pick(env, "Not A Real Player")
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from project.data.live_rankings import load_static_fallback
+from project.data.player_search import EXACT, PlayerSearchIndex, normalize_name
+from project.draft.config import LeagueConfig
+from project.webapp.session import DraftSession
+
+
+@pytest.fixture(scope="module")
+def real_pool():
+    return load_static_fallback()
+
+
+@pytest.fixture(scope="module")
+def index(real_pool):
+    return PlayerSearchIndex(real_pool)
+
+
+def _names(real_pool, hits):
+    by_id = dict(zip(real_pool["player_id"], real_pool["Player"]))
+    return [by_id[player_id] for player_id, _, _ in hits]
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("Ja'Marr Chase", "jamarr chase"),
+        ("Marvin Harrison Jr.", "marvin harrison"),
+        ("Amon-Ra St. Brown", "amon ra st brown"),
+        ("D.J. Moore", "dj moore"),
+        ("Kenneth Walker III", "kenneth walker"),
+    ],
+)
+def test_normalize_name(raw, expected):
+    assert normalize_name(raw) == expected
+
+
+def test_punctuation_and_case_insensitive_exact_match(index, real_pool):
+    hits = index.search("jamarr chase", limit=3)
+    assert _names(real_pool, hits)[0] == "Ja'Marr Chase"
+    assert hits[0][1] == EXACT
+
+
+def test_prefix_and_out_of_order_word_prefixes(index, real_pool):
+    assert _names(real_pool, index.search("bijan", limit=1)) == ["Bijan Robinson"]
+    assert _names(real_pool, index.search("chase ja", limit=1)) == ["Ja'Marr Chase"]
+
+
+def test_typo_tolerant_ranking(index, real_pool):
+    assert _names(real_pool, index.search("Justin Jeferson", limit=1)) == ["Justin Jefferson"]
+
+
+def test_allowed_ids_filters_results(index, real_pool):
+    chase_id = index.search("jamarr chase", limit=1)[0][0]
+    hits = index.search("jamarr chase", limit=5, allowed_ids=set(real_pool["player_id"]) - {chase_id})
+    assert chase_id not in [player_id for player_id, _, _ in hits]
+
+
+def test_search_is_sub_millisecond(index):
+    queries = ["ja", "chase", "justin jeferson", "mahomes", "st brown"]
+    started = time.perf_counter()
+    for _ in range(20):
+        for q in queries:
+            index.search(q, limit=10)
+    per_query_ms = (time.perf_counter() - started) * 1000 / (20 * len(queries))
+    assert per_query_ms < 1.0
+
+
+def test_apply_pick_resolves_slightly_off_names(real_pool):
+    session = DraftSession(real_pool, LeagueConfig(), initial_pick=1)
+
+    session.apply_pick("Jamarr Chase")
+    assert session.pick_history[-1]["player"]["Player"] == "Ja'Marr Chase"
+
+    with pytest.raises(ValueError, match="already been drafted"):
+        session.apply_pick("ja'marr chase")
+    with pytest.raises(ValueError, match="Unknown player"):
+        session.apply_pick("Not A Real Player")
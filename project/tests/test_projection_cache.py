@@ -0,0 +1,142 @@
+import pytest
+
+from project.data import live_rankings
+from project.data.live_rankings import (
+    SCORING_FIELD,
+    SLEEPER_POSITIONS,
+    _assign_overall_rank,
+    load_static_fallback,
+    parse_sleeper_records,
+    select_scoring,
+)
+from project.data.projection_cache import ProjectionCache
+
+# validate_rankings requires a 300-700 row pool.
+PER_POSITION = 60
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch):
+    monkeypatch.setattr(live_rankings, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(live_rankings, "BACKOFF_CAP", 0.02)
+
+
+def _cache(tmp_path, stub, clock, ttl=3600):
+    return ProjectionCache(
+        cache_dir=tmp_path, ttl=ttl, clock=clock, fetch_kwargs={"base_url": stub.base_url, "deadline": 2}
+    )
+
+
+def test_cold_fetch_is_persisted_and_served_from_disk(tmp_path, sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS, PER_POSITION)
+    clock = FakeClock()
+
+    first = _cache(tmp_path, sleeper_stub, clock).get(2026, "ppr")
+    assert len(first) == PER_POSITION * len(SLEEPER_POSITIONS)
+    requests_after_cold = len(sleeper_stub.requests)
+
+    # A fresh instance (i.e. a restarted process) reads the disk tier.
+    second = _cache(tmp_path, sleeper_stub, clock).get(2026, "ppr")
+    assert len(sleeper_stub.requests) == requests_after_cold
+    assert second["Player"].tolist() == first["Player"].tolist()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_stale_entry_is_served_then_revalidated_conditionally(tmp_path, sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS, PER_POSITION)
+    clock = FakeClock()
+    cache = _cache(tmp_path, sleeper_stub, clock, ttl=60)
+    original = cache.get(2026, "ppr")
+
+    clock.now += 61
+    sleeper_stub.payloads["QB"][0]["stats"]["pts_ppr"] = 999.0
+    stale = cache.get(2026, "ppr")
+    assert stale is original  # returned immediately, not after a refetch
+
+    cache.wait_for_refreshes(timeout=5)
+    assert sorted(sleeper_stub.not_modified) == sorted(set(SLEEPER_POSITIONS) - {"QB"})
+
+    refreshed = cache.get(2026, "ppr")
+    assert refreshed.iloc[0]["Total_FPTS"] == 999.0
+
+
+def test_outage_keeps_serving_last_good_pool(tmp_path, sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS, PER_POSITION)
+    clock = FakeClock()
+    cache = _cache(tmp_path, sleeper_stub, clock, ttl=60)
+    original = cache.get(2026, "ppr")
+
+    clock.now += 3600
+    sleeper_stub.failures = {pos: 1000 for pos in SLEEPER_POSITIONS}
+    cache.get(2026, "ppr")
+    cache.wait_for_refreshes(timeout=5)
+
+    restarted = _cache(tmp_path, sleeper_stub, clock, ttl=60).get(2026, "ppr")
+    assert restarted["Player"].tolist() == original["Player"].tolist()
+    assert restarted["Player"].tolist() != load_static_fallback()["Player"].tolist()
+
+
+def test_cold_cache_outage_falls_back_to_static(tmp_path, sleeper_stub):
+    sleeper_stub.failures = {pos: 1000 for pos in SLEEPER_POSITIONS}
+    df = _cache(tmp_path, sleeper_stub, FakeClock()).get(2026, "ppr")
+    assert df["Player"].tolist() == load_static_fallback()["Player"].tolist()
+
+
+def test_forced_sleeper_source_raises_on_outage(tmp_path, sleeper_stub):
+    sleeper_stub.failures = {pos: 1000 for pos in SLEEPER_POSITIONS}
+    with pytest.raises(RuntimeError):
+        _cache(tmp_path, sleeper_stub, FakeClock()).get(2026, "ppr", source="sleeper")
+
+
+def test_one_fetch_serves_every_scoring_format(tmp_path, sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS, PER_POSITION)
+    # Make format orders disagree: a pass-catching RB who's great in PPR only,
+    # and a WR with no standard projection at all.
+    sleeper_stub.payloads["RB"][-1]["stats"].update(pts_ppr=500.0, pts_half_ppr=150.0, pts_std=-100.0)
+    del sleeper_stub.payloads["WR"][0]["stats"]["pts_std"]
+    cache = _cache(tmp_path, sleeper_stub, FakeClock())
+
+    pools = {scoring: cache.get(2026, scoring) for scoring in SCORING_FIELD}
+    assert len(sleeper_stub.requests) == len(SLEEPER_POSITIONS)
+    assert pools["ppr"].iloc[0]["Player"] == f"RB Player{PER_POSITION}"
+    assert pools["standard"].iloc[-1]["Player"] == f"RB Player{PER_POSITION}"
+    assert len(pools["standard"]) == len(pools["ppr"]) - 1
+    assert cache.get(2026, "half_ppr") is pools["half_ppr"]
+
+    records = {pos: sleeper_stub.payloads[pos] for pos in SLEEPER_POSITIONS}
+    for scoring, pool in pools.items():
+        expected = _assign_overall_rank(parse_sleeper_records(records, scoring))
+        assert pool["Player"].tolist() == expected["Player"].tolist()
+        assert pool["Rank"].tolist() == expected["Rank"].tolist()
+        assert pool["Total_FPTS"].tolist() == expected["Total_FPTS"].tolist()
+
+
+def test_format_failing_validation_is_dropped_alone(tmp_path, sleeper_stub):
+    sleeper_stub.serve(SLEEPER_POSITIONS, PER_POSITION)
+    # Half-PPR only for a handful of players: under validate_rankings' row
+    # floor, so only that format is dropped.
+    for pos in SLEEPER_POSITIONS:
+        for record in sleeper_stub.payloads[pos][5:]:
+            del record["stats"]["pts_half_ppr"]
+    cache = _cache(tmp_path, sleeper_stub, FakeClock())
+
+    assert len(cache.get(2026, "ppr")) == PER_POSITION * len(SLEEPER_POSITIONS)
+    assert len(cache.get(2026, "standard")) == PER_POSITION * len(SLEEPER_POSITIONS)
+    # The dropped format falls back to the static CSV rather than serving a
+    # pool that failed validation.
+    assert cache.get(2026, "half_ppr")["Player"].tolist() == load_static_fallback()["Player"].tolist()
+    with pytest.raises(ValueError, match="half_ppr"):
+        select_scoring(cache._lookup(2026)[0], "half_ppr")
+
+
+def test_unknown_scoring_format_is_rejected(tmp_path, sleeper_stub):
+    with pytest.raises(ValueError):
+        _cache(tmp_path, sleeper_stub, FakeClock()).get(2026, "superflex")
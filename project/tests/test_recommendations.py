@@ -0,0 +1,37 @@
+from project.webapp.recommendations import RecommendationCache, recommendation_key
+
+
+def _state(pick=1, rosters=((), ())):
+    return {"league": {"num_teams": 2}, "pool": "abc", "our_team_idx": 0, "pick": pick, "rosters": [list(r) for r in rosters]}
+
+
+def test_key_is_canonical_and_parameter_sensitive():
+    key = recommendation_key(_state(), "greedy", {"n": 5})
+    assert key == recommendation_key(_state(), "greedy", {"n": 5})
+    assert key != recommendation_key(_state(), "greedy", {"n": 3})
+    assert key != recommendation_key(_state(), "mcts", {"n": 5})
+    assert key != recommendation_key(_state(pick=2, rosters=((7,), ())), "greedy", {"n": 5})
+
+
+def test_memory_tier_is_lru():
+    cache = RecommendationCache(max_entries=2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.put("c", {"v": 3})  # evicts b, the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1} and cache.get("c") == {"v": 3}
+    assert cache.stats()["memory_hits"] == 3 and cache.stats()["misses"] == 1
+
+
+def test_disk_tier_survives_a_new_process(tmp_path):
+    key = recommendation_key(_state(), "mcts", {"time_limit": 1})
+    RecommendationCache(directory=tmp_path).put(key, {"player_id": 4, "playouts": 10})
+
+    fresh = RecommendationCache(directory=tmp_path)
+    assert fresh.get(key) == {"player_id": 4, "playouts": 10}
+    assert fresh.get(key) == {"player_id": 4, "playouts": 10}
+    assert (fresh.stats()["disk_hits"], fresh.stats()["memory_hits"]) == (1, 1)
+
+    (tmp_path / key[:2] / f"{key}.json").write_text("{torn", encoding="utf-8")
+    assert RecommendationCache(directory=tmp_path).get(key) is None
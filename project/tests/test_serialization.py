@@ -0,0 +1,55 @@
+import json
+
+import numpy as np
+
+from project.draft.config import LeagueConfig
+from project.webapp.serialization import RawJSON, dumps, encode_delta, encode_players, encode_state
+from project.webapp.session import DraftSession
+
+
+def _plain(value):
+    """The JSON the old dict path produced: numpy scalars as Python ones."""
+    return json.loads(json.dumps(value, default=lambda v: v.item()))
+
+
+def _session(pool):
+    session = DraftSession(pool, LeagueConfig(num_teams=4), initial_pick=2)
+    for player_id in pool["player_id"].iloc[:6]:
+        session.apply_pick(int(player_id))
+    return session
+
+
+def test_dumps_splices_raw_fragments_and_numpy_scalars():
+    encoded = dumps({"a": RawJSON(b'{"x":1}'), "b": [np.int64(2), RawJSON(b"[3]")], "c": np.float64(1.5)})
+    assert json.loads(encoded) == {"a": {"x": 1}, "b": [2, [3]], "c": 1.5}
+
+
+def test_encode_state_matches_state_dict(sample_player_pool):
+    session = _session(sample_player_pool)
+    encoded = json.loads(dumps(encode_state(session, state_version=session.state_version)))
+    assert encoded == _plain({**session.state(), "state_version": session.state_version})
+    assert [p["player_id"] for p in encoded["our_roster"]] == session.our_roster_ids()
+
+
+def test_encode_delta_matches_delta_dict(sample_player_pool):
+    session = _session(sample_player_pool)
+    session.undo()
+    for since in (2, 0, -1):
+        encoded = json.loads(dumps(encode_delta(session, session.delta_since(since))))
+        assert encoded == _plain(session.delta_since(since))
+
+
+def test_player_fragments_follow_pool_swaps(sample_player_pool):
+    session = _session(sample_player_pool)
+    updated = sample_player_pool.copy()
+    updated["Total_FPTS"] = 1.0
+    session.swap_player_pool(updated)
+    encoded = json.loads(dumps(encode_state(session)))
+    assert {entry["player"]["Total_FPTS"] for entry in encoded["pick_history"]} == {1.0}
+
+
+def test_encode_players_lists_available_rows_in_pool_order(sample_player_pool):
+    session = _session(sample_player_pool)
+    encoded = json.loads(dumps(encode_players(session.shared_pool, session.available_positions())))
+    expected = session.available_players[["Rank", "Player", "Team", "Position", "Total_FPTS", "Average_FPTS", "player_id"]]
+    assert encoded == expected.to_dict(orient="records")
@@ -0,0 +1,70 @@
+import pytest
+
+from project.draft.config import LeagueConfig
+from project.webapp.session import DraftSession, SessionRegistry, SharedPlayerPool
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _session(shared):
+    return DraftSession(shared, LeagueConfig(num_teams=10), initial_pick=1)
+
+
+def test_sessions_share_one_pool_and_keep_independent_state(sample_player_pool):
+    registry = SessionRegistry()
+    shared = registry.shared_pool((2026, "ppr"), sample_player_pool)
+    assert registry.shared_pool((2026, "ppr"), sample_player_pool.copy()) is shared
+
+    first_id = registry.add(_session(shared))
+    second_id = registry.add(_session(shared))
+    first, second = registry.get(first_id), registry.get(second_id)
+    assert first.players is second.players and first.search is second.search
+
+    first.apply_pick(int(sample_player_pool["player_id"].iloc[0]))
+    assert len(first.pick_history) == 1 and second.pick_history == []
+    assert len(second.available_players) == len(sample_player_pool)
+    assert registry.stats()["shared_pools"] == 1
+
+
+def test_idle_sessions_expire(sample_player_pool):
+    clock = FakeClock()
+    registry = SessionRegistry(idle_timeout=60, clock=clock)
+    shared = SharedPlayerPool(sample_player_pool)
+    stale_id = registry.add(_session(shared))
+    clock.now += 30
+    fresh_id = registry.add(_session(shared))
+
+    clock.now += 45
+    assert registry.get(fresh_id) is not None
+    with pytest.raises(KeyError):
+        registry.get(stale_id)
+    assert registry.stats()["evictions"]["idle"] == 1
+
+
+def test_least_recently_used_session_is_evicted_at_capacity(sample_player_pool):
+    registry = SessionRegistry(max_sessions=2)
+    shared = SharedPlayerPool(sample_player_pool)
+    a, b = registry.add(_session(shared)), registry.add(_session(shared))
+    registry.get(a)  # b is now least recently used
+
+    c = registry.add(_session(shared))
+    assert a in registry and c in registry and b not in registry
+
+
+def test_memory_budget_trims_then_evicts(sample_player_pool):
+    shared = SharedPlayerPool(sample_player_pool)
+    one = _session(shared)
+    budget = shared.memory_bytes + 2 * one.memory_bytes() + 1024
+    registry = SessionRegistry(max_memory_bytes=budget)
+
+    ids = [registry.add(_session(shared)) for _ in range(5)]
+    stats = registry.stats()
+    assert stats["memory_bytes"] <= budget
+    assert stats["evictions"]["memory"] == 3
+    assert ids[-1] in registry and ids[0] not in registry
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from project.data.live_rankings import DEFAULT_STATIC_CSV, load_static_fallback
+from project.data.snapshot import (
+    file_fingerprint,
+    read_snapshot,
+    read_snapshot_columns,
+    snapshot_path_for,
+    write_snapshot,
+)
+
+
+def _write(df, path, meta=None):
+    with open(path, "wb") as f:
+        write_snapshot(df, f, meta=meta)
+
+
+def test_round_trip_preserves_columns_values_and_order(tmp_path):
+    df = pd.read_csv(DEFAULT_STATIC_CSV)
+    path = tmp_path / "pool.ffpool"
+    _write(df, path, meta={"fetched_at": 123.0})
+
+    loaded, meta = read_snapshot(path)
+
+    assert meta == {"fetched_at": 123.0}
+    assert list(loaded.columns) == list(df.columns)
+    for col in df.columns:
+        assert loaded[col].tolist() == df[col].tolist()
+    assert loaded["Rank"].dtype == np.int64
+
+
+def test_strings_are_interned_and_columns_are_memory_mapped(tmp_path, sample_player_pool):
+    path = tmp_path / "pool.ffpool"
+    _write(sample_player_pool, path)
+
+    columns, strings, _ = read_snapshot_columns(path)
+
+    assert isinstance(columns["Total_FPTS"], np.memmap)
+    assert columns["Team"].dtype == np.dtype("<i4")
+    # 33 player names + one team + six positions, each stored once.
+    assert len(strings) == len(sample_player_pool) + 1 + 6
+    assert [strings[c] for c in columns["Position"]] == sample_player_pool["Position"].tolist()
+
+
+def test_missing_strings_round_trip_as_none(tmp_path):
+    df = pd.DataFrame({"Player": ["A", None], "Total_FPTS": [1.0, 2.0]})
+    path = tmp_path / "pool.ffpool"
+    _write(df, path)
+
+    loaded, _ = read_snapshot(path)
+
+    assert loaded["Player"].tolist()[0] == "A"
+    assert pd.isna(loaded["Player"].tolist()[1])
+
+
+def test_static_fallback_ignores_snapshot_built_from_other_csv(tmp_path):
+    csv_path = tmp_path / "data" / "pool.csv"
+    csv_path.parent.mkdir()
+    cache_dir = tmp_path / "cache"
+    csv_path.write_bytes(DEFAULT_STATIC_CSV.read_bytes())
+    original = load_static_fallback(csv_path, cache_dir)
+    cached = cache_dir / "static_pool.ffpool"
+    assert cached.exists()
+    assert not snapshot_path_for(csv_path).exists()
+
+    edited = original.copy()
+    edited.loc[0, "Player"] = "Edited Name"
+    edited.to_csv(csv_path, index=False)
+
+    assert load_static_fallback(csv_path, cache_dir).loc[0, "Player"] == "Edited Name"
+    _, meta = read_snapshot(cached)
+    assert meta == file_fingerprint(csv_path)
+
+
+def test_static_fallback_prefers_snapshot_shipped_next_to_csv(tmp_path):
+    csv_path = tmp_path / "pool.csv"
+    csv_path.write_bytes(DEFAULT_STATIC_CSV.read_bytes())
+    shipped = pd.read_csv(csv_path)
+    shipped.loc[0, "Player"] = "From Snapshot"
+    _write(shipped, snapshot_path_for(csv_path), meta=file_fingerprint(csv_path))
+
+    assert load_static_fallback(csv_path, tmp_path / "cache").loc[0, "Player"] == "From Snapshot"
+    assert not (tmp_path / "cache").exists()
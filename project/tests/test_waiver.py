@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from project.management.data_generation import FLAG_COLUMNS, FlagCube
+from project.management.waiver import DEFAULT_WEIGHTS, PROJECTION_WEIGHT, WaiverRanker, load_projections, parse_roster
+
+
+def _ranker(n=80, seed=0):
+    rng = np.random.default_rng(seed)
+    players = pd.DataFrame(
+        {"Player": [f"P{i}" for i in range(n)], "Team": "KC", "Position": rng.choice(["QB", "RB", "WR", "K"], n)},
+        index=np.arange(n) * 3,
+    )
+    cube = FlagCube(players, rng.choice([-1, 0, 1], (n, 18, len(FLAG_COLUMNS))).astype("int8"))
+    return WaiverRanker(cube, rng.uniform(2, 25, n))
+
+
+def test_scores_combine_weighted_flags_and_projection_z_by_position():
+    ranker = _ranker()
+    week, row = 7, 11
+    position = ranker.players["Position"].iloc[row]
+    same = (ranker.players["Position"] == position).to_numpy()
+    z = (ranker.projections[row] - ranker.projections[same].mean()) / ranker.projections[same].std()
+    flags = ranker.cube.flags[row, week - 1]
+    expected = sum(DEFAULT_WEIGHTS[col] * flag for col, flag in zip(FLAG_COLUMNS, flags)) + PROJECTION_WEIGHT * z
+
+    assert np.isclose(ranker.scores[row, week - 1], expected)
+
+
+def test_rank_returns_top_k_available_per_position_in_score_order():
+    ranker = _ranker()
+    rostered = parse_roster("P1\n P2 \n\nNot A Player\n")
+    assert rostered == {"P1", "P2", "Not A Player"}
+
+    ranked = ranker.rank(4, rostered, k=3)
+
+    scores = pd.Series(ranker.scores[:, 3], index=ranker.players["Player"].to_numpy())
+    positions = ranker.players["Position"].to_numpy()
+    for pos, group in ranked.groupby("Position", sort=False):
+        pool = scores[(positions == pos) & ~scores.index.isin(rostered)]
+        assert group["Player"].tolist() == pool.sort_values(ascending=False, kind="stable").index[:3].tolist()
+        assert group["rank"].tolist() == [1, 2, 3]
+    assert not ranked["Player"].isin(rostered).any()
+
+
+def test_rank_leagues_and_reasons():
+    ranker = _ranker()
+    leagues = ranker.rank_leagues(9, {"home": {"P0"}, "work": set()}, k=2)
+    assert set(leagues) == {"home", "work"}
+    assert "P0" not in leagues["home"]["Player"].tolist()
+
+    row = int(np.flatnonzero(ranker.cube.flags[:, 8, 0] == 1)[0])
+    assert "favored this week" in ranker.reasons(row, 9)
+
+
+def test_projections_join_on_player_not_row_position(tmp_path):
+    csv = tmp_path / "cleaned_data.csv"
+    pd.DataFrame(
+        {
+            "Player": ["B", "A", "A"],
+            "Team": ["KC", "KC", "SF"],
+            "Position": ["WR", "RB", "RB"],
+            "Average_FPTS": [20.0, 10.0, 5.0],
+        }
+    ).to_csv(csv, index=False)
+    # As built from an older CSV where A (KC) ranked first.
+    players = pd.DataFrame({"Player": ["A", "B", "C"], "Team": ["KC", "KC", "KC"], "Position": ["RB", "WR", "TE"]})
+
+    assert load_projections(players, csv).tolist() == [10.0, 20.0, 0.0]
@@ -3,7 +3,9 @@ from fastapi.testclient import TestClient
 
 from project.draft.config import LeagueConfig
 from project.draft.greedy import GreedyDraftAssistant
+from project.draft.mcts import MCTSDraftAssistant
 from project.webapp import session as session_module
+from project.webapp.recommendations import get_recommendation_cache
 from project.webapp.server import app
 from project.webapp.session import DraftSession
 
@@ -12,9 +14,13 @@ client = TestClient(app)
 
 @pytest.fixture(autouse=True)
 def _reset_session():
-    session_module._session = None
+    session_module.get_registry().clear()
+    get_recommendation_cache().clear()
+    client.cookies.clear()
     yield
-    session_module._session = None
+    session_module.get_registry().clear()
+    get_recommendation_cache().clear()
+    client.cookies.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -22,7 +28,7 @@ def _no_network_player_pool(sample_player_pool, monkeypatch):
     """Every /api/session call in these tests must use the deterministic
     fixture pool instead of hitting the live Sleeper API."""
 
-    def fake_loader(source="auto", scoring="ppr"):
+    def fake_loader(source="auto", season=2026, scoring="ppr"):
         return sample_player_pool.copy()
 
     monkeypatch.setattr(session_module, "load_player_pool", fake_loader)
@@ -63,9 +69,19 @@ def test_players_endpoint_returns_full_pool_before_any_pick(sample_player_pool):
     assert len(resp.json()) == len(sample_player_pool)
 
 
-def test_recommend_greedy_matches_direct_assistant_call(sample_player_pool):
+def test_large_payloads_are_gzipped_small_ones_are_not():
     _create_session()
-    session = session_module.get_session()
+    players = client.get("/api/players", headers={"Accept-Encoding": "gzip"})
+    assert players.headers["content-encoding"] == "gzip"
+    assert players.json()[0]["Rank"] == 1
+
+    delta = client.get("/api/state/delta?since=0", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in delta.headers
+
+
+def test_recommend_greedy_matches_direct_assistant_call(sample_player_pool):
+    session_id = _create_session().json()["session_id"]
+    session = session_module.get_session(session_id)
 
     resp = client.get("/api/recommend/greedy?n=3")
     assert resp.status_code == 200
@@ -113,10 +129,254 @@ def test_recommend_mcts_returns_available_player(sample_player_pool):
         flex_eligible=(),
         bench_slots=1,
     )
-    session_module._session = DraftSession(sample_player_pool, cfg, initial_pick=1, mcts_time_limit=1)
+    session_id = session_module.get_registry().add(
+        DraftSession(sample_player_pool, cfg, initial_pick=1, mcts_time_limit=1)
+    )
+    client.cookies.set("draft_session", session_id)
 
     resp = client.post("/api/recommend/mcts")
     assert resp.status_code == 200
     body = resp.json()
     assert body["player"]["Player"] in sample_player_pool["Player"].values
     assert body["time_limit_used"] == 1
+
+
+def test_pick_by_player_id(sample_player_pool):
+    _create_session()
+    top = sample_player_pool.sort_values("Rank").iloc[0]
+
+    resp = client.post("/api/pick", json={"player_id": int(top["player_id"])})
+    assert resp.status_code == 200
+    assert resp.json()["applied"]["player"]["Player"] == top["Player"]
+
+
+def test_pick_requires_exactly_one_identifier(sample_player_pool):
+    _create_session()
+    top = sample_player_pool.sort_values("Rank").iloc[0]
+
+    assert client.post("/api/pick", json={}).status_code == 400
+    both = {"player": top["Player"], "player_id": int(top["player_id"])}
+    assert client.post("/api/pick", json=both).status_code == 400
+
+
+def test_player_search_returns_top_k_available_only(sample_player_pool):
+    _create_session()
+
+    resp = client.get("/api/players/search?q=qb&limit=3")
+    assert resp.status_code == 200
+    assert [p["Player"] for p in resp.json()] == ["QB_1", "QB_2", "QB_3"]
+
+    client.post("/api/pick", json={"player": "QB_1"})
+    names = [p["Player"] for p in client.get("/api/players/search?q=qb_1").json()]
+    assert "QB_1" not in names
+
+
+def test_refresh_projections_keeps_pick_history(sample_player_pool, monkeypatch):
+    _create_session()
+    top = sample_player_pool.iloc[0]
+    client.post("/api/pick", json={"player_id": int(top["player_id"])})
+
+    refreshed = sample_player_pool.copy()
+    refreshed.loc[refreshed["player_id"] == top["player_id"], "Total_FPTS"] = 1.0
+    monkeypatch.setattr(session_module, "load_player_pool", lambda source, season, scoring: refreshed.copy())
+
+    resp = client.post("/api/session/refresh-projections", json={})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["swap"]["changed"] == 1
+    assert body["state"]["pool_version"] == 1
+    assert body["state"]["current_pick"] == 2
+    assert body["state"]["our_roster"][0]["Total_FPTS"] == 1.0
+
+
+def test_refresh_projections_reports_upstream_failure_as_503(sample_player_pool, monkeypatch):
+    _create_session()
+
+    def outage(source, season, scoring):
+        raise ConnectionError("Sleeper is down")
+
+    monkeypatch.setattr(session_module, "load_player_pool", outage)
+
+    resp = client.post("/api/session/refresh-projections", json={})
+    assert resp.status_code == 503
+    assert "Sleeper is down" in resp.json()["detail"]
+    assert client.post("/api/session/refresh-projections", json={"source": "nope"}).status_code == 400
+
+
+def test_refresh_projections_refuses_pool_with_other_id_space(sample_player_pool, monkeypatch):
+    _create_session()
+    client.post("/api/pick", json={"player": "QB_1"})
+
+    # The same players under Sleeper ids, as after a draft started offline.
+    sleeper_pool = sample_player_pool.copy()
+    sleeper_pool["player_id"] = range(1000, 1000 + len(sleeper_pool))
+    monkeypatch.setattr(session_module, "load_player_pool", lambda source, season, scoring: sleeper_pool.copy())
+
+    resp = client.post("/api/session/refresh-projections", json={})
+    assert resp.status_code == 409
+    state = client.get("/api/state").json()
+    assert state["pool_version"] == 0
+    assert "QB_1" not in [p["Player"] for p in client.get("/api/players").json()]
+
+
+def test_undo_redo_jump_endpoints(sample_player_pool):
+    _create_session()
+    for player_id in sample_player_pool["player_id"].tolist()[:4]:
+        client.post("/api/pick", json={"player_id": player_id})
+
+    assert client.post("/api/undo?steps=2").json()["current_pick"] == 3
+    redone = client.post("/api/redo").json()
+    assert redone["current_pick"] == 4
+    assert redone["redo_available"] == 1
+
+    assert client.post("/api/jump", json={"pick_number": 1}).json()["pick_history"] == []
+    assert client.post("/api/jump", json={"pick_number": 9}).status_code == 400
+
+
+def test_concurrent_sessions_are_isolated(sample_player_pool):
+    first = _create_session().json()["session_id"]
+    second = client.post(
+        "/api/session", json={"num_teams": 8, "initial_pick": 3}, headers={"X-Draft-Session": "ignored"}
+    ).json()["session_id"]
+    assert first != second
+
+    top_id = int(sample_player_pool["player_id"].iloc[0])
+    resp = client.post("/api/pick", json={"player_id": top_id}, headers={"X-Draft-Session": first})
+    assert resp.status_code == 200
+
+    second_state = client.get("/api/state", headers={"X-Draft-Session": second}).json()
+    assert second_state["pick_history"] == []
+    assert second_state["league_config"]["num_teams"] == 8
+    assert client.get("/api/state", headers={"X-Draft-Session": first}).json()["current_pick"] == 2
+
+
+def test_unknown_or_ended_session_returns_404():
+    assert client.get("/api/state").status_code == 404
+    _create_session()
+    assert client.delete("/api/session").status_code == 200
+    assert client.get("/api/state").status_code == 404
+
+
+def test_state_etag_and_delta_endpoint(sample_player_pool):
+    _create_session()
+    first = client.get("/api/state")
+    etag = first.headers["etag"]
+    assert client.get("/api/state", headers={"If-None-Match": etag}).status_code == 304
+
+    version = first.json()["state_version"]
+    pick = client.post(f"/api/pick?since={version}", json={"player_id": int(sample_player_pool["player_id"].iloc[0])})
+    delta = pick.json()["next"]
+    assert delta["since"] == version and delta["version"] == version + 1
+    assert [change["op"] for change in delta["changes"]] == ["pick"]
+    assert "pick_history" not in delta["summary"]
+
+    assert client.get("/api/state", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get(f"/api/state/delta?since={delta['version']}").json()["changes"] == []
+
+
+def test_websocket_pushes_deltas(sample_player_pool):
+    session_id = _create_session().json()["session_id"]
+    with client.websocket_connect(f"/api/ws?session={session_id}") as ws:
+        initial = ws.receive_json()
+        assert initial["full"]["current_pick"] == 1
+
+        client.post("/api/pick", json={"player_id": int(sample_player_pool["player_id"].iloc[0])})
+        pushed = ws.receive_json()
+        assert pushed["since"] == initial["version"]
+        assert pushed["changes"][0]["entry"]["pick_number"] == 1
+        assert pushed["summary"]["current_pick"] == 2
+
+
+def test_batch_pick_endpoint(sample_player_pool):
+    _create_session()
+    ids = sample_player_pool["player_id"].tolist()
+    version = client.get("/api/state").json()["state_version"]
+
+    resp = client.post(
+        f"/api/picks?since={version}",
+        json={"start_pick": 1, "picks": [{"player_id": pid} for pid in ids[:15]]},
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [applied["pick_number"] for applied in body["applied"]] == list(range(1, 16))
+    assert body["next"]["summary"]["current_pick"] == 16
+
+    rejected = client.post("/api/picks", json={"picks": [{"player_id": ids[20]}, {"player_id": ids[0]}]})
+    assert rejected.status_code == 400
+    assert "Pick 17" in rejected.json()["detail"]
+    assert client.get("/api/state").json()["current_pick"] == 16
+
+
+def test_greedy_recommendation_is_shared_across_identical_boards(sample_player_pool):
+    first = _create_session().json()["session_id"]
+    miss = client.get("/api/recommend/greedy?n=5").json()
+    second = _create_session().json()["session_id"]
+    hit = client.get("/api/recommend/greedy?n=5").json()
+    assert first != second
+    assert (miss["cached"], hit["cached"]) == (False, True)
+    assert hit["candidates"] == miss["candidates"]
+
+    client.post("/api/pick", json={"player_id": int(sample_player_pool["player_id"].iloc[0])})
+    assert client.get("/api/recommend/greedy?n=5").json()["cached"] is False
+    stats = client.get("/api/recommend/cache").json()
+    assert (stats["memory_hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+
+def test_mcts_recommendation_cached_with_playouts_and_refinable(sample_player_pool, monkeypatch):
+    ids = sample_player_pool["player_id"].tolist()
+    searches = []
+
+    def fake_search(self, available_players, current_pick, current_round, rosters, current_player):
+        searches.append(current_pick)
+        return {ids[0]: 30, ids[1]: 50}
+
+    monkeypatch.setattr(MCTSDraftAssistant, "search_visit_counts", fake_search)
+    _create_session()
+
+    first = client.post("/api/recommend/mcts").json()
+    again = client.post("/api/recommend/mcts").json()
+    assert len(searches) == 1
+    assert first["player"]["player_id"] == again["player"]["player_id"] == ids[1]
+    assert (first["playouts"], first["player_playouts"], first["cached"]) == (80, 50, False)
+    assert (again["playouts"], again["cached"]) == (80, True)
+
+    refined = client.post("/api/recommend/mcts?refine=true").json()
+    assert len(searches) == 2
+    assert (refined["playouts"], refined["player_playouts"], refined["refined"]) == (160, 100, True)
+    assert client.post("/api/recommend/mcts").json()["playouts"] == 160
+
+
+def test_metrics_endpoint_reports_routes_engines_and_sessions(sample_player_pool):
+    _create_session()
+    client.get("/api/recommend/greedy?n=5")
+    client.get("/api/recommend/greedy?n=5")
+    client.post("/api/pick", json={"player_id": int(sample_player_pool["player_id"].iloc[0])})
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    text = resp.text
+    # Labelled by route template, not raw path.
+    assert 'draft_http_request_duration_seconds_count{method="POST",route="/api/pick"}' in text
+    assert 'draft_http_requests_total{method="GET",route="/api/recommend/greedy",status="200"}' in text
+    assert 'draft_greedy_recommendations_total{cached="true"}' in text
+    assert "draft_sessions 1" in text
+    assert 'draft_recommendation_cache_lookups_total{result="memory_hit"} 1' in text
+    assert 'draft_pool_load_duration_seconds_count{source="auto"}' in text
+
+
+def test_mcts_recommendation_dropped_by_refresh_mid_search_is_409(sample_player_pool, monkeypatch):
+    ids = sample_player_pool["player_id"].tolist()
+    session_id = _create_session().json()["session_id"]
+    session = session_module.get_session(session_id)
+
+    def fake_search(self, available_players, current_pick, current_round, rosters, current_player):
+        # A projections refresh lands while the search runs and drops the winner.
+        session.swap_player_pool(sample_player_pool[sample_player_pool["player_id"] != ids[1]].copy())
+        return {ids[0]: 30, ids[1]: 50}
+
+    monkeypatch.setattr(MCTSDraftAssistant, "search_visit_counts", fake_search)
+
+    resp = client.post("/api/recommend/mcts")
+    assert resp.status_code == 409
+    assert "refreshed" in resp.json()["detail"]
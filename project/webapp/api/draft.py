@@ -1,12 +1,41 @@
-from typing import Optional
+import asyncio
+import os
+import time
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Cookie, Depends, Header, HTTPException, Request, Response, WebSocket
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
-from project.draft.config import DEFAULT_ROSTER_SLOTS
+from project.data.live_rankings import ID_COLUMN
+from project.draft.config import setup_defaults
+from project.draft.mcts import best_action
+from project.draft.mcts_parallel import merge_visit_counts
 from project.webapp import session as session_module
+from project.webapp.metrics import (
+    GREEDY_RECOMMENDATIONS,
+    MCTS_PLAYOUTS,
+    MCTS_SEARCH_DURATION,
+    MCTS_SEARCHES,
+    MCTS_WORKERS,
+)
+from project.webapp.recommendations import get_recommendation_cache, recommendation_key
+from project.webapp.serialization import (
+    JSONBytesResponse,
+    RawJSON,
+    dumps,
+    encode_delta,
+    encode_players,
+    encode_state,
+    player_fragment,
+)
 
-router = APIRouter(prefix="/api")
+router = APIRouter(prefix="/api", default_response_class=JSONBytesResponse)
+
+# The browser carries its draft's id in a cookie; scripted clients can send
+# the header instead (it wins when both are present).
+SESSION_COOKIE = "draft_session"
+SESSION_HEADER = "X-Draft-Session"
 
 
 class SessionCreateRequest(BaseModel):
@@ -17,15 +46,72 @@ class SessionCreateRequest(BaseModel):
     roster_slots: Optional[dict] = None
     bench_slots: int = 7
     source: str = "auto"
+    season: int = 2026
+    # Seconds per MCTS search; the default suits a live draft, load tests
+    # and quick checks use less.
+    mcts_time_limit: float = Field(session_module.DEFAULT_MCTS_TIME_LIMIT, gt=0, le=60)
+
+
+class PoolRefreshRequest(BaseModel):
+    source: str = "sleeper"
+
+
+class BatchPick(BaseModel):
+    player: Optional[str] = None
+    player_id: Optional[int] = None
+    team_idx: Optional[int] = None
 
 
 class PickRequest(BaseModel):
-    player: str
+    """Identify the pick by player_id (preferred -- unambiguous) or, for
+    hand-typed input, by display name."""
+
+    player: Optional[str] = None
+    player_id: Optional[int] = None
+
+
+def _session_id(
+    draft_session: Optional[str] = Cookie(default=None),
+    x_draft_session: Optional[str] = Header(default=None),
+):
+    return x_draft_session or draft_session
+
+
+def current_session(session_id: Optional[str] = Depends(_session_id)):
+    try:
+        return session_module.get_session(session_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="No active draft session; create one first.")
+
+
+def _etag(session):
+    return f'"{session.instance_tag}-{session.state_version}"'
+
+
+def _state_body(session, since=None):
+    """Full state with its version, or -- when the client says which version
+    it already has -- just the delta since then (constant-size late in the
+    draft instead of growing with pick history). Pre-encoded (see
+    serialization.py); wrap it in a JSONBytesResponse."""
+    if since is not None:
+        return encode_delta(session, session.delta_since(since))
+    return encode_state(session, state_version=session.state_version)
+
+
+def _locked_delta(session, since):
+    """(version, is it a full resync, encoded delta since `since`)."""
+    with session.lock:
+        delta = session.delta_since(since)
+        return delta["version"], "full" in delta, dumps(encode_delta(session, delta))
 
 
-def _player_rows(df):
-    cols = ["Rank", "Player", "Team", "Position", "Total_FPTS", "Average_FPTS"]
-    return df[cols].to_dict(orient="records")
+def _applied(session, result):
+    return {
+        "player": RawJSON(player_fragment(session.shared_pool, int(result["row"][ID_COLUMN]))),
+        "is_ours": result["is_ours"],
+        "team_idx": result["team_idx"],
+        "pick_number": result["pick_number"],
+    }
 
 
 @router.post("/session")
@@ -33,7 +119,7 @@ def create_session(req: SessionCreateRequest):
     if req.initial_pick < 1 or req.initial_pick > req.num_teams:
         raise HTTPException(status_code=400, detail="initial_pick must be between 1 and num_teams.")
 
-    session = session_module.create_session(
+    session_id, session = session_module.create_session(
         num_teams=req.num_teams,
         scoring=req.scoring,
         draft_style=req.draft_style,
@@ -41,81 +127,302 @@ def create_session(req: SessionCreateRequest):
         roster_slots=req.roster_slots,
         bench_slots=req.bench_slots,
         source=req.source,
+        season=req.season,
+        mcts_time_limit=req.mcts_time_limit,
     )
-    return session.state()
+    body = encode_state(session, state_version=session.state_version, session_id=session_id)
+    response = JSONBytesResponse(body)
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+    return response
+
+
+@router.delete("/session")
+def end_session(response: Response, session_id: Optional[str] = Depends(_session_id)):
+    session_module.get_registry().remove(session_id)
+    response.delete_cookie(SESSION_COOKIE)
+    return {"ended": session_id}
+
+
+@router.post("/session/refresh-projections")
+def refresh_projections(req: PoolRefreshRequest, session_id: Optional[str] = Depends(_session_id)):
+    """Swap freshly loaded projections into the running draft without
+    losing pick history."""
+    session = current_session(session_id)
+    try:
+        summary = session_module.refresh_session_pool(session_id, source=req.source)
+    except session_module.PoolUnavailableError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    except session_module.PoolMismatchError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    with session.lock:
+        return JSONBytesResponse({"swap": summary, "state": _state_body(session)})
 
 
 @router.get("/players")
-def get_players():
-    session = session_module.get_session()
-    return _player_rows(session.available_players)
+def get_players(session=Depends(current_session)):
+    with session.lock:
+        return JSONBytesResponse(encode_players(session.shared_pool, session.available_positions()))
+
+
+@router.get("/players/search")
+def search_players(q: str, limit: int = 10, include_drafted: bool = False, session=Depends(current_session)):
+    """Server-side type-ahead over the session's search index -- only the
+    top `limit` matches go over the wire instead of the whole pool."""
+    allowed_ids = None if include_drafted else session.available_ids
+    hits = session.search.search(q, limit=max(1, min(limit, 50)), allowed_ids=allowed_ids)
+    if not hits:
+        return []
+
+    positions = [session.players.position(player_id) for player_id, _, _ in hits]
+    return JSONBytesResponse(encode_players(session.shared_pool, positions))
 
 
 @router.get("/state")
-def get_state():
-    return session_module.get_session().state()
+def get_state(request: Request, response: Response, session=Depends(current_session)):
+    """Full state. Sends an ETag of the state version and answers a matching
+    If-None-Match with 304, so polling an unchanged draft costs nothing."""
+    with session.lock:
+        etag = _etag(session)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return JSONBytesResponse(_state_body(session), headers={"ETag": etag})
+
+
+@router.get("/state/delta")
+def get_state_delta(since: int, session=Depends(current_session)):
+    """Only what changed since state version `since` (see
+    DraftSession.delta_since)."""
+    with session.lock:
+        return JSONBytesResponse(encode_delta(session, session.delta_since(since)), headers={"ETag": _etag(session)})
+
+
+@router.websocket("/ws")
+async def state_feed(websocket: WebSocket, since: int = -1, session: Optional[str] = None):
+    """Push a delta to the client after every change to its draft.
+
+    The draft is named by the `session` query parameter or the session
+    cookie. The first message brings the client up to date from `since`
+    (a full state by default); after that each message is a delta_since
+    the last version sent. Mutations happen on worker threads, so the
+    session's subscriber callback only wakes this coroutine.
+    """
+    try:
+        draft = session_module.get_session(session or websocket.cookies.get(SESSION_COOKIE))
+    except KeyError:
+        await websocket.close(code=4404)
+        return
+    await websocket.accept()
+
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    changed.set()
+
+    def notify(_version, _change):
+        loop.call_soon_threadsafe(changed.set)
+
+    draft.subscribe(notify)
+    # Watch for the client going away while we wait for changes.
+    receiver = asyncio.ensure_future(websocket.receive())
+    try:
+        while True:
+            waiter = asyncio.ensure_future(changed.wait())
+            done, _ = await asyncio.wait({waiter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                waiter.cancel()
+                if receiver.result()["type"] == "websocket.disconnect":
+                    break
+                receiver = asyncio.ensure_future(websocket.receive())
+                continue
+
+            changed.clear()
+            version, full, delta = await run_in_threadpool(_locked_delta, draft, since)
+            if version != since or full:
+                await websocket.send_text(delta.decode())
+                since = version
+    finally:
+        draft.unsubscribe(notify)
+        receiver.cancel()
 
 
 @router.get("/recommend/greedy")
-def recommend_greedy(n: int = 5):
-    session = session_module.get_session()
-    candidates = session.greedy.get_top_candidates(
-        session.available_players, session.current_round, n=n, explain=True
-    )
-    return {
-        "round_num": session.current_round,
-        "candidates": candidates.to_dict(orient="records"),
-    }
+def recommend_greedy(n: int = 5, session=Depends(current_session)):
+    cache = get_recommendation_cache()
+    with session.lock:
+        key = recommendation_key(session.canonical_state(), "greedy", {"n": n})
+        result = cache.get(key)
+        if result is None:
+            candidates = session.greedy.get_top_candidates(
+                session.available_players, session.current_round, n=n, explain=True
+            )
+            result = {
+                "round_num": session.current_round,
+                "candidates": candidates.to_dict(orient="records"),
+            }
+            cache.put(key, result)
+            GREEDY_RECOMMENDATIONS.inc("false")
+            return JSONBytesResponse({**result, "cached": False})
+    GREEDY_RECOMMENDATIONS.inc("true")
+    return JSONBytesResponse({**result, "cached": True})
 
 
 @router.post("/pick")
-def apply_pick(req: PickRequest):
-    session = session_module.get_session()
-    try:
-        result = session.apply_pick(req.player)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc))
+def apply_pick(req: PickRequest, since: Optional[int] = None, session=Depends(current_session)):
+    if (req.player is None) == (req.player_id is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of player or player_id.")
+
+    with session.lock:
+        try:
+            result = session.apply_pick(req.player_id if req.player_id is not None else req.player)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+        return JSONBytesResponse({"applied": _applied(session, result), "next": _state_body(session, since)})
 
-    return {
-        "applied": {
-            "player": result["row"].to_dict(),
-            "is_ours": result["is_ours"],
-            "team_idx": result["team_idx"],
-            "pick_number": result["pick_number"],
-        },
-        "next": session.state(),
-    }
+
+class BatchPickRequest(BaseModel):
+    """Ordered picks starting at `start_pick` (the current pick if omitted).
+    Each pick names exactly one of player_id/player; team_idx, if given, is
+    checked against the pick order."""
+
+    start_pick: Optional[int] = None
+    picks: List[BatchPick]
+
+
+class JumpRequest(BaseModel):
+    pick_number: int
+
+
+@router.post("/picks")
+def apply_picks(req: BatchPickRequest, since: Optional[int] = None, session=Depends(current_session)):
+    """Catch up several picks in one round trip -- all applied, or (on any
+    invalid entry) none, with a 400 naming the offending pick."""
+    for pick in req.picks:
+        if (pick.player is None) == (pick.player_id is None):
+            raise HTTPException(status_code=400, detail="Each pick needs exactly one of player or player_id.")
+
+    with session.lock:
+        try:
+            results = session.apply_picks([pick.model_dump() for pick in req.picks], start_pick=req.start_pick)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+        return JSONBytesResponse(
+            {"applied": [_applied(session, result) for result in results], "next": _state_body(session, since)}
+        )
 
 
 @router.post("/undo")
-def undo_pick():
-    session = session_module.get_session()
-    session.undo()
-    return session.state()
+def undo_pick(steps: int = 1, since: Optional[int] = None, session=Depends(current_session)):
+    with session.lock:
+        session.undo(max(1, steps))
+        return JSONBytesResponse(_state_body(session, since))
+
+
+@router.post("/redo")
+def redo_pick(steps: int = 1, since: Optional[int] = None, session=Depends(current_session)):
+    with session.lock:
+        session.redo(max(1, steps))
+        return JSONBytesResponse(_state_body(session, since))
+
+
+@router.post("/jump")
+def jump_to_pick(req: JumpRequest, since: Optional[int] = None, session=Depends(current_session)):
+    with session.lock:
+        try:
+            session.jump_to_pick(req.pick_number)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return JSONBytesResponse(_state_body(session, since))
 
 
 @router.post("/recommend/mcts")
-def recommend_mcts():
+def recommend_mcts(refine: bool = False, session=Depends(current_session)):
     """Sync (not async) route: get_best_pick blocks for the full
     time_limit (10-15s) and spawns a ProcessPoolExecutor. A sync def lets
     Starlette dispatch this to its threadpool so /health and other requests
     aren't blocked for the duration.
+
+    A board already searched (by any session) is answered from the
+    recommendation cache along with its playout count; `refine=true` runs
+    another full search and adds its playouts to the cached ones.
     """
-    session = session_module.get_session()
-    player_name = session.mcts.get_best_pick(
-        session.available_players,
-        session.current_pick,
-        session.current_round,
-        session.rosters,
-        session.current_team,
+    mcts = session.mcts
+    with session.lock:
+        # Snapshot the board so picks landing mid-search can't skew it.
+        key = recommendation_key(
+            session.canonical_state(),
+            "mcts",
+            {
+                "time_limit": mcts.time_limit,
+                "exploration_constant": mcts.exploration_constant,
+                "parallel": mcts.parallel,
+                "num_workers": mcts.num_workers,
+            },
+        )
+        search_args = (
+            session.available_players,
+            session.current_pick,
+            session.current_round,
+            {team: list(roster) for team, roster in session.rosters.items()},
+            session.current_team,
+        )
+        # The pool the searched board's ids come from: a refresh may swap
+        # the session onto another one during the search.
+        shared = session.shared_pool
+
+    cache = get_recommendation_cache()
+    cached = cache.get(key)
+    if cached is not None and not refine:
+        result = cached
+    else:
+        started = time.perf_counter()
+        visits = mcts.search_visit_counts(*search_args)
+        MCTS_SEARCH_DURATION.observe(value=time.perf_counter() - started)
+        MCTS_SEARCHES.inc()
+        MCTS_PLAYOUTS.inc(amount=sum(visits.values()))
+        MCTS_WORKERS.set(value=(mcts.num_workers or os.cpu_count() or 1) if mcts.parallel else 1)
+        if cached is not None:
+            visits = merge_visit_counts([{int(pid): n for pid, n in cached["visits"]}, visits])
+        player_id = best_action(visits)
+        if player_id is None:
+            raise HTTPException(status_code=503, detail="MCTS search returned no recommendation.")
+        result = {
+            "player_id": int(player_id),
+            "playouts": int(sum(visits.values())),
+            "visits": sorted(([int(pid), int(n)] for pid, n in visits.items()), key=lambda item: -item[1]),
+        }
+        cache.put(key, result)
+
+    player_id = result["player_id"]
+    if player_id not in shared.players:
+        raise HTTPException(status_code=503, detail="MCTS recommended a player outside the searched pool.")
+    with session.lock:
+        current = session.shared_pool
+    if current is not shared and player_id not in current.players:
+        raise HTTPException(
+            status_code=409,
+            detail="Projections were refreshed during the search and the recommended player is no longer in the pool; ask again.",
+        )
+
+    return JSONBytesResponse(
+        {
+            "player": RawJSON(player_fragment(shared, player_id)),
+            "time_limit_used": mcts.time_limit,
+            "playouts": result["playouts"],
+            "player_playouts": result["visits"][0][1],
+            "cached": result is cached,
+            "refined": refine and cached is not None,
+        }
     )
-    if player_name is None:
-        raise HTTPException(status_code=503, detail="MCTS search returned no recommendation.")
 
-    row = session.available_players.loc[session.available_players["Player"] == player_name].iloc[0]
-    return {"player": row.to_dict(), "time_limit_used": session.mcts.time_limit}
+
+@router.get("/recommend/cache")
+def recommendation_cache_stats():
+    return get_recommendation_cache().stats()
 
 
 @router.get("/config/defaults")
 def config_defaults():
-    return {"roster_slots": DEFAULT_ROSTER_SLOTS, "bench_slots": 7, "num_teams": 10, "scoring": "ppr"}
+    return setup_defaults()
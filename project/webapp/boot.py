@@ -0,0 +1,304 @@
+"""Fast-start ASGI front for the packaged app.
+
+Importing project.webapp.server pulls in FastAPI, pandas, numpy, requests
+and both draft engines -- about a second before uvicorn can answer
+anything, and longer on a cold disk. The launcher serves BootApp instead.
+It imports only the standard library, plus project.draft.config for the
+setup-screen defaults, and:
+
+- answers /health, the setup screen's /api/config/defaults and every static
+  file at once, so the browser can open straight onto a rendered setup
+  screen;
+- on lifespan startup, imports the real app in a worker thread, then runs
+  that app's own lifespan (session recovery) -- the warm-up stage;
+- holds any other request until warm-up finishes and then hands it to the
+  real app, so nothing is refused, only briefly delayed;
+- once the real app is up, starts and primes the MCTS worker pool in the
+  background, so the first "Think Harder" doesn't pay for spawning and
+  importing into every worker.
+
+After warm-up every request goes straight to the real app.
+
+With FANTASY_DRAFT_PROFILE_IMPORTS=1 the warm-up import runs under
+ImportProfiler and the slowest modules (cumulative and self time, like
+`python -X importtime`, which a frozen app can't be started with) plus the
+stage timings are written to stderr.
+"""
+
+import asyncio
+import importlib.abc
+import json
+import mimetypes
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from project.draft.config import setup_defaults
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+PROFILE_IMPORTS_ENV = "FANTASY_DRAFT_PROFILE_IMPORTS"
+PROFILE_TOP = 25
+
+
+class _TimedLoader:
+    """Stands in for a module's loader only while it executes."""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        spec = module.__spec__
+        # Put the real loader back before running any module code, so
+        # nothing (importlib.resources, pkgutil) ever sees this wrapper.
+        spec.loader = module.__loader__ = self._loader
+        with self._profiler.timing(spec.name):
+            self._loader.exec_module(module)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Records (module, cumulative seconds, self seconds) for every module
+    imported while installed."""
+
+    def __init__(self):
+        self.records = []
+        self._stack = []  # [name, started, seconds spent in nested imports]
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def timing(self, name):
+        profiler = self
+
+        class _Timing:
+            def __enter__(self):
+                profiler._stack.append([name, time.perf_counter(), 0.0])
+
+            def __exit__(self, *exc):
+                name, started, nested = profiler._stack.pop()
+                elapsed = time.perf_counter() - started
+                profiler.records.append((name, elapsed, elapsed - nested))
+                if profiler._stack:
+                    profiler._stack[-1][2] += elapsed
+
+        return _Timing()
+
+    def __enter__(self):
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(self, *exc):
+        sys.meta_path.remove(self)
+
+    def report(self, top=PROFILE_TOP):
+        lines = [f"{'cumulative ms':>14}{'self ms':>10}  module"]
+        for name, cumulative, own in sorted(self.records, key=lambda r: r[1], reverse=True)[:top]:
+            lines.append(f"{cumulative * 1000:>14.1f}{own * 1000:>10.1f}  {name}")
+        return "\n".join(lines)
+
+
+def _load_server_app(profile=False):
+    if not profile:
+        from project.webapp.server import app
+
+        return app
+    with ImportProfiler() as profiler:
+        from project.webapp.server import app
+    print(f"Import profile (top {PROFILE_TOP}):\n{profiler.report()}", file=sys.stderr, flush=True)
+    return app
+
+
+def _warm_up_workers():
+    from project.draft.mcts_parallel import warm_up_workers
+
+    return warm_up_workers()
+
+
+async def _send_bytes(send, status, body, content_type, head=False):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"" if head else body})
+
+
+class BootApp:
+    def __init__(self, load_app=None, warm_up_workers=_warm_up_workers, static_dir=STATIC_DIR, profile=None):
+        self.profile = bool(os.environ.get(PROFILE_IMPORTS_ENV)) if profile is None else profile
+        self._load_app = load_app or (lambda: _load_server_app(self.profile))
+        self._warm_up_workers = warm_up_workers
+        self.static_dir = Path(static_dir).resolve()
+
+        self.app = None
+        self.error = None
+        self.timings = {}
+        self._created = time.perf_counter()
+        self._ready = None  # asyncio.Event, created on the server's loop
+        self._warm_up_task = None
+        self._lifespan_queue = None
+        self._lifespan_done = None
+
+    # ---- ASGI entry point ----
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+            return
+        if self.app is not None:
+            await self.app(scope, receive, send)
+            return
+        if scope["type"] == "http" and await self._serve_early(scope, send):
+            return
+
+        await self._wait_ready()
+        if self.app is None:
+            if scope["type"] == "http":
+                await _send_bytes(send, 503, b'{"detail":"Server failed to start."}', "application/json")
+            return
+        await self.app(scope, receive, send)
+
+    # ---- requests answered before warm-up completes ----
+
+    async def _serve_early(self, scope, send):
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            return False
+        head = method == "HEAD"
+        path = scope["path"]
+        if path == "/health":
+            await _send_bytes(send, 200, b'{"status":"ok"}', "application/json", head)
+            return True
+        if path == "/api/config/defaults":
+            await _send_bytes(send, 200, json.dumps(setup_defaults()).encode(), "application/json", head)
+            return True
+        if path.startswith("/api/") or path == "/metrics":
+            return False
+
+        file_path = self._static_file(path)
+        if file_path is None:
+            return False
+        content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+        await _send_bytes(send, 200, file_path.read_bytes(), content_type, head)
+        return True
+
+    def _static_file(self, path):
+        relative = path.lstrip("/") or "index.html"
+        candidate = (self.static_dir / relative).resolve()
+        if candidate.is_dir():
+            candidate = candidate / "index.html"
+        if not candidate.is_relative_to(self.static_dir) or not candidate.is_file():
+            return None
+        return candidate
+
+    # ---- warm-up ----
+
+    def _ready_event(self):
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    async def _wait_ready(self):
+        if self._warm_up_task is None:
+            # No lifespan (e.g. a server started with lifespan="off").
+            self._warm_up_task = asyncio.ensure_future(self._warm_up({}))
+        await self._ready_event().wait()
+
+    async def _warm_up(self, state):
+        loop = asyncio.get_running_loop()
+        try:
+            started = time.perf_counter()
+            app = await loop.run_in_executor(None, self._load_app)
+            self.timings["import_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+            started = time.perf_counter()
+            await self._start_app_lifespan(app, state)
+            self.timings["lifespan_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self.app = app
+        except Exception as exc:
+            self.error = exc
+            print(f"Server warm-up failed: {exc!r}", file=sys.stderr, flush=True)
+        finally:
+            self.timings["ready_ms"] = round((time.perf_counter() - self._created) * 1000, 1)
+            self._ready_event().set()
+        if self.profile:
+            print(f"Startup stages: {self.timings}", file=sys.stderr, flush=True)
+
+        if self.app is not None and self._warm_up_workers is not None:
+            started = time.perf_counter()
+            try:
+                await loop.run_in_executor(None, self._warm_up_workers)
+            except Exception as exc:
+                print(f"MCTS worker warm-up failed: {exc!r}", file=sys.stderr, flush=True)
+            self.timings["workers_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            if self.profile:
+                print(f"MCTS workers ready in {self.timings['workers_ms']} ms", file=sys.stderr, flush=True)
+
+    async def _start_app_lifespan(self, app, state):
+        """Drive the real app's lifespan startup; its shutdown runs from ours."""
+        queue = self._lifespan_queue = asyncio.Queue()
+        started = asyncio.get_running_loop().create_future()
+
+        async def send(message):
+            kind = message["type"]
+            if kind == "lifespan.startup.complete" and not started.done():
+                started.set_result(None)
+            elif kind == "lifespan.startup.failed" and not started.done():
+                started.set_exception(RuntimeError(message.get("message", "lifespan startup failed")))
+
+        async def run():
+            try:
+                await app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": state}, queue.get, send)
+            finally:
+                if not started.done():
+                    # An app without lifespan support just returns.
+                    started.set_result(None)
+
+        self._lifespan_done = asyncio.ensure_future(run())
+        await queue.put({"type": "lifespan.startup"})
+        await started
+
+    async def _lifespan(self, scope, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._ready_event()
+                self._warm_up_task = asyncio.ensure_future(self._warm_up(scope.get("state", {})))
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._warm_up_task is not None:
+                    await self._ready_event().wait()
+                if self._lifespan_done is not None and not self._lifespan_done.done():
+                    await self._lifespan_queue.put({"type": "lifespan.shutdown"})
+                    await self._lifespan_done
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,329 @@
+"""Crash-safe, append-only journal of draft-session mutations.
+
+Draft state otherwise lives only in process memory, so a crash or restart
+of the packaged app mid-draft would lose every recorded pick. With a journal
+directory configured, each session gets two files there:
+
+    <session_id>.snapshot.json   config + pick ids + redo ids at some version
+    <session_id>.journal         one JSON line per mutation after that
+
+The write path is one small os.write() of an already-encoded line on the
+request thread -- no fsync, no flush of a Python buffer. A single background
+thread fsyncs every dirty journal at most every `fsync_interval` seconds
+(group commit: a process crash loses nothing that reached the OS, a power
+cut at most that window) and, once a journal has `compact_every` records,
+writes a fresh snapshot atomically and truncates the journal, so recovery
+never replays more than one short tail.
+
+Recovery reads each snapshot, applies the journal records newer than it
+(a torn final line from a crash mid-write is ignored), and rebuilds the
+session with DraftSession.restore -- a few hundred O(1) pushes, no
+re-validation through apply_pick.
+
+Journaling is on by default only in the packaged app (under
+~/.fantasy_draft_assistant/journal); elsewhere set FANTASY_DRAFT_JOURNAL_DIR
+to enable it.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+
+from project.data.atomic_io import atomic_write
+from project.data.live_rankings import ID_COLUMN
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR_ENV = "FANTASY_DRAFT_JOURNAL_DIR"
+DEFAULT_FSYNC_INTERVAL = 0.05
+DEFAULT_COMPACT_EVERY = 64
+
+if getattr(sys, "frozen", False):
+    DEFAULT_JOURNAL_DIR = Path.home() / ".fantasy_draft_assistant" / "journal"
+else:
+    DEFAULT_JOURNAL_DIR = None
+
+SNAPSHOT_SUFFIX = ".snapshot.json"
+JOURNAL_SUFFIX = ".journal"
+
+
+def _pick_ids(session):
+    return [int(entry["player"][ID_COLUMN]) for entry in session.pick_history]
+
+
+def _redo_ids(session):
+    return [int(entry["player"][ID_COLUMN]) for entry in session.redo_stack]
+
+
+def replay(history, redo, records):
+    """Apply journal records to (history ids, redo ids) lists in place."""
+    for record in records:
+        op = record["op"]
+        if op == "pick":
+            history.append(record["player_id"])
+            redo.clear()
+        elif op == "redo":
+            history.append(redo.pop() if redo else record["player_id"])
+        elif op == "undo":
+            if history:
+                redo.append(history.pop())
+
+
+class SessionJournal:
+    """The two files backing one session."""
+
+    def __init__(self, directory, session_id, session, config):
+        self.session_id = session_id
+        self.session = session
+        self.config = config
+        self.snapshot_path = directory / f"{session_id}{SNAPSHOT_SUFFIX}"
+        self.journal_path = directory / f"{session_id}{JOURNAL_SUFFIX}"
+        self._fd = os.open(self.journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._lock = threading.Lock()
+        self.records = 0
+        self.dirty = False
+        # Lines appended while compact() writes a snapshot (None otherwise).
+        self._tail = None
+
+    def append(self, record):
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            if self._fd is None:
+                return
+            os.write(self._fd, line)
+            self.records += 1
+            self.dirty = True
+            if self._tail is not None:
+                self._tail.append(line)
+
+    def sync(self):
+        """fsync the journal if anything was appended since the last sync. A
+        failed fsync leaves it dirty, so the next flush retries."""
+        with self._lock:
+            if not self.dirty or self._fd is None:
+                return
+            self.dirty = False
+            # A private descriptor: discard() may close ours while we fsync.
+            fd = os.dup(self._fd)
+        try:
+            os.fsync(fd)
+        except OSError:
+            with self._lock:
+                self.dirty = True
+            raise
+        finally:
+            os.close(fd)
+
+    def compact(self):
+        """Snapshot the session and truncate the journal.
+
+        Only building the snapshot holds the session lock; the (fsynced)
+        snapshot write doesn't, so picks carry on meanwhile. Records
+        appended during the write are newer than the snapshot, so they're
+        kept: the journal is replaced by a file holding just those. A crash
+        at any point leaves either the old journal (older records are
+        skipped by version) or the new one."""
+        with self.session.lock:
+            snapshot = {
+                "session_id": self.session_id,
+                "config": self.config,
+                "version": self.session.state_version,
+                "history": _pick_ids(self.session),
+                "redo": _redo_ids(self.session),
+            }
+            with self._lock:
+                if self._fd is None:
+                    return
+                self._tail = []
+
+        try:
+            atomic_write(self.snapshot_path, lambda f: json.dump(snapshot, f))
+        except BaseException:
+            with self._lock:
+                self._tail = None
+            raise
+
+        with self._lock:
+            tail, self._tail = self._tail, None
+            if self._fd is None:
+                # Discarded while we wrote; don't leave a snapshot behind.
+                self.snapshot_path.unlink(missing_ok=True)
+                return
+            tmp_path = self.journal_path.with_name(f".{self.journal_path.name}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+            try:
+                if tail:
+                    os.write(fd, b"".join(tail))
+                os.replace(tmp_path, self.journal_path)
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(self._fd)
+            self._fd = fd
+            self.records = len(tail)
+            self.dirty = bool(tail)
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.fsync(self._fd)
+                os.close(self._fd)
+                self._fd = None
+
+    def discard(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        for path in (self.snapshot_path, self.journal_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class JournalStore:
+    def __init__(self, directory=None, fsync_interval=DEFAULT_FSYNC_INTERVAL, compact_every=DEFAULT_COMPACT_EVERY):
+        directory = directory or os.environ.get(JOURNAL_DIR_ENV) or DEFAULT_JOURNAL_DIR
+        self.directory = Path(directory) if directory else None
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+
+        self._journals = {}  # session_id -> SessionJournal
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = None
+
+    @property
+    def enabled(self):
+        return self.directory is not None
+
+    def attach(self, session_id, session, config):
+        """Start journaling `session`; `config` is whatever recovery needs
+        to rebuild it (create_session's arguments)."""
+        if not self.enabled:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        journal = SessionJournal(self.directory, session_id, session, config)
+        journal.compact()
+
+        def on_change(version, change):
+            record = {"v": version, "op": change["op"]}
+            if "entry" in change:
+                record["player_id"] = int(change["entry"]["player"][ID_COLUMN])
+            if "id_space" in change:
+                # A pool swap: recovery has to rebuild on the new pool's ids.
+                record["id_space"] = change["id_space"]
+                journal.config = {**journal.config, "id_space": change["id_space"]}
+            journal.append(record)
+
+        session.subscribe(on_change)
+        with self._lock:
+            self._journals[session_id] = journal
+        self._ensure_flusher()
+
+    def discard(self, session_id):
+        with self._lock:
+            journal = self._journals.pop(session_id, None)
+        if journal is not None:
+            journal.discard()
+        elif self.enabled:
+            for suffix in (SNAPSHOT_SUFFIX, JOURNAL_SUFFIX):
+                (self.directory / f"{session_id}{suffix}").unlink(missing_ok=True)
+
+    def _ensure_flusher(self):
+        with self._lock:
+            if self._flusher is None or not self._flusher.is_alive():
+                self._stop.clear()
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name="journal-flusher")
+                self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.fsync_interval):
+            self.flush()
+
+    def flush(self):
+        """fsync every dirty journal and compact the long ones."""
+        with self._lock:
+            journals = list(self._journals.values())
+        for journal in journals:
+            try:
+                if journal.records >= self.compact_every:
+                    journal.compact()
+                else:
+                    journal.sync()
+            except OSError:
+                logger.warning("Journal flush failed for session %s", journal.session_id, exc_info=True)
+
+    def close(self):
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        with self._lock:
+            journals = list(self._journals.values())
+            self._journals.clear()
+        for journal in journals:
+            journal.close()
+
+    def _read_records(self, path, after_version):
+        records = []
+        try:
+            lines = path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return records
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning("Ignoring torn journal record in %s", path)
+                break
+            if record["v"] > after_version:
+                records.append(record)
+        return records
+
+    def recover(self, build_session):
+        """Rebuild every journaled session. `build_session(config)` returns a
+        fresh DraftSession for a snapshot's config (with `id_space` updated
+        by any later pool swap); a session it raises for is logged, skipped
+        and left on disk. Returns a list of (session_id, session, config);
+        sessions are not re-attached."""
+        if not self.enabled or not self.directory.is_dir():
+            return []
+
+        recovered = []
+        for snapshot_path in sorted(self.directory.glob(f"*{SNAPSHOT_SUFFIX}")):
+            try:
+                snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+                session_id = snapshot["session_id"]
+                records = self._read_records(self.directory / f"{session_id}{JOURNAL_SUFFIX}", snapshot["version"])
+                history, redo = list(snapshot["history"]), list(snapshot["redo"])
+                replay(history, redo, records)
+                config = dict(snapshot["config"])
+                for record in records:
+                    if "id_space" in record:
+                        config["id_space"] = record["id_space"]
+
+                session = build_session(config)
+                version = records[-1]["v"] if records else snapshot["version"]
+                session.restore(history, redo, state_version=version)
+            except Exception:
+                logger.warning("Could not recover draft session from %s", snapshot_path, exc_info=True)
+                continue
+            recovered.append((session_id, session, config))
+        return recovered
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_journal_store():
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = JournalStore()
+        return _default_store
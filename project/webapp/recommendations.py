@@ -0,0 +1,157 @@
+"""Memoized engine recommendations, keyed by canonical draft state.
+
+Both engines are pure functions of the board: the greedy ranking of a state
+never changes, and an MCTS search of it only gets better with more
+playouts. Yet /api/recommend/greedy recomputed on every poll and MCTS spent
+its full 10-15s budget again whenever a client asked twice. The same boards
+also recur across sessions -- every 10-team PPR league on the same
+projections looks identical at pick 1 -- so the cache is keyed by the
+state, not the session:
+
+    sha256(engine, engine parameters, DraftSession.canonical_state())
+
+where the canonical state is the league config, the pool's content hash,
+our team, the pick number and each team's sorted drafted ids.
+
+Two tiers:
+
+- an in-memory LRU of `max_entries` results, shared by every session in the
+  process;
+- optionally, one small JSON file per key under a directory, shared across
+  processes and restarts. Entries are written atomically; an unreadable one
+  is treated as a miss.
+
+Values are whatever JSON-ready dict the caller stores. MCTS results keep
+their per-player visit counts, so a later request can ask to refine a
+cached answer -- the new search's counts are added to the old ones.
+
+The disk tier is on by default only in the packaged app (under
+~/.fantasy_draft_assistant/recommendations); elsewhere set
+FANTASY_DRAFT_RECOMMENDATION_CACHE_DIR to enable it.
+FANTASY_DRAFT_RECOMMENDATION_CACHE_SIZE sets the in-memory entry count.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from project.data.atomic_io import atomic_write
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "FANTASY_DRAFT_RECOMMENDATION_CACHE_DIR"
+CACHE_SIZE_ENV = "FANTASY_DRAFT_RECOMMENDATION_CACHE_SIZE"
+DEFAULT_MAX_ENTRIES = 4096
+
+if getattr(sys, "frozen", False):
+    DEFAULT_CACHE_DIR = Path.home() / ".fantasy_draft_assistant" / "recommendations"
+else:
+    DEFAULT_CACHE_DIR = None
+
+
+def recommendation_key(state, engine, params):
+    """Stable hex key for `engine` run with `params` on a canonical state."""
+    canonical = json.dumps(
+        {"engine": engine, "params": params, "state": state}, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RecommendationCache:
+    def __init__(self, max_entries=None, directory=None):
+        self.max_entries = int(max_entries or os.environ.get(CACHE_SIZE_ENV) or DEFAULT_MAX_ENTRIES)
+        directory = directory or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.directory = Path(directory) if directory else None
+
+        self._entries = OrderedDict()  # key -> value, least recently used first
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _path(self, key):
+        # Fan out by the first byte so no directory grows unboundedly wide.
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """The cached value for `key`, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return value
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def _read_disk(self, key):
+        if self.directory is None:
+            return None
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable recommendation cache entry %s", key, exc_info=True)
+            return None
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            self.stores += 1
+        if self.directory is not None:
+            try:
+                atomic_write(self._path(key), lambda f: json.dump(value, f, separators=(",", ":")))
+            except OSError:
+                logger.warning("Could not persist recommendation cache entry %s", key, exc_info=True)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits = self.disk_hits = self.misses = self.stores = 0
+
+    def stats(self):
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_enabled": self.directory is not None,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_recommendation_cache():
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = RecommendationCache()
+        return _default_cache
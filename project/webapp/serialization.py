@@ -0,0 +1,160 @@
+"""Fast JSON encoding for the API's hot responses.
+
+Returning a dict from a FastAPI route runs it through jsonable_encoder -- a
+recursive Python walk over every value -- and then json.dumps, and the
+dicts themselves came from `row.to_dict()` per pick/roster entry or
+`df.to_dict(orient="records")` per request. On a full pick history or the
+~400-row /api/players list that was milliseconds per response, repeated for
+every poll.
+
+Instead:
+
+- SharedPlayerPool keeps every player once as a plain-Python record and,
+  lazily, as pre-encoded JSON bytes (per column set). Player rows never
+  change within a pool, so those bytes are built once per pool and reused by
+  every session and response that mentions the player.
+- `dumps` encodes with orjson when it's installed (the stdlib json module
+  otherwise) and splices RawJSON values -- already-encoded fragments -- in
+  as-is, so a response is assembled from cached player bytes plus a few
+  small encoded dicts.
+- JSONBytesResponse sends the result without FastAPI re-encoding it.
+
+encode_state / encode_delta / encode_players build the payloads of the
+state, delta and player-list endpoints this way; their JSON is identical to
+what `state()` / `delta_since()` / the player rows encode to directly.
+"""
+
+import datetime
+import json
+
+import numpy as np
+import pandas as pd
+from starlette.responses import Response
+
+from project.data.live_rankings import ID_COLUMN
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+PLAYER_LIST_COLUMNS = ("Rank", "Player", "Team", "Position", "Total_FPTS", "Average_FPTS", ID_COLUMN)
+
+
+class RawJSON:
+    """Already-encoded JSON, spliced into `dumps` output verbatim."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+def _default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    # RawJSON lands here too: `dumps` catches this and splices it in.
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _encode(value):
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+
+    _EncodeError = orjson.JSONEncodeError
+else:  # pragma: no cover
+
+    def _encode(value):
+        return json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+    _EncodeError = TypeError
+
+
+def dumps(value):
+    """Compact UTF-8 JSON bytes for `value`, with any RawJSON inside it
+    emitted verbatim."""
+    if type(value) is RawJSON:
+        return value.data
+    try:
+        return _encode(value)
+    except _EncodeError:
+        # Only containers holding RawJSON get here; encode them piecewise.
+        if isinstance(value, dict):
+            return b"{" + b",".join(_encode(str(key)) + b":" + dumps(item) for key, item in value.items()) + b"}"
+        if isinstance(value, (list, tuple)):
+            return join_array(dumps(item) for item in value)
+        raise
+
+
+def join_array(fragments):
+    return b"[" + b",".join(fragments) + b"]"
+
+
+class JSONBytesResponse(Response):
+    """application/json response whose body is encoded by `dumps` (bytes
+    pass straight through)."""
+
+    media_type = "application/json"
+
+    def render(self, content):
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def player_fragment(shared, player_id, columns=None):
+    """The pre-encoded JSON of one player in `shared` (a SharedPlayerPool)."""
+    return shared.player_json(columns)[shared.players.position(player_id)]
+
+
+def encode_players(shared, positions, columns=PLAYER_LIST_COLUMNS):
+    """A JSON array of the players at row `positions` of the shared pool."""
+    fragments = shared.player_json(columns)
+    return RawJSON(join_array(fragments[position] for position in positions))
+
+
+def encode_pick(shared, entry):
+    """One pick_history entry, with its player taken from the fragment cache."""
+    player_id = int(entry["player"][ID_COLUMN])
+    if player_id not in shared.players:
+        return dumps(entry)
+    # "player" is the entry's last key: encode the rest and append it.
+    rest = _encode({key: value for key, value in entry.items() if key != "player"})
+    return rest[:-1] + b',"player":' + player_fragment(shared, player_id) + b"}"
+
+
+def encode_state(session, **extra):
+    """session.state() (plus `extra` keys) as RawJSON."""
+    shared = session.shared_pool
+    state = session.state()
+    state["pick_history"] = RawJSON(join_array(encode_pick(shared, entry) for entry in session.pick_history))
+    state["our_roster"] = encode_players(
+        shared, [shared.players.position(player_id) for player_id in session.our_roster_ids()], columns=None
+    )
+    state.update(extra)
+    return RawJSON(dumps(state))
+
+
+def encode_delta(session, delta):
+    """A session.delta_since() result as RawJSON."""
+    if "full" in delta:
+        delta["full"] = encode_state(session)
+    else:
+        shared = session.shared_pool
+        delta["changes"] = [
+            {**change, "entry": RawJSON(encode_pick(shared, change["entry"]))} if "entry" in change else change
+            for change in delta["changes"]
+        ]
+    return RawJSON(dumps(delta))
@@ -1,13 +1,72 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 
+from project.data.projection_cache import get_default_cache
+from project.webapp import session as session_module
 from project.webapp.api.draft import router as draft_router
+from project.webapp.journal import get_journal_store
+from project.webapp.metrics import CONTENT_TYPE, REGISTRY, MetricsMiddleware
+from project.webapp.recommendations import get_recommendation_cache
 
 STATIC_DIR = Path(__file__).resolve().parent / "static"
+GZIP_MINIMUM_SIZE = 1024
 
-app = FastAPI(title="Fantasy Draft Assistant")
+
+@asynccontextmanager
+async def lifespan(app):
+    # Bring back any drafts journaled before a crash/restart, and make sure
+    # the journal's last records are fsynced on a clean shutdown.
+    await run_in_threadpool(session_module.recover_sessions)
+    yield
+    get_journal_store().close()
+
+
+def _collect_state():
+    """Scrape-time gauges read from the registry and caches' own counters."""
+    sessions = session_module.get_registry().stats()
+    yield "draft_sessions", "gauge", "Live draft sessions.", [({}, sessions["sessions"])]
+    yield "draft_shared_pools", "gauge", "Distinct shared player pools.", [({}, sessions["shared_pools"])]
+    yield "draft_session_memory_bytes", "gauge", "Approximate session memory.", [({}, sessions["memory_bytes"])]
+    yield "draft_session_evictions_total", "counter", "Sessions evicted, by reason.", [
+        ({"reason": reason}, count) for reason, count in sorted(sessions["evictions"].items())
+    ]
+
+    recommendations = get_recommendation_cache().stats()
+    yield "draft_recommendation_cache_lookups_total", "counter", "Recommendation cache lookups, by result.", [
+        ({"result": "memory_hit"}, recommendations["memory_hits"]),
+        ({"result": "disk_hit"}, recommendations["disk_hits"]),
+        ({"result": "miss"}, recommendations["misses"]),
+    ]
+    yield "draft_recommendation_cache_entries", "gauge", "Entries in the in-memory recommendation cache.", [
+        ({}, recommendations["entries"])
+    ]
+
+    projections = get_default_cache()
+    yield "draft_sleeper_fetches_total", "counter", "Sleeper projection fetches, by outcome.", [
+        ({"outcome": "ok"}, projections.fetches - projections.fetch_failures),
+        ({"outcome": "error"}, projections.fetch_failures),
+    ]
+    yield "draft_sleeper_fetch_seconds_total", "counter", "Time spent fetching Sleeper projections.", [
+        ({}, projections.fetch_seconds_total)
+    ]
+    if projections.last_fetch_seconds is not None:
+        yield "draft_sleeper_last_fetch_seconds", "gauge", "Duration of the latest Sleeper fetch.", [
+            ({}, projections.last_fetch_seconds)
+        ]
+
+
+REGISTRY.add_collector(_collect_state)
+
+app = FastAPI(title="Fantasy Draft Assistant", lifespan=lifespan)
+# Compress the larger payloads (full state, the player list, app.js);
+# small deltas and recommendations aren't worth the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/health")
@@ -15,6 +74,11 @@ def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 # Router must be included before the static mount -- StaticFiles' catch-all
 # at "/" would otherwise shadow every /api/* route.
 app.include_router(draft_router)
@@ -7,31 +7,228 @@ object the webapp needs: it owns the single source of truth (available
 players, rosters, pick history) and drives a GreedyDraftAssistant
 incrementally plus calls MCTSDraftAssistant statelessly, from that shared
 state, instead of trying to reconcile two disjoint state models.
+
+Players are identified by their integer player_id throughout; display names
+are only resolved (via the shared PlayerIndex) at the edge, when a pick
+request names a player instead of passing an id.
+
+Because picks are ids, a refreshed projection pool (injury news mid-draft)
+can be swapped into a live session without replaying history: see
+`swap_player_pool`.
+
+Pick state is kept as small mutable pieces that each have a cheap inverse:
+a boolean availability mask aligned with the full pool, the available-id
+set, per-team roster lists and the greedy position counters. A pick is one
+delta against each; undo applies the inverse delta and pushes the pick onto
+a redo stack, so undo/redo/jump cost O(k) for k steps instead of rebuilding
+and replaying the whole draft. The available-players DataFrame is derived
+from the mask lazily, only when something reads it.
+
+The server hosts many drafts at once. Each DraftSession is registered under
+an opaque id in a SessionRegistry (an idle-timeout LRU with a session-count
+and approximate-memory budget), and everything immutable about a player
+pool -- the DataFrame, its PlayerIndex and PlayerSearchIndex -- lives in a
+SharedPlayerPool that every session on the same (season, scoring) reuses.
+Per-session state is just the mask, rosters and history above, a few
+kilobytes, so hundreds of sessions cost little more than one.
+
+Every mutation bumps `state_version` and appends a small change record to a
+bounded log, so clients that already hold version N can ask for just what
+changed since (`delta_since`) -- or be pushed it, via `subscribe` -- instead
+of re-downloading a full `state()` whose pick history grows with the draft.
 """
 
+import dataclasses
+import hashlib
+import logging
+import numbers
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+import pandas as pd
+
+from project.data.live_rankings import ID_COLUMN, id_space, with_player_ids
 from project.data.loader import load_player_pool
-from project.draft.config import LeagueConfig
+from project.data.projection_cache import SOURCES
+from project.data.player_search import PlayerSearchIndex
+from project.draft.config import DIRECT_POSITIONS, LeagueConfig
 from project.draft.greedy import GreedyDraftAssistant
 from project.draft.mcts import MCTSDraftAssistant
 from project.draft.pick_order import round_for_pick, team_for_pick
+from project.draft.player_index import PlayerIndex
 from project.draft.scoring import compute_roster_value
+from project.webapp.journal import get_journal_store
+from project.webapp.metrics import POOL_LOAD_DURATION
+from project.webapp.serialization import dumps
+
+
+logger = logging.getLogger(__name__)
+
+MAX_SESSIONS_ENV = "FANTASY_DRAFT_MAX_SESSIONS"
+IDLE_TIMEOUT_ENV = "FANTASY_DRAFT_SESSION_IDLE_TIMEOUT"
+MEMORY_BUDGET_ENV = "FANTASY_DRAFT_SESSION_MEMORY_MB"
+SESSION_CAP_ENV = "FANTASY_DRAFT_SESSION_MAX_KB"
+DEFAULT_MAX_SESSIONS = 500
+DEFAULT_IDLE_TIMEOUT = 6 * 60 * 60
+DEFAULT_MEMORY_BUDGET_MB = 512
+DEFAULT_SESSION_CAP_KB = 1024
+
+# Measured cost of one pick_history/redo entry plus its roster row (a row
+# dict and a pandas Series), used for the per-session memory estimate.
+PICK_ENTRY_BYTES = 3 * 1024
+
+DEFAULT_MCTS_TIME_LIMIT = 12
+
+# How many change records a session keeps for delta_since; a client further
+# behind than this gets a full state instead.
+CHANGE_LOG_SIZE = 256
+
+
+class PoolMismatchError(ValueError):
+    """A replacement pool identifies players by a different id scheme than
+    the draft's picks (see live_rankings.id_space)."""
+
+
+class PoolUnavailableError(RuntimeError):
+    """A fresh player pool couldn't be loaded from the requested source."""
+
+
+class SharedPlayerPool:
+    """Immutable, shareable half of a session: the pool DataFrame plus the
+    indexes built over it. Sessions never mutate any of these."""
+
+    def __init__(self, full_player_pool):
+        self.source = full_player_pool
+        self.pool = with_player_ids(full_player_pool)
+        self.players = PlayerIndex(self.pool)
+        self.search = PlayerSearchIndex(self.pool)
+        self.id_space = id_space(self.pool)
+        self.positions = self.pool["Position"].to_numpy(dtype=object)
+        self.position_counts = self.pool["Position"].value_counts().to_dict()
+        self.memory_bytes = int(self.pool.memory_usage(deep=True).sum())
+        self._fingerprint = None
+        self._records = None
+        self._player_json = {}
+
+    @property
+    def fingerprint(self):
+        """Content hash of the pool. Two sessions built from the same
+        projections get the same value, whichever SharedPlayerPool (or
+        process) they came from, so it can key caches that outlive both."""
+        if self._fingerprint is None:
+            hashed = pd.util.hash_pandas_object(self.pool, index=False).to_numpy()
+            self._fingerprint = hashlib.sha1(hashed.tobytes()).hexdigest()
+        return self._fingerprint
+
+    @property
+    def records(self):
+        """Every row as a plain-Python dict, in pool order -- converted in one
+        pass and then shared (read-only) by every pick entry and roster that
+        references the player, instead of a `row.to_dict()` per use."""
+        if self._records is None:
+            self._records = self.pool.to_dict(orient="records")
+        return self._records
+
+    def record(self, player_id):
+        return self.records[self.players.position(player_id)]
+
+    def player_json(self, columns=None):
+        """Pre-encoded JSON bytes for every row (restricted to `columns`, if
+        given), in pool order; built once per column set."""
+        key = tuple(columns) if columns is not None else None
+        fragments = self._player_json.get(key)
+        if fragments is None:
+            if columns is None:
+                records = self.records
+            else:
+                records = self.pool[list(columns)].to_dict(orient="records")
+            fragments = self._player_json[key] = [dumps(record) for record in records]
+        return fragments
 
 
 class DraftSession:
-    def __init__(self, full_player_pool, league_config=None, initial_pick=1, mcts_time_limit=12):
+    def __init__(
+        self, full_player_pool, league_config=None, initial_pick=1, mcts_time_limit=DEFAULT_MCTS_TIME_LIMIT, season=2026
+    ):
+        """`full_player_pool` is a DataFrame or a SharedPlayerPool."""
         self.league_config = league_config or LeagueConfig()
         self.initial_pick = initial_pick
-        self.full_player_pool = full_player_pool
+        self.season = season
+        if not isinstance(full_player_pool, SharedPlayerPool):
+            full_player_pool = SharedPlayerPool(full_player_pool)
+        self.shared_pool = full_player_pool
+        self.full_player_pool = full_player_pool.pool
+        self.players = full_player_pool.players
+        self.search = full_player_pool.search
+        # Serializes mutations when several requests for one draft race.
+        self.lock = threading.RLock()
+        # Distinguishes this session's state versions from any other's in
+        # ETags, so a stale cookie can never match a different draft.
+        self.instance_tag = secrets.token_hex(4)
 
-        self.available_players = full_player_pool.copy()
+        self._available_mask = np.ones(len(self.full_player_pool), dtype=bool)
+        self._available_frame = None
+        self._remaining_by_position = dict(self.shared_pool.position_counts)
+        self.available_ids = {int(pid) for pid in self.players.ids}
         self.rosters = {i: [] for i in range(self.league_config.num_teams)}
         self.pick_history = []  # list[dict]: pick_number, round_num, team_idx, is_ours, player (dict)
+        self.redo_stack = []  # undone pick_history entries, most recently undone last
+        # Bumped on every swap_player_pool, so anything derived from the pool
+        # can tell whether it's still current.
+        self.pool_version = 0
+        # Bumped on every mutation; see delta_since.
+        self.state_version = 0
+        self._changes = deque(maxlen=CHANGE_LOG_SIZE)  # (version, change dict)
+        self._subscribers = []
+        self._roster_value = None  # ((pool_version, our roster ids), value)
 
-        self.greedy = GreedyDraftAssistant(full_player_pool, self.league_config)
+        self.greedy = GreedyDraftAssistant(self.full_player_pool, self.league_config)
         self.mcts = MCTSDraftAssistant(
-            full_player_pool, self.league_config, initial_pick, time_limit=mcts_time_limit, parallel=True
+            self.full_player_pool, self.league_config, initial_pick, time_limit=mcts_time_limit, parallel=True
         )
 
+    @property
+    def available_players(self):
+        if self._available_frame is None:
+            self._available_frame = self.full_player_pool.loc[self._available_mask]
+        return self._available_frame
+
+    def available_positions(self):
+        """Row positions (in the full pool) of every available player."""
+        return np.flatnonzero(self._available_mask)
+
+    def _set_available(self, player_id, available):
+        position = self.players.position(player_id)
+        self._available_mask[position] = available
+        self._available_frame = None
+        pos = self.shared_pool.positions[position]
+        self._remaining_by_position[pos] = self._remaining_by_position.get(pos, 0) + (1 if available else -1)
+        if available:
+            self.available_ids.add(player_id)
+        else:
+            self.available_ids.discard(player_id)
+
+    def _record_change(self, change):
+        self.state_version += 1
+        self._changes.append((self.state_version, change))
+        for callback in list(self._subscribers):
+            callback(self.state_version, change)
+
+    def subscribe(self, callback):
+        """Call `callback(state_version, change)` after every mutation. Called
+        on the mutating thread with the session lock held, so it should only
+        hand off (set an event, append to a buffer)."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
     @property
     def our_team_idx(self):
         return self.initial_pick - 1
@@ -56,26 +253,95 @@ class DraftSession:
     def draft_complete(self):
         return self.current_pick > self.league_config.num_teams * self.league_config.num_rounds
 
-    def _row_for(self, player_name):
-        matches = self.available_players.loc[self.available_players["Player"] == player_name]
-        if matches.empty:
-            if player_name in self.full_player_pool["Player"].values:
-                raise ValueError(f"{player_name} has already been drafted.")
-            raise ValueError(f"Unknown player: {player_name}")
-        return matches.iloc[0]
+    def resolve_player_id(self, player, taken=()):
+        """Map a pick target -- an integer player_id, or a display name -- to
+        the id of an available player. A name shared by several players
+        resolves to the highest-ranked one still available; a name with no
+        exact match falls back to the search index, which tolerates
+        punctuation/suffix differences and small typos when unambiguous.
+        `taken` holds ids to treat as drafted too (earlier picks in a batch).
+        """
+        if isinstance(player, numbers.Integral) and not isinstance(player, bool):
+            player_id = int(player)
+            if player_id not in self.players:
+                raise ValueError(f"Unknown player_id: {player_id}")
+            if player_id not in self.available_ids or player_id in taken:
+                raise ValueError(f"{self.players.name(player_id)} has already been drafted.")
+            return player_id
+
+        candidates = self.players.ids_for_name(player)
+        if not candidates:
+            allowed_ids = self.available_ids - set(taken) if taken else self.available_ids
+            player_id = self.search.resolve(player, allowed_ids=allowed_ids)
+            if player_id is not None:
+                return player_id
+            if self.search.resolve(player) is not None:
+                raise ValueError(f"{player} has already been drafted.")
+            raise ValueError(f"Unknown player: {player}")
+        for player_id in candidates:
+            if player_id in self.available_ids and player_id not in taken:
+                return player_id
+        raise ValueError(f"{player} has already been drafted.")
 
-    def apply_pick(self, player_name):
+    def apply_pick(self, player):
+        """`player` is a player_id or a display name (see resolve_player_id).
+        A new pick discards anything left on the redo stack."""
         if self.draft_complete:
             raise ValueError("Draft is already complete.")
 
-        row = self._row_for(player_name)
+        player_id = self.resolve_player_id(player)
+        self.redo_stack.clear()
+        return self._push_pick(player_id)
+
+    def apply_picks(self, picks, start_pick=None):
+        """Apply an ordered batch of picks atomically: every entry is
+        resolved and checked against the pick order before any is applied,
+        so a bad entry leaves the session untouched.
+
+        Each entry is a player_id, a display name, or a dict with
+        "player_id" or "player" and optionally "team_idx" (the team the
+        caller believes is on the clock, checked against the pick order).
+        `start_pick`, if given, must equal current_pick -- a client that has
+        fallen out of sync gets an error instead of picks landing in the
+        wrong slots. Returns the apply_pick result for each pick.
+        """
+        if start_pick is not None and start_pick != self.current_pick:
+            raise ValueError(f"Batch starts at pick {start_pick} but the draft is on pick {self.current_pick}.")
+        total_picks = self.league_config.num_teams * self.league_config.num_rounds
+        if self.current_pick + len(picks) - 1 > total_picks:
+            raise ValueError(f"Batch of {len(picks)} picks runs past the end of the draft (pick {total_picks}).")
+
+        resolved = []
+        taken = set()
+        for offset, pick in enumerate(picks):
+            pick_number = self.current_pick + offset
+            target, team_idx = pick, None
+            if isinstance(pick, dict):
+                target = pick["player_id"] if pick.get("player_id") is not None else pick.get("player")
+                team_idx = pick.get("team_idx")
+            expected_team = team_for_pick(pick_number, self.league_config.num_teams, self.league_config.draft_style)
+            if team_idx is not None and team_idx != expected_team:
+                raise ValueError(f"Pick {pick_number} belongs to team {expected_team}, not team {team_idx}.")
+            try:
+                player_id = self.resolve_player_id(target, taken)
+            except ValueError as exc:
+                raise ValueError(f"Pick {pick_number}: {exc}") from None
+            taken.add(player_id)
+            resolved.append(player_id)
+
+        if resolved:
+            self.redo_stack.clear()
+        return [self._push_pick(player_id) for player_id in resolved]
+
+    def _push_pick(self, player_id, op="pick"):
+        row = self.players.row(player_id)
         is_ours = self.is_our_pick
         team_idx = self.current_team
         pick_number = self.current_pick
         round_num = self.current_round
 
         self.greedy.record_pick(row["Position"], is_ours)
-        self.available_players = self.available_players[self.available_players["Player"] != player_name]
+        self._set_available(player_id, False)
         self.rosters[team_idx].append(row)
         self.pick_history.append(
             {
@@ -83,52 +349,250 @@ class DraftSession:
                 "round_num": round_num,
                 "team_idx": team_idx,
                 "is_ours": is_ours,
-                "player": row.to_dict(),
+                "player": self.shared_pool.record(player_id),
             }
         )
+        self._record_change({"op": op, "entry": self.pick_history[-1]})
         return {"row": row, "is_ours": is_ours, "team_idx": team_idx, "pick_number": pick_number}
 
-    def undo(self):
-        """Pop the last pick and rebuild all state from scratch by replaying
-        the rest of history. At most ~200 picks, only run on a button click --
-        keeps one deterministic source of truth instead of a fragile
-        decrement-based undo that could drift from apply_pick's logic.
+    def _pop_pick(self):
+        entry = self.pick_history.pop()
+        row = self.rosters[entry["team_idx"]].pop()
+        self._set_available(int(row[ID_COLUMN]), True)
+        self.greedy.unrecord_pick(row["Position"], entry["is_ours"])
+        self.redo_stack.append(entry)
+        self._record_change({"op": "undo", "pick_number": entry["pick_number"]})
+
+    def undo(self, steps=1):
+        """Take back the last `steps` picks (fewer if history is shorter).
+        Each step reverts one pick's deltas and moves it to the redo stack."""
+        for _ in range(min(steps, len(self.pick_history))):
+            self._pop_pick()
+
+    def redo(self, steps=1):
+        """Re-apply the last `steps` undone picks (fewer if fewer remain)."""
+        for _ in range(min(steps, len(self.redo_stack))):
+            self._push_pick(int(self.redo_stack.pop()["player"][ID_COLUMN]), op="redo")
+
+    def restore(self, history_ids, redo_ids=(), state_version=0):
+        """Rebuild pick state on a fresh session from recorded ids -- the
+        picks in order, then the redo stack (next-to-redo last) -- without
+        notifying subscribers.
+
+        Raises ValueError, before touching any state, if the ids can't all
+        be restored: an id missing from the current pool, a player picked
+        twice, or more picks than the draft has. Skipping one would shift
+        every later pick into the wrong slot (and team).
         """
-        if not self.pick_history:
-            return
-        self.pick_history.pop()
+        history_ids = [int(pid) for pid in history_ids]
+        redo_ids = [int(pid) for pid in redo_ids]
+        recorded = history_ids + redo_ids
+        missing = [pid for pid in recorded if pid not in self.players]
+        if missing:
+            raise ValueError(f"Recorded picks reference player_ids missing from the pool: {missing}")
+        if len(set(recorded)) != len(recorded):
+            raise ValueError("Recorded picks draft the same player more than once")
+        total_picks = self.league_config.num_teams * self.league_config.num_rounds
+        if len(self.pick_history) + len(recorded) > total_picks:
+            raise ValueError(f"{len(recorded)} recorded picks don't fit in a {total_picks}-pick draft")
 
-        self.available_players = self.full_player_pool.copy()
-        self.rosters = {i: [] for i in range(self.league_config.num_teams)}
-        self.greedy = GreedyDraftAssistant(self.full_player_pool, self.league_config)
+        subscribers, self._subscribers = self._subscribers, []
+        try:
+            for player_id in history_ids + redo_ids[::-1]:
+                self._push_pick(player_id)
+            self.undo(len(redo_ids))
+        finally:
+            self._subscribers = subscribers
+        self.state_version = state_version
+        self._changes.clear()
+
+    def jump_to_pick(self, pick_number):
+        """Move to the point where `pick_number` is on the clock, undoing or
+        redoing as needed. Reachable picks run from 1 to the end of the redo
+        stack."""
+        target = pick_number - 1
+        if target < 0 or target > len(self.pick_history) + len(self.redo_stack):
+            raise ValueError(f"Pick {pick_number} is out of range.")
+        if target < len(self.pick_history):
+            self.undo(len(self.pick_history) - target)
+        else:
+            self.redo(target - len(self.pick_history))
+
+    def our_roster_ids(self):
+        return [int(entry["player"][ID_COLUMN]) for entry in self.pick_history if entry["is_ours"]]
+
+    def drafted_ids(self):
+        return [int(entry["player"][ID_COLUMN]) for entry in self.pick_history]
+
+    def swap_player_pool(self, full_player_pool):
+        """Remap live draft state onto a refreshed player pool, in place.
+
+        Drafted players stay drafted and keep their roster slots; their rows
+        (and every available row) take the new projections. A drafted
+        player who dropped out of the new pool keeps their old row so
+        rosters and undo still resolve. Greedy baselines are recomputed only
+        for positions whose players changed. No pick is replayed -- this is
+        a handful of vectorized passes plus rebuilding the id/search indexes.
+
+        Returns a summary: changed/added/removed player counts, the
+        positions whose baselines moved, the new pool_version and the
+        elapsed milliseconds.
+        """
+        started = time.perf_counter()
+        old_pool = self.full_player_pool
+        if not isinstance(full_player_pool, SharedPlayerPool):
+            full_player_pool = SharedPlayerPool(full_player_pool)
+        shared = full_player_pool
+        new_pool = shared.pool
+        drafted = np.array(self.drafted_ids(), dtype=np.int64)
+        # Undone picks can be redone, so their rows have to survive too.
+        referenced = np.concatenate(
+            [drafted, np.array([entry["player"][ID_COLUMN] for entry in self.redo_stack], dtype=np.int64)]
+        )
+        if len(referenced) and shared.id_space != self.shared_pool.id_space:
+            # e.g. a draft started offline on the static CSV, refreshed from
+            # Sleeper: no drafted id would match, so every drafted player
+            # would be carried over *and* be available again under their
+            # Sleeper id.
+            raise PoolMismatchError(
+                f"This draft's picks use {self.shared_pool.id_space} player ids but the refreshed pool uses "
+                f"{shared.id_space} ids; start a new draft to switch projection sources."
+            )
+
+        kept = np.setdiff1d(referenced, new_pool[ID_COLUMN].to_numpy(dtype=np.int64))
+        if len(kept):
+            # This session's pool now differs from everyone else's.
+            carried = old_pool.loc[old_pool[ID_COLUMN].isin(kept), list(new_pool.columns)]
+            shared = SharedPlayerPool(pd.concat([new_pool, carried], ignore_index=True))
+            new_pool = shared.pool
+
+        compared = ["Rank", "Total_FPTS", "Position"]
+        old = old_pool.set_index(ID_COLUMN)[compared]
+        new = new_pool.set_index(ID_COLUMN)[compared]
+        common = old.index.intersection(new.index)
+        changed = common[(old.loc[common] != new.loc[common]).any(axis=1).to_numpy()]
+        added = new.index.difference(old.index)
+        removed = old.index.difference(new.index)
+        positions = set(old.loc[changed.union(removed), "Position"]) | set(new.loc[changed.union(added), "Position"])
+        positions &= set(DIRECT_POSITIONS)
+
+        self.shared_pool = shared
+        self.full_player_pool = new_pool
+        self.players = shared.players
+        self.search = shared.search
+        self._available_mask = ~new_pool[ID_COLUMN].isin(drafted).to_numpy()
+        self._available_frame = None
+        self._remaining_by_position = new_pool.loc[self._available_mask, "Position"].value_counts().to_dict()
+        self.available_ids = {int(pid) for pid in self.players.ids} - set(drafted.tolist())
 
-        replay = self.pick_history
-        self.pick_history = []
-        for entry in replay:
-            self.apply_pick(entry["player"]["Player"])
+        # One positional take for every drafted row instead of an iloc per pick.
+        drafted_rows = new_pool.iloc[[self.players.position(int(pid)) for pid in referenced]]
+        rows = {int(row[ID_COLUMN]): row for _, row in drafted_rows.iterrows()}
+        for entry in self.pick_history + self.redo_stack:
+            entry["player"] = shared.record(int(entry["player"][ID_COLUMN]))
+        self.rosters = {
+            team_idx: [rows[int(row[ID_COLUMN])] for row in roster] for team_idx, roster in self.rosters.items()
+        }
+
+        self.greedy.update_replacement_baselines(new_pool, sorted(positions))
+        self.greedy.roster_filled = {pos: 0 for pos in DIRECT_POSITIONS}
+        for row in self.rosters[self.our_team_idx]:
+            self.greedy.record_pick(row["Position"], True)
+        self.mcts.set_player_pool(new_pool)
+        self.pool_version += 1
+        # Every row may have changed, so clients resync from a full state.
+        self._record_change({"op": "reset", "id_space": shared.id_space})
+
+        return {
+            "changed": len(changed),
+            "added": len(added),
+            "removed": len(removed),
+            "kept_drafted": len(kept),
+            "baselines_updated": sorted(positions),
+            "pool_version": self.pool_version,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def canonical_state(self):
+        """Everything a recommendation for the team on the clock depends on,
+        in a stable JSON-ready form: the league, the pool's content, whose
+        team is ours, the pick number and each team's drafted-player set.
+        Pick order within a team doesn't matter to either engine, so rosters
+        are sorted -- two drafts that reached the same board by different
+        routes share a state."""
+        return {
+            "league": dataclasses.asdict(self.league_config),
+            "pool": self.shared_pool.fingerprint,
+            "our_team_idx": self.our_team_idx,
+            "pick": self.current_pick,
+            "rosters": [sorted(int(row[ID_COLUMN]) for row in self.rosters[team]) for team in sorted(self.rosters)],
+        }
+
+    def memory_bytes(self):
+        """Approximate bytes held by this session alone (the shared pool is
+        accounted once, by the registry)."""
+        total = self._available_mask.nbytes + sys.getsizeof(self.available_ids)
+        total += (len(self.pick_history) + len(self.redo_stack)) * PICK_ENTRY_BYTES
+        if self._available_frame is not None:
+            total += int(self._available_frame.memory_usage(index=True).sum())
+        return total
+
+    def trim(self):
+        """Drop derived caches; they're rebuilt on demand."""
+        self._available_frame = None
 
     def our_roster_value(self):
-        return compute_roster_value(self.rosters[self.our_team_idx], self.league_config)
+        """compute_roster_value of our roster, recomputed only when the
+        roster or pool changes -- every state()/delta poll reports it."""
+        key = (self.pool_version, tuple(self.our_roster_ids()))
+        if self._roster_value is None or self._roster_value[0] != key:
+            self._roster_value = (key, compute_roster_value(self.rosters[self.our_team_idx], self.league_config))
+        return self._roster_value[1]
 
     def positional_scarcity(self):
-        counts = self.available_players["Position"].value_counts().to_dict()
         return {
-            pos: {"remaining": counts.get(pos, 0), "total": total}
+            pos: {"remaining": self._remaining_by_position.get(pos, 0), "total": total}
             for pos, total in self.greedy.baseline_counts.items()
         }
 
-    def state(self):
+    def summary(self):
+        """The constant-size part of state(): everything but pick history
+        and roster rows, which clients maintain from deltas."""
         return {
             "current_pick": self.current_pick,
             "current_round": self.current_round,
             "current_team": self.current_team,
             "is_our_pick": self.is_our_pick,
-            "our_team_idx": self.our_team_idx,
             "draft_complete": self.draft_complete,
-            "pick_history": self.pick_history,
-            "our_roster": [row.to_dict() for row in self.rosters[self.our_team_idx]],
+            "redo_available": len(self.redo_stack),
             "our_roster_value": self.our_roster_value(),
             "positional_scarcity": self.positional_scarcity(),
+            "pool_version": self.pool_version,
+        }
+
+    def delta_since(self, version):
+        """Changes since `version`, oldest first, plus the current summary.
+
+        {"version": current, "since": version, "changes": [...], "summary": {...}}
+        where each change is {"op": "pick" | "redo", "entry": <pick_history
+        entry>} or {"op": "undo", "pick_number": n}. If `version` is older than the
+        change log reaches, newer than the session, or a pool swap happened
+        since, the result carries "full": state() instead of changes.
+        """
+        oldest = self._changes[0][0] if self._changes else self.state_version + 1
+        changes = [change for v, change in self._changes if v > version]
+        if not (0 <= version <= self.state_version) or (version < oldest - 1) or any(
+            change["op"] == "reset" for change in changes
+        ):
+            return {"version": self.state_version, "since": version, "full": self.state()}
+        return {"version": self.state_version, "since": version, "changes": changes, "summary": self.summary()}
+
+    def state(self):
+        return {
+            **self.summary(),
+            "our_team_idx": self.our_team_idx,
+            "pick_history": self.pick_history,
+            "our_roster": [self.shared_pool.record(player_id) for player_id in self.our_roster_ids()],
             "league_config": {
                 "num_teams": self.league_config.num_teams,
                 "scoring": self.league_config.scoring,
@@ -141,7 +605,172 @@ class DraftSession:
         }
 
 
-_session = None
+class SessionRegistry:
+    """Live DraftSessions by id, least recently used first.
+
+    Sessions idle for longer than `idle_timeout` seconds are dropped, and
+    the least recently used ones are evicted whenever there are more than
+    `max_sessions` or the estimated footprint (sessions plus the shared
+    pools they reference) exceeds `max_memory_bytes`. A session over its own
+    `max_session_bytes` cap has its derived caches trimmed. Limits default
+    from the FANTASY_DRAFT_MAX_SESSIONS / _SESSION_IDLE_TIMEOUT /
+    _SESSION_MEMORY_MB / _SESSION_MAX_KB environment variables.
+    """
+
+    def __init__(self, max_sessions=None, idle_timeout=None, max_memory_bytes=None, max_session_bytes=None,
+                 clock=time.monotonic):
+        self.max_sessions = int(max_sessions or os.environ.get(MAX_SESSIONS_ENV, DEFAULT_MAX_SESSIONS))
+        self.idle_timeout = float(idle_timeout or os.environ.get(IDLE_TIMEOUT_ENV, DEFAULT_IDLE_TIMEOUT))
+        self.max_memory_bytes = int(
+            max_memory_bytes or float(os.environ.get(MEMORY_BUDGET_ENV, DEFAULT_MEMORY_BUDGET_MB)) * 1024 * 1024
+        )
+        self.max_session_bytes = int(
+            max_session_bytes or float(os.environ.get(SESSION_CAP_ENV, DEFAULT_SESSION_CAP_KB)) * 1024
+        )
+        self.clock = clock
+
+        self._sessions = OrderedDict()  # id -> [DraftSession, last_used]
+        self._pools = {}  # (season, scoring) -> SharedPlayerPool
+        self._lock = threading.Lock()
+        self.evictions = {"idle": 0, "capacity": 0, "memory": 0}
+        # Called with the id of every session that leaves the registry
+        # (evicted or removed), e.g. to delete its journal.
+        self.on_evict = None
+
+    def shared_pool(self, key, full_player_pool):
+        """The SharedPlayerPool for `key`, reused while the loader keeps
+        returning the same (or an equal) DataFrame."""
+        with self._lock:
+            shared = self._pools.get(key)
+        if shared is not None and (shared.source is full_player_pool or shared.source.equals(full_player_pool)):
+            return shared
+        shared = SharedPlayerPool(full_player_pool)
+        with self._lock:
+            self._pools[key] = shared
+        return shared
+
+    def add(self, session, session_id=None):
+        """Register `session` (under `session_id` when re-adopting a
+        recovered one) and return its id."""
+        session_id = session_id or secrets.token_urlsafe(16)
+        with self._lock:
+            self._sessions[session_id] = [session, self.clock()]
+            self._enforce_limits()
+        return session_id
+
+    def get(self, session_id):
+        """The session for `session_id`, marked as just used. Raises
+        KeyError for unknown or evicted ids."""
+        with self._lock:
+            self._drop_idle()
+            entry = self._sessions[session_id]
+            entry[1] = self.clock()
+            self._sessions.move_to_end(session_id)
+            if entry[0].memory_bytes() > self.max_session_bytes:
+                entry[0].trim()
+            return entry[0]
+
+    def remove(self, session_id):
+        with self._lock:
+            session = self._sessions.pop(session_id, [None])[0]
+        if session is not None:
+            self._notify_evicted(session_id)
+        return session
+
+    def _notify_evicted(self, session_id):
+        if self.on_evict is not None:
+            self.on_evict(session_id)
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+            self._pools.clear()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._sessions
+
+    def _drop_idle(self):
+        cutoff = self.clock() - self.idle_timeout
+        while self._sessions:
+            session_id, (_, last_used) = next(iter(self._sessions.items()))
+            if last_used > cutoff:
+                break
+            del self._sessions[session_id]
+            self.evictions["idle"] += 1
+            self._notify_evicted(session_id)
+
+    def _memory_bytes(self):
+        pools = {id(s.shared_pool): s.shared_pool.memory_bytes for s, _ in self._sessions.values()}
+        return sum(pools.values()) + sum(s.memory_bytes() for s, _ in self._sessions.values())
+
+    def _enforce_limits(self):
+        self._drop_idle()
+        while len(self._sessions) > self.max_sessions:
+            self._notify_evicted(self._sessions.popitem(last=False)[0])
+            self.evictions["capacity"] += 1
+        # Trim before evicting: derived caches are the cheap thing to lose.
+        if self._memory_bytes() > self.max_memory_bytes:
+            for session, _ in self._sessions.values():
+                session.trim()
+        while len(self._sessions) > 1 and self._memory_bytes() > self.max_memory_bytes:
+            self._notify_evicted(self._sessions.popitem(last=False)[0])
+            self.evictions["memory"] += 1
+        # Forget pools no live session references.
+        live = {id(s.shared_pool) for s, _ in self._sessions.values()}
+        self._pools = {key: pool for key, pool in self._pools.items() if id(pool) in live}
+
+    def stats(self):
+        with self._lock:
+            self._drop_idle()
+            return {
+                "sessions": len(self._sessions),
+                "shared_pools": len({id(s.shared_pool) for s, _ in self._sessions.values()}),
+                "memory_bytes": self._memory_bytes(),
+                "max_sessions": self.max_sessions,
+                "max_memory_bytes": self.max_memory_bytes,
+                "evictions": dict(self.evictions),
+            }
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SessionRegistry()
+            _registry.on_evict = get_journal_store().discard
+        return _registry
+
+
+def _build_session(config, loader):
+    kwargs = {
+        "num_teams": config["num_teams"],
+        "scoring": config["scoring"],
+        "draft_style": config["draft_style"],
+        "bench_slots": config["bench_slots"],
+    }
+    if config["roster_slots"] is not None:
+        kwargs["roster_slots"] = config["roster_slots"]
+    league_config = LeagueConfig(**kwargs)
+
+    season, scoring = config["season"], config["scoring"]
+    started = time.perf_counter()
+    pool = loader(source=config["source"], season=season, scoring=scoring)
+    POOL_LOAD_DURATION.observe(config["source"], value=time.perf_counter() - started)
+    shared = get_registry().shared_pool((season, scoring), pool)
+    return DraftSession(
+        shared,
+        league_config,
+        initial_pick=config["initial_pick"],
+        mcts_time_limit=config.get("mcts_time_limit", DEFAULT_MCTS_TIME_LIMIT),
+        season=season,
+    )
 
 
 def create_session(
@@ -152,30 +781,105 @@ def create_session(
     roster_slots=None,
     bench_slots=7,
     source="auto",
+    season=2026,
+    mcts_time_limit=DEFAULT_MCTS_TIME_LIMIT,
     _player_pool_loader=None,
 ):
-    """Builds a fresh LeagueConfig + player pool + DraftSession and installs
-    it as the process-wide active session. Single-user, single-machine, one
-    draft at a time -- no session-id/multi-tenancy needed.
+    """Builds a fresh LeagueConfig + DraftSession on the shared player pool
+    for (season, scoring), registers it (and journals it, when journaling is
+    enabled), and returns (session_id, session).
 
     _player_pool_loader is overridable purely for tests, to avoid any network
     call to the live Sleeper API. Resolved from the module global (not a
     default-argument value) so tests can monkeypatch `load_player_pool` on
     this module and have it take effect here.
     """
-    global _session
-    kwargs = {"num_teams": num_teams, "scoring": scoring, "draft_style": draft_style, "bench_slots": bench_slots}
-    if roster_slots is not None:
-        kwargs["roster_slots"] = roster_slots
-    league_config = LeagueConfig(**kwargs)
+    config = {
+        "num_teams": num_teams,
+        "scoring": scoring,
+        "draft_style": draft_style,
+        "initial_pick": initial_pick,
+        "roster_slots": roster_slots,
+        "bench_slots": bench_slots,
+        "source": source,
+        "season": season,
+        "mcts_time_limit": mcts_time_limit,
+    }
+    session = _build_session(config, _player_pool_loader or load_player_pool)
+    # Which ids the journaled picks refer to: "auto" may have landed on
+    # either the Sleeper pool or the static CSV.
+    config["id_space"] = session.shared_pool.id_space
+    session_id = get_registry().add(session)
+    get_journal_store().attach(session_id, session, config)
+    return session_id, session
+
+
+def recover_sessions(_player_pool_loader=None):
+    """Re-register every journaled session (e.g. at server startup) under
+    its original id, so open browser tabs carry on where they were.
+
+    Never touches the network: a session whose picks use Sleeper ids is
+    rebuilt from the cached Sleeper pool, one on synthetic ids from the
+    static CSV. A Sleeper session with nothing cached, or whose rebuilt pool
+    has the wrong id space, is skipped with a warning and left journaled for
+    a later start."""
+    loader = _player_pool_loader or load_player_pool
+
+    def build(config):
+        id_space = config.get("id_space")
+        if config["source"] == "static" or id_space == "synthetic":
+            return _build_session({**config, "source": "static"}, loader)
+        try:
+            session = _build_session({**config, "source": "cached"}, loader)
+        except LookupError:
+            if id_space is not None:
+                raise PoolUnavailableError(
+                    f"No cached Sleeper pool for {config['season']} {config['scoring']} to restore this draft onto"
+                ) from None
+            # Journaled before id spaces were recorded: best effort.
+            session = _build_session({**config, "source": "static"}, loader)
+        if id_space is not None and session.shared_pool.id_space != id_space:
+            raise PoolMismatchError(
+                f"Journaled picks use {id_space} player ids but the restored pool uses {session.shared_pool.id_space}"
+            )
+        return session
+
+    journal = get_journal_store()
+    registry = get_registry()
+    recovered = journal.recover(build)
+    for session_id, session, config in recovered:
+        registry.add(session, session_id=session_id)
+        journal.attach(session_id, session, config)
+    return [session_id for session_id, _, _ in recovered]
+
+
+def refresh_session_pool(session_id, source="sleeper", _player_pool_loader=None):
+    """Load a fresh pool for the session's (season, scoring) and swap it into
+    the session in place (see DraftSession.swap_player_pool) -- pick history
+    survives, unlike calling create_session again. Other sessions on the
+    same pool pick up the refreshed SharedPlayerPool as they refresh.
 
+    Raises PoolUnavailableError if the loader fails and PoolMismatchError
+    if the new pool's ids can't carry the draft's picks over."""
+    session = get_session(session_id)
+    if source not in SOURCES:
+        raise ValueError(f"Unknown source: {source!r}. Expected one of {list(SOURCES)}")
+    key = (session.season, session.league_config.scoring)
     loader = _player_pool_loader or load_player_pool
-    full_player_pool = loader(source=source, scoring=scoring)
-    _session = DraftSession(full_player_pool, league_config, initial_pick=initial_pick)
-    return _session
+    try:
+        pool = loader(source=source, season=key[0], scoring=key[1])
+    except Exception as exc:
+        # source="sleeper" raises on any upstream failure rather than
+        # falling back, so the caller can tell the user the refresh failed.
+        logger.warning("Could not load a %s pool for %s", source, key, exc_info=True)
+        raise PoolUnavailableError(f"Couldn't load fresh projections from {source}: {exc}") from exc
+    shared = get_registry().shared_pool(key, pool)
+    with session.lock:
+        return session.swap_player_pool(shared)
 
 
-def get_session():
-    if _session is None:
-        raise RuntimeError("No draft session has been created yet.")
-    return _session
+def get_session(session_id):
+    """Raises KeyError if `session_id` is unknown or has been evicted."""
+    if session_id is None:
+        raise KeyError("No draft session id given.")
+    return get_registry().get(session_id)
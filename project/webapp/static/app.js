@@ -1,9 +1,10 @@
 "use strict";
 
 const state = {
-  players: [],
   session: null,
   selectedPlayer: null,
+  searchSeq: 0,
+  feed: null,
 };
 
 async function api(method, path, body) {
@@ -77,7 +78,8 @@ async function handleSetupSubmit(evt) {
     state.session = await api("POST", "/api/session", body);
     el("setup-screen").hidden = true;
     el("draft-board").hidden = false;
-    await refreshAll();
+    await render();
+    connectFeed();
   } catch (err) {
     errorBox.textContent = err.message;
     errorBox.hidden = false;
@@ -89,13 +91,75 @@ async function handleSetupSubmit(evt) {
 
 // ---- Draft board ----
 
+// ---- State sync ----
+//
+// The server versions session state. After the first full /api/state, the
+// client only ever applies deltas -- from mutation responses (?since=), the
+// WebSocket feed, or /api/state/delta -- so late-draft updates stay small.
+
+function applyDelta(delta) {
+  const s = state.session;
+  if (delta.full) {
+    state.session = { ...delta.full, state_version: delta.version };
+    return "applied";
+  }
+  if (s && delta.version <= s.state_version) return "stale";
+  if (!s || delta.since !== s.state_version) return "gap";
+
+  for (const change of delta.changes) {
+    if (change.op === "pick" || change.op === "redo") {
+      s.pick_history.push(change.entry);
+    } else if (change.op === "undo") {
+      s.pick_history = s.pick_history.filter((e) => e.pick_number !== change.pick_number);
+    }
+  }
+  Object.assign(s, delta.summary);
+  s.our_roster = s.pick_history.filter((e) => e.is_ours).map((e) => e.player);
+  s.state_version = delta.version;
+  return "applied";
+}
+
+async function syncState() {
+  let result = "gap";
+  if (state.session) {
+    result = applyDelta(await api("GET", `/api/state/delta?since=${state.session.state_version}`));
+  }
+  if (result === "gap") {
+    state.session = await api("GET", "/api/state");
+  }
+  if (result !== "stale") await render();
+}
+
+async function mutate(method, path, body) {
+  const sep = path.includes("?") ? "&" : "?";
+  const data = await api(method, `${path}${sep}since=${state.session.state_version}`, body);
+  const result = applyDelta(data.next || data);
+  if (result === "gap") return syncState();
+  if (result === "applied") await render();
+}
+
+function connectFeed() {
+  if (state.feed) state.feed.close();
+  const proto = location.protocol === "https:" ? "wss" : "ws";
+  const feed = new WebSocket(`${proto}://${location.host}/api/ws?since=${state.session.state_version}`);
+  feed.onmessage = async (evt) => {
+    const result = applyDelta(JSON.parse(evt.data));
+    if (result === "gap") await syncState();
+    else if (result === "applied") await render();
+  };
+  // Reconnect after drops; a fresh feed resumes from our current version.
+  feed.onclose = () => {
+    if (state.feed === feed && state.session) setTimeout(connectFeed, 2000);
+  };
+  state.feed = feed;
+}
+
 async function refreshAll() {
-  const [players, sessionState] = await Promise.all([
-    api("GET", "/api/players"),
-    api("GET", "/api/state"),
-  ]);
-  state.players = players;
-  state.session = sessionState;
+  state.session = await api("GET", "/api/state");
+  await render();
+}
+
+async function render() {
   renderTurnBanner();
   renderScarcity();
   renderRoster();
@@ -150,8 +214,12 @@ function renderLog() {
     const li = document.createElement("li");
     const who = entry.is_ours ? "You" : `Team ${entry.team_idx + 1}`;
     li.textContent = `Pick ${entry.pick_number} (Rd ${entry.round_num}): ${who} took ${entry.player.Player} (${entry.player.Position})`;
+    // Clicking a pick rewinds to just before it; Redo steps forward again.
+    li.title = "Rewind to this pick";
+    li.addEventListener("click", () => mutate("POST", "/api/jump", { pick_number: entry.pick_number }));
     list.appendChild(li);
   }
+  el("redo-btn").disabled = state.session.redo_available === 0;
 }
 
 async function renderGreedy() {
@@ -185,7 +253,7 @@ async function renderGreedy() {
 
     const draftBtn = document.createElement("button");
     draftBtn.textContent = "Draft";
-    draftBtn.addEventListener("click", () => draftPlayer(candidate.Player));
+    draftBtn.addEventListener("click", () => draftPlayer(candidate));
 
     row.appendChild(bar);
     row.appendChild(label);
@@ -195,23 +263,32 @@ async function renderGreedy() {
   }
 }
 
-async function handleThinkHarder() {
+// A cached answer comes back instantly with its playout count; "Refine"
+// searches again and adds the new playouts to the cached ones.
+async function handleThinkHarder(refine = false) {
   const btn = el("think-harder-btn");
   const panel = el("mcts-panel");
   btn.disabled = true;
   btn.textContent = "Thinking... (~15s)";
   panel.innerHTML = "";
   try {
-    const result = await api("POST", "/api/recommend/mcts");
+    const result = await api("POST", `/api/recommend/mcts${refine ? "?refine=true" : ""}`);
     const card = document.createElement("div");
     card.className = "mcts-card";
     const p = result.player;
     card.innerHTML = `<strong>${p.Player}</strong> (${p.Position}, ${p.Team}) &mdash; ${p.Total_FPTS.toFixed(1)} pts`;
+    const detail = document.createElement("div");
+    detail.className = "candidate-reason";
+    detail.textContent = `${result.player_playouts.toLocaleString()} of ${result.playouts.toLocaleString()} playouts${result.cached ? " · cached" : ""}`;
+    card.appendChild(detail);
     const draftBtn = document.createElement("button");
     draftBtn.textContent = "Draft this player";
-    draftBtn.addEventListener("click", () => draftPlayer(p.Player));
-    card.appendChild(document.createElement("br"));
+    draftBtn.addEventListener("click", () => draftPlayer(p));
     card.appendChild(draftBtn);
+    const refineBtn = document.createElement("button");
+    refineBtn.textContent = "Refine";
+    refineBtn.addEventListener("click", () => handleThinkHarder(true));
+    card.appendChild(refineBtn);
     panel.appendChild(card);
   } catch (err) {
     panel.textContent = err.message;
@@ -230,35 +307,61 @@ function clearSelection() {
   el("search-results").innerHTML = "";
 }
 
-function handleSearchInput() {
-  const query = el("player-search").value.trim().toLowerCase();
+// Type-ahead is served by /api/players/search (normalized, typo-tolerant,
+// top-k only). searchSeq drops responses that arrive after a newer keystroke.
+async function handleSearchInput() {
+  const query = el("player-search").value.trim();
   const results = el("search-results");
-  results.innerHTML = "";
-  if (!query) return;
+  const seq = ++state.searchSeq;
+  if (!query) {
+    results.innerHTML = "";
+    return;
+  }
 
-  const matches = state.players
-    .filter((p) => p.Player.toLowerCase().includes(query))
-    .slice(0, 8);
+  const matches = await api("GET", `/api/players/search?q=${encodeURIComponent(query)}&limit=8`);
+  if (seq !== state.searchSeq) return;
+  results.innerHTML = "";
 
   for (const player of matches) {
     const li = document.createElement("li");
     li.textContent = `${player.Player} (${player.Position}, ${player.Team})`;
-    li.addEventListener("click", () => selectPlayer(player.Player));
+    li.addEventListener("click", () => selectPlayer(player));
     results.appendChild(li);
   }
 }
 
-function selectPlayer(name) {
-  state.selectedPlayer = name;
-  el("selected-player-name").textContent = name;
+function selectPlayer(player) {
+  state.selectedPlayer = player;
+  el("selected-player-name").textContent = player.Player;
   el("selected-player").hidden = false;
   el("search-results").innerHTML = "";
-  el("player-search").value = name;
+  el("player-search").value = player.Player;
 }
 
-async function draftPlayer(name) {
-  await api("POST", "/api/pick", { player: name });
-  await refreshAll();
+// Picks are sent by player_id, so two players sharing a display name can't
+// be confused for each other.
+async function draftPlayer(player) {
+  await mutate("POST", "/api/pick", { player_id: player.player_id });
+}
+
+// Several missed picks in one request: the server applies all of them or,
+// if any line doesn't resolve, none (and says which pick failed).
+async function handleCatchUp() {
+  const errorBox = el("catch-up-error");
+  errorBox.hidden = true;
+  const picks = el("catch-up-input").value
+    .split("\n")
+    .map((line) => line.trim())
+    .filter(Boolean)
+    .map((player) => ({ player }));
+  if (!picks.length) return;
+  try {
+    await mutate("POST", "/api/picks", { start_pick: state.session.current_pick, picks });
+    el("catch-up-input").value = "";
+  } catch (err) {
+    errorBox.textContent = err.message;
+    errorBox.hidden = false;
+  }
 }
 
 // ---- Wiring ----
@@ -268,10 +371,19 @@ el("player-search").addEventListener("input", handleSearchInput);
 el("draft-selected-btn").addEventListener("click", () => {
   if (state.selectedPlayer) draftPlayer(state.selectedPlayer);
 });
-el("think-harder-btn").addEventListener("click", handleThinkHarder);
-el("undo-btn").addEventListener("click", async () => {
-  await api("POST", "/api/undo");
-  await refreshAll();
-});
+el("think-harder-btn").addEventListener("click", () => handleThinkHarder());
+el("catch-up-btn").addEventListener("click", handleCatchUp);
+el("undo-btn").addEventListener("click", () => mutate("POST", "/api/undo"));
+el("redo-btn").addEventListener("click", () => mutate("POST", "/api/redo"));
 
 populateRosterDefaults();
+
+// The session cookie survives a page reload, so resume that draft if the
+// server still has it (it may have been evicted after sitting idle).
+refreshAll()
+  .then(() => {
+    el("setup-screen").hidden = true;
+    el("draft-board").hidden = false;
+    connectFeed();
+  })
+  .catch(() => {});